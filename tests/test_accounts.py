@@ -0,0 +1,380 @@
+"""Tests for the account registry (accounts.json)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import tlgr.core.accounts as accounts_mod
+from tlgr.core import jsonio
+from tlgr.core.accounts import (
+    AccountInfo,
+    AccountManager,
+    SQLiteAccountStore,
+    open_account_manager,
+)
+from tlgr.core.errors import TlgrError
+
+
+@pytest.fixture
+def mgr(tmp_path):
+    return AccountManager(tmp_path)
+
+
+class TestRegistryRoundTrip:
+    def test_empty_registry(self, mgr):
+        assert mgr.get_active() is None
+        assert mgr.list_accounts() == []
+        assert not mgr.has_accounts()
+
+    def test_add_persists(self, mgr, tmp_path):
+        mgr.add_account("main")
+        data = json.loads((tmp_path / "accounts.json").read_text())
+        assert data["active"] == "main"
+        assert "main" in data["accounts"]
+
+    def test_reload_from_disk(self, mgr, tmp_path):
+        mgr.add_account("main")
+        mgr.update_account("main", username="alice", user_id=42)
+        fresh = AccountManager(tmp_path)
+        acct = fresh.get_account("main")
+        assert acct is not None
+        assert acct.username == "alice"
+        assert acct.user_id == 42
+
+    def test_corrupt_file_yields_empty(self, tmp_path):
+        (tmp_path / "accounts.json").write_text("{not json")
+        assert AccountManager(tmp_path).list_accounts() == []
+
+    def test_stdlib_fallback(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(jsonio, "orjson", None)
+        mgr = AccountManager(tmp_path)
+        mgr.add_account("main")
+        assert AccountManager(tmp_path).get_active() == "main"
+
+    @pytest.mark.parametrize("alias", ["bad alias!", "", "--", "a/b", "caf\u00e9"])
+    def test_invalid_alias(self, mgr, alias):
+        with pytest.raises(TlgrError):
+            mgr.add_account(alias)
+
+    @pytest.mark.parametrize("alias", ["main", "work-2", "_bot_", "123456"])
+    def test_valid_alias(self, mgr, alias):
+        assert mgr.add_account(alias).alias == alias
+
+    def test_rename_validates_alias(self, mgr):
+        mgr.add_account("main")
+        with pytest.raises(TlgrError):
+            mgr.rename_account("main", "bad alias")
+
+    def test_duplicate_alias(self, mgr):
+        mgr.add_account("main")
+        with pytest.raises(TlgrError):
+            mgr.add_account("main")
+
+
+class TestLoadCache:
+    def test_unchanged_file_not_reparsed(self, mgr, monkeypatch):
+        mgr.add_account("main")
+        calls = []
+        real = jsonio.loads
+        monkeypatch.setattr(jsonio, "loads", lambda b: calls.append(b) or real(b))
+        mgr.list_accounts()
+        mgr.get_account("main")
+        assert calls == []
+
+    def test_external_change_is_picked_up(self, mgr, tmp_path):
+        mgr.add_account("main")
+        other = AccountManager(tmp_path)
+        other.add_account("work")
+        assert {a.alias for a in mgr.list_accounts()} == {"main", "work"}
+
+    def test_get_account_is_memoized(self, mgr):
+        mgr.add_account("main")
+        assert mgr.get_account("main") is mgr.get_account("main")
+
+    def test_update_refreshes_cached_account(self, mgr):
+        mgr.add_account("main")
+        before = mgr.get_account("main")
+        after = mgr.update_account("main", username="alice")
+        assert before is not after
+        assert mgr.get_account("main").username == "alice"
+
+
+class TestAtomicSave:
+    def test_file_mode_and_no_tmp_left(self, mgr, tmp_path):
+        mgr.add_account("main")
+        path = tmp_path / "accounts.json"
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert not (tmp_path / "accounts.json.tmp").exists()
+
+    def test_failed_write_keeps_previous_registry(self, mgr, tmp_path, monkeypatch):
+        mgr.add_account("main")
+
+        def boom(fd):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(accounts_mod.os, "fsync", boom)
+        with pytest.raises(OSError):
+            mgr.add_account("work")
+        monkeypatch.undo()
+        assert [a.alias for a in AccountManager(tmp_path).list_accounts()] == ["main"]
+        assert not (tmp_path / "accounts.json.tmp").exists()
+
+
+class TestBatch:
+    def test_single_write_for_batch(self, mgr, monkeypatch):
+        writes = []
+        real = accounts_mod.atomic_write
+        monkeypatch.setattr(
+            accounts_mod, "atomic_write", lambda p, b: writes.append(p) or real(p, b),
+        )
+        with mgr.batch():
+            mgr.add_account("main")
+            mgr.update_account("main", username="alice")
+            mgr.update_account("main", user_id=7)
+        assert len(writes) == 1
+
+    def test_nested_batch_flushes_once_at_outermost_exit(self, mgr, tmp_path):
+        with mgr.batch():
+            with mgr.batch():
+                mgr.add_account("main")
+            assert not (tmp_path / "accounts.json").exists()
+        assert AccountManager(tmp_path).get_active() == "main"
+
+
+class TestAccountInfo:
+    def test_dict_round_trip(self):
+        info = AccountInfo(alias="main", phone="+15550001", user_id=1)
+        assert AccountInfo.from_dict(info.to_dict()) == info
+
+    def test_from_dict_ignores_unknown_keys(self):
+        info = AccountInfo.from_dict({"alias": "main", "legacy": True})
+        assert info.alias == "main"
+        assert info.phone is None
+
+    def test_frozen_and_hashable(self):
+        info = AccountInfo(alias="main")
+        with pytest.raises(AttributeError):
+            info.alias = "other"  # type: ignore[misc]
+        assert {info: 1}[AccountInfo(alias="main")] == 1
+
+    def test_copy_with(self):
+        info = AccountInfo(alias="main", phone="+1")
+        copy = info.copy_with(username="alice")
+        assert copy.username == "alice"
+        assert copy.phone == "+1"
+        assert info.username is None
+
+    @pytest.mark.parametrize(
+        "phone, masked",
+        [("+15550001", "+155...01"), ("+12345", "***"), ("", "***"), (None, "***")],
+    )
+    def test_masked_phone(self, phone, masked):
+        assert AccountInfo(alias="main", phone=phone).masked_phone() == masked
+
+    def test_display_name_masks_phone(self):
+        assert AccountInfo(alias="main", phone="+15550001").display_name() == "+155...01"
+
+
+class TestRename:
+    def test_moves_account_dir(self, mgr):
+        mgr.add_account("main")
+        (mgr.accounts_dir / "main" / "session").write_text("x")
+        assert mgr.rename_account("main", "work")
+        assert (mgr.accounts_dir / "work" / "session").read_text() == "x"
+        assert not (mgr.accounts_dir / "main").exists()
+        assert mgr.get_active() == "work"
+
+    def test_missing_dir_is_ok(self, mgr):
+        mgr.add_account("main")
+        (mgr.accounts_dir / "main").rmdir()
+        assert mgr.rename_account("main", "work")
+
+
+class TestLazyDirs:
+    def test_reads_do_not_create_dirs(self, tmp_path):
+        base = tmp_path / "cfg"
+        mgr = AccountManager(base)
+        assert mgr.get_active() is None
+        assert mgr.list_accounts() == []
+        assert not base.exists()
+
+    def test_first_write_creates_dirs(self, tmp_path):
+        base = tmp_path / "cfg"
+        AccountManager(base).add_account("main")
+        assert (base / "accounts" / "main").is_dir()
+        assert (base / "accounts.json").is_file()
+
+
+class TestNoOpWrites:
+    @pytest.fixture
+    def writes(self, monkeypatch):
+        calls: list = []
+        real = accounts_mod.atomic_write
+        monkeypatch.setattr(
+            accounts_mod, "atomic_write", lambda p, b: calls.append(p) or real(p, b),
+        )
+        return calls
+
+    def test_set_active_same_alias(self, mgr, writes):
+        mgr.add_account("main")
+        writes.clear()
+        assert mgr.set_active("main")
+        assert writes == []
+
+    def test_update_with_same_values(self, mgr, writes):
+        mgr.add_account("main")
+        mgr.update_account("main", username="alice", user_id=1)
+        writes.clear()
+        mgr.update_account("main", username="alice", user_id=1)
+        mgr.update_account("main")
+        assert writes == []
+        mgr.update_account("main", username="bob")
+        assert len(writes) == 1
+
+
+class TestSerialization:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_compact_by_default(self, tmp_path, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(jsonio, "orjson", None)
+        AccountManager(tmp_path).add_account("main")
+        raw = (tmp_path / "accounts.json").read_text()
+        assert "\n" not in raw
+        assert ": " not in raw
+
+    def test_pretty_output(self):
+        blob = jsonio.dumps({"active": "main"}, pretty=True)
+        assert blob.decode() == '{\n  "active": "main"\n}'
+
+    @pytest.mark.parametrize("raw", ["[]", "{}", '{"active": "x"}', '{"accounts": null}'])
+    def test_malformed_registry_is_normalized(self, tmp_path, raw):
+        (tmp_path / "accounts.json").write_text(raw)
+        mgr = AccountManager(tmp_path)
+        assert mgr.list_accounts() == []
+        assert mgr.get_active() is None
+        mgr.add_account("main")
+        assert mgr.get_active() == "main"
+
+
+class TestCredentials:
+    def test_round_trip(self, mgr, monkeypatch):
+        monkeypatch.delenv("TELEGRAM_API_ID", raising=False)
+        monkeypatch.delenv("TELEGRAM_API_HASH", raising=False)
+        mgr.add_account("main")
+        mgr.save_credentials(123, "abc", "main")
+        assert mgr.load_credentials("main") == (123, "abc")
+        assert mgr.get_credentials_path("main").stat().st_mode & 0o777 == 0o600
+
+    def test_corrupt_file(self, mgr, monkeypatch):
+        monkeypatch.delenv("TELEGRAM_API_ID", raising=False)
+        monkeypatch.delenv("TELEGRAM_API_HASH", raising=False)
+        mgr.add_account("main")
+        mgr.get_credentials_path("main").write_text("[1, 2]")
+        assert mgr.load_credentials("main") == (None, None)
+
+    def test_load_creates_nothing(self, mgr, monkeypatch):
+        monkeypatch.setenv("TELEGRAM_API_ID", "7")
+        monkeypatch.setenv("TELEGRAM_API_HASH", "h")
+        assert mgr.load_credentials("ghost") == (7, "h")
+        assert not (mgr.accounts_dir / "ghost").exists()
+
+
+class TestRemove:
+    def test_active_falls_back_to_next(self, mgr):
+        mgr.add_account("main")
+        mgr.add_account("work")
+        assert mgr.remove_account("main")
+        assert mgr.get_active() == "work"
+        assert not (mgr.accounts_dir / "main").exists()
+
+    def test_unknown_alias(self, mgr):
+        assert not mgr.remove_account("ghost")
+
+
+class TestSQLiteStore:
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = SQLiteAccountStore(tmp_path)
+        yield store
+        store.close()
+
+    def test_basic_lifecycle(self, store):
+        assert store.get_active() is None
+        store.add_account("main")
+        store.add_account("work")
+        assert store.get_active() == "main"
+        assert [a.alias for a in store.list_accounts()] == ["main", "work"]
+        assert store.set_active("work")
+        assert store.get_active() == "work"
+        assert not store.set_active("ghost")
+
+    def test_duplicate_alias(self, store):
+        store.add_account("main")
+        with pytest.raises(TlgrError):
+            store.add_account("main")
+
+    def test_update_account(self, store):
+        store.add_account("main")
+        info = store.update_account("main", username="alice", user_id=7)
+        assert info.username == "alice"
+        assert info.user_id == 7
+        assert store.update_account("ghost", username="x") is None
+
+    def test_remove_active_falls_back(self, store):
+        store.add_account("main")
+        store.add_account("work")
+        assert store.remove_account("main")
+        assert store.get_active() == "work"
+        assert not store.remove_account("main")
+
+    def test_rename(self, store):
+        store.add_account("main")
+        store.add_account("work")
+        with pytest.raises(TlgrError):
+            store.rename_account("main", "work")
+        assert store.rename_account("main", "home")
+        assert store.get_active() == "home"
+        assert (store.accounts_dir / "home").is_dir()
+        assert not store.rename_account("ghost", "other")
+
+    def test_batch_rolls_back_on_error(self, store):
+        with pytest.raises(RuntimeError):
+            with store.batch():
+                store.add_account("main")
+                raise RuntimeError
+        assert not store.has_accounts()
+
+    def test_imports_json_registry(self, tmp_path):
+        legacy = AccountManager(tmp_path)
+        legacy.add_account("main")
+        legacy.add_account("work")
+        legacy.update_account("work", username="bob")
+        legacy.set_active("work")
+        store = SQLiteAccountStore(tmp_path)
+        assert [a.alias for a in store.list_accounts()] == ["main", "work"]
+        assert store.get_account("work").username == "bob"
+        assert store.get_active() == "work"
+        store.close()
+
+    def test_backend_selected_from_config(self, tmp_path):
+        assert type(open_account_manager(tmp_path)) is AccountManager
+        (tmp_path / "config.toml").write_text('[accounts]\nbackend = "sqlite"\n')
+        mgr = open_account_manager(tmp_path)
+        assert isinstance(mgr, SQLiteAccountStore)
+        mgr.close()
+
+
+class TestCreatedAt:
+    def test_utc_seconds(self, mgr):
+        created = mgr.add_account("main").created_at
+        assert created.endswith("+00:00")
+        assert "." not in created
+
+    def test_shared_within_batch(self, mgr):
+        with mgr.batch():
+            a = mgr.add_account("one")
+            b = mgr.add_account("two")
+        assert a.created_at == b.created_at
+        assert mgr._batch_now is None
@@ -46,6 +46,7 @@ def _make_event(text="hello"):
 def _make_client():
     client = MagicMock()
     client.resolve_chat = AsyncMock(return_value=999)
+    client.throttle = AsyncMock()
     client.client = MagicMock()
     client.client.forward_messages = AsyncMock()
     client.client.send_message = AsyncMock()
@@ -109,3 +110,63 @@ class TestForwardAction:
         client = _make_client()
         await action(ev, "@dest", client, None)
         client.client.forward_messages.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_forward_resolves_destinations_concurrently(self):
+        import asyncio
+
+        action = get_action("forward")
+        ev = _make_event()
+        client = _make_client()
+        in_flight = peak = 0
+
+        async def resolve(ref):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if ref == "@gone":
+                raise ValueError("no such chat")
+            return {"@a": 1, "@b": 2}[ref]
+
+        client.resolve_chat = AsyncMock(side_effect=resolve)
+        await action(ev, {"to": ["@a", "@gone", "@b"]}, client, None)
+        assert peak == 3
+        sent_to = [c.args[0] for c in client.client.forward_messages.await_args_list]
+        assert sent_to == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_forward_skips_duplicate_destinations(self):
+        action = get_action("forward")
+        ev = _make_event()
+        client = _make_client()
+        client.resolve_chat = AsyncMock(side_effect=lambda ref: {"@x": -100123, "-100123": -100123, "@y": 5}[ref])
+        await action(ev, {"to": ["@x", "-100123", "@y", "@x"]}, client, None)
+        sent_to = [c.args[0] for c in client.client.forward_messages.await_args_list]
+        assert sent_to == [-100123, 5]
+
+    @pytest.mark.asyncio
+    async def test_forward_processes_text_once_for_all_destinations(self):
+        action = get_action("forward")
+        ev = _make_event(text="hello")
+        client = _make_client()
+        client.resolve_chat = AsyncMock(side_effect=lambda ref: {"@a": 1, "@b": 2}[ref])
+        chain = ProcessorChain().add("add_prefix", {"prefix": "[FWD]"})
+        chain.apply = MagicMock(wraps=chain.apply)
+        await action(ev, {"to": ["@a", "@b"]}, client, chain)
+        chain.apply.assert_called_once_with("hello")
+        assert [c.args for c in client.client.send_message.await_args_list] == [
+            (1, chain.apply("hello")), (2, chain.apply("hello")),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalid_peer_forgets_destination(self):
+        from telethon.errors import PeerIdInvalidError
+
+        action = get_action("forward")
+        client = _make_client()
+        client.forget_chat = MagicMock()
+        client.client.forward_messages = AsyncMock(side_effect=PeerIdInvalidError(request=None))
+        await action(_make_event(), {"to": ["@moved"]}, client, None)
+        client.forget_chat.assert_called_once_with("@moved")
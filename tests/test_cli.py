@@ -0,0 +1,393 @@
+"""Tests for the root command group."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+import tlgr.cli as cli_mod
+from tlgr.cli import _SUBCOMMANDS, cli
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def help_cache(tmp_path, monkeypatch):
+    path = tmp_path / ".tlgr" / "cache" / "cli-help.json"
+    monkeypatch.setattr(cli_mod, "_HELP_CACHE", str(path))
+    return path
+
+
+def _loaded_cli_modules(*args: str, home: str | None = None) -> set[str]:
+    """Run the CLI in a fresh interpreter and return the tlgr.cli.* modules it imported."""
+    code = (
+        "import sys\n"
+        "from tlgr.cli import cli\n"
+        f"cli.main({list(args)!r}, standalone_mode=False)\n"
+        "print(' '.join(m for m in sys.modules if m.startswith('tlgr.cli.')))\n"
+    )
+    env = {**os.environ, "HOME": home} if home else None
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env,
+    ).stdout
+    return set(out.splitlines()[-1].split())
+
+
+class TestLazySubcommands:
+    def test_help_lists_every_subcommand(self, runner):
+        result = runner.invoke(cli, ["--help"])
+        assert result.exit_code == 0
+        for name in _SUBCOMMANDS:
+            assert name in result.output
+
+    def test_alias_resolves_to_same_group(self):
+        ctx = cli.make_context("tlgr", ["schema"])
+        assert cli.get_command(ctx, "msg") is cli.get_command(ctx, "message")
+
+    def test_unknown_command(self, runner):
+        result = runner.invoke(cli, ["nope"])
+        assert result.exit_code == 2
+
+    def test_only_invoked_group_is_imported(self):
+        assert _loaded_cli_modules("agent", "exit-codes") == {"tlgr.cli.agent"}
+
+    def test_shortcut_loads_only_its_target(self):
+        assert _loaded_cli_modules("exit-codes") == {"tlgr.cli.shortcuts", "tlgr.cli.options", "tlgr.cli.agent"}
+
+    def test_help_lists_shortcuts(self, runner):
+        result = runner.invoke(cli, ["--help"])
+        for name in ("send", "login", "chats", "dl", "up"):
+            assert f"  {name} " in result.output
+        assert "exit-codes" not in result.output
+
+    def test_read_only_command_skips_heavy_deps(self, tmp_path):
+        code = (
+            "import sys\n"
+            "from tlgr.cli import cli\n"
+            "cli.main(['config', 'list'], standalone_mode=False)\n"
+            "print(' '.join(m for m in ('telethon', 'aiohttp', 'tomli_w') if m in sys.modules))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            env={**os.environ, "HOME": str(tmp_path)},
+        ).stdout
+        assert out.splitlines()[-1] == ""
+
+    def test_path_only_command_skips_config_and_accounts(self, tmp_path):
+        code = (
+            "import sys\n"
+            "from tlgr.cli import cli\n"
+            "try:\n"
+            "    cli.main(['daemon', 'logs'], standalone_mode=False)\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(' '.join(m for m in ('tomllib', 'tomli', 'tlgr.core.config', 'tlgr.core.accounts') if m in sys.modules))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            env={**os.environ, "HOME": str(tmp_path)},
+        ).stdout
+        assert out.splitlines()[-1] == ""
+
+    def test_root_group_imports_no_command_modules(self):
+        code = (
+            "import sys, tlgr.cli\n"
+            "print(' '.join(m for m in sys.modules if m.startswith('tlgr')))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        ).stdout
+        assert set(out.split()) == {"tlgr", "tlgr.cli"}
+
+
+class TestHelpCache:
+    def test_help_writes_cache(self, runner, help_cache):
+        first = runner.invoke(cli, ["--help"]).output
+        assert help_cache.exists()
+        assert runner.invoke(cli, ["--help"]).output == first
+
+    def test_cached_help_skips_command_imports(self, tmp_path):
+        assert _loaded_cli_modules("--help", home=str(tmp_path))
+        assert _loaded_cli_modules("--help", home=str(tmp_path)) == set()
+
+    def test_key_tracks_module_files(self):
+        key = cli_mod._help_cache_key(_SUBCOMMANDS)
+        assert key is not None and key.startswith(f"{cli_mod.__version__}:")
+        assert cli_mod._help_cache_key({**_SUBCOMMANDS, "gone": "tlgr.cli.gone:group"}) is None
+
+    def test_stale_key_rebuilds(self, runner, help_cache):
+        runner.invoke(cli, ["--help"])
+        help_cache.write_text('{"key": "old", "commands": {}}')
+        result = runner.invoke(cli, ["--help"])
+        assert "Manage Telegram accounts." in result.output
+        assert '"old"' not in help_cache.read_text()
+
+
+class TestVersionFastPath:
+    def test_version_skips_click(self):
+        code = (
+            "import sys\n"
+            "sys.argv = ['tlgr', '--version']\n"
+            "from tlgr.__main__ import main\n"
+            "main()\n"
+            "print('click' in sys.modules)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        ).stdout.splitlines()
+        assert out == [f"tlgr, version {cli_mod.__version__}", "False"]
+
+    def test_version_matches_click_output(self, runner):
+        result = runner.invoke(cli, ["--version"])
+        assert result.output == f"tlgr, version {cli_mod.__version__}\n"
+
+
+class TestAccountAdd:
+    @pytest.fixture
+    def home(self, tmp_path, monkeypatch):
+        from tlgr.cli import account
+
+        monkeypatch.setattr(account, "CONFIG_DIR", tmp_path / ".tlgr")
+        monkeypatch.delenv("TELEGRAM_API_ID", raising=False)
+        monkeypatch.delenv("TELEGRAM_API_HASH", raising=False)
+        return tmp_path
+
+    def test_no_input_without_env_credentials_fails(self, runner, home):
+        result = runner.invoke(cli, ["--no-input", "account", "add", "+15551234567"])
+        assert result.exit_code == 1
+        assert "TELEGRAM_API_ID" in result.output
+        assert list(home.rglob("*")) == []
+
+    def test_bad_alias_touches_nothing(self, runner, home):
+        result = runner.invoke(
+            cli, ["--no-input", "account", "add", "+15551234567", "--alias", "../../escaped"],
+        )
+        assert result.exit_code == 1
+        assert "Invalid alias" in result.output
+        assert list(home.rglob("*")) == []
+
+    def test_env_credentials_skip_prompts(self, runner, home, monkeypatch):
+        from types import SimpleNamespace
+
+        import tlgr.core.client as client_mod
+
+        seen = {}
+
+        class FakeClient:
+            def __init__(self, session_path, api_id, api_hash):
+                seen["creds"] = (api_id, api_hash)
+
+            async def connect(self):
+                return False
+
+            async def login(self, phone, code_callback=None):
+                return SimpleNamespace(id=7, phone=phone, username="me", first_name="Me")
+
+            async def disconnect(self):
+                pass
+
+        monkeypatch.setattr(client_mod, "ClientWrapper", FakeClient)
+        monkeypatch.setenv("TELEGRAM_API_ID", "12345")
+        monkeypatch.setenv("TELEGRAM_API_HASH", "abc")
+        result = runner.invoke(cli, ["--no-input", "--json", "account", "add", "+15551234567", "--alias", "me"])
+        assert result.exit_code == 0, result.output
+        assert seen["creds"] == (12345, "abc")
+        assert json.loads(result.output)["user_id"] == 7
+
+    def test_piped_answers_run_out(self, runner, home):
+        result = runner.invoke(cli, ["account", "add", "+15551234567"], input="12345\n")
+        assert result.exit_code == 1
+        assert "No answer on stdin for: Telegram API Hash:" in result.output
+
+
+class TestDaemonLogs:
+    @pytest.fixture
+    def log_file(self, tmp_path, monkeypatch):
+        from tlgr.cli import daemon_cmd
+
+        monkeypatch.setattr(daemon_cmd, "get_logs_dir", lambda: tmp_path)
+        path = tmp_path / "daemon.log"
+        path.write_bytes(b"".join(b"line %d\n" % i for i in range(5000)))
+        return path
+
+    def test_prints_last_lines(self, runner, log_file):
+        result = runner.invoke(cli, ["daemon", "logs", "-n", "3"])
+        assert result.exit_code == 0
+        assert result.output == "line 4997\nline 4998\nline 4999\n"
+
+    def test_missing_log(self, runner, tmp_path, monkeypatch):
+        from tlgr.cli import daemon_cmd
+
+        monkeypatch.setattr(daemon_cmd, "get_logs_dir", lambda: tmp_path)
+        result = runner.invoke(cli, ["daemon", "logs"])
+        assert result.exit_code == 1
+        assert "No log file found" in result.output
+
+    def test_follow_reopens_rotated_log(self, log_file, monkeypatch):
+        from tlgr.cli import daemon_cmd
+
+        monkeypatch.setattr(daemon_cmd.time, "sleep", lambda _: None)
+        gen = daemon_cmd._follow(log_file, log_file.stat().st_size)
+        log_file.rename(log_file.with_suffix(".old"))
+        log_file.write_bytes(b"fresh\n")
+        assert next(gen) == b"fresh\n"
+        gen.close()
+
+    def test_last_lines_reads_backwards(self, log_file):
+        from tlgr.cli.daemon_cmd import _last_lines
+
+        lines, end = _last_lines(log_file, 2, block=16)
+        assert lines == [b"line 4998\n", b"line 4999\n"]
+        assert end == log_file.stat().st_size
+
+    def test_last_lines_stops_reading_early(self, log_file, monkeypatch):
+        import builtins
+        from tlgr.cli.daemon_cmd import _last_lines
+
+        reads = []
+        real_open = builtins.open
+
+        def counting_open(*args, **kwargs):
+            f = real_open(*args, **kwargs)
+            real_read = f.read
+            f.read = lambda n=-1: reads.append(n) or real_read(n)
+            return f
+
+        monkeypatch.setattr(builtins, "open", counting_open)
+        lines, _ = _last_lines(log_file, 3, block=64)
+        assert lines == [b"line 4997\n", b"line 4998\n", b"line 4999\n"]
+        assert sum(reads) == 64
+
+    def test_last_lines_of_short_file(self, tmp_path):
+        from tlgr.cli.daemon_cmd import _last_lines
+
+        path = tmp_path / "short.log"
+        path.write_bytes(b"a\nb\n")
+        assert _last_lines(path, 10, block=1)[0] == [b"a\n", b"b\n"]
+
+    def test_follow_stays_in_process(self, runner, log_file, monkeypatch):
+        from tlgr.cli import daemon_cmd
+
+        def follow(path, offset):
+            yield b"new\n"
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(daemon_cmd.os, "execlp", lambda *a: pytest.fail("exec'd tail"))
+        monkeypatch.setattr(daemon_cmd, "_follow", follow)
+        result = runner.invoke(cli, ["daemon", "logs", "-f", "-n", "1"])
+        assert result.exit_code == 0
+        assert result.output == "line 4999\nnew\n"
+
+    def test_follow_yields_appended_data(self, log_file):
+        from tlgr.cli.daemon_cmd import _follow
+
+        end = log_file.stat().st_size
+        with open(log_file, "ab") as f:
+            f.write(b"new\n")
+        assert next(_follow(log_file, end, interval=0)) == b"new\n"
+
+
+class TestWatch:
+    def test_emits_new_messages_oldest_first(self, runner, monkeypatch):
+        from tlgr.cli import watch as watch_mod
+
+        def fake_request(method, path):
+            return {"messages": [{"id": 3}, {"id": 2}, {"id": 1}]}
+
+        def stop(_):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(watch_mod, "ipc_request", fake_request)
+        monkeypatch.setattr(watch_mod.time, "sleep", stop)
+        result = runner.invoke(cli, ["watch", "--chat", "42"])
+        assert result.exit_code == 0
+        events = [json.loads(line) for line in result.output.splitlines()]
+        assert [e["data"]["id"] for e in events] == [1, 2, 3]
+        assert {e["chat_id"] for e in events} == {"42"}
+
+    def test_one_write_per_poll(self, runner, monkeypatch):
+        from tlgr.cli import watch as watch_mod
+
+        writes = []
+
+        def fake_request(method, path):
+            # Runs under CliRunner's stdout, so the write can be counted there.
+            monkeypatch.setattr(watch_mod.sys.stdout, "write", writes.append, raising=False)
+            return {"messages": [{"id": 2}, {"id": 1}]}
+
+        def stop(_):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(watch_mod, "ipc_request", fake_request)
+        monkeypatch.setattr(watch_mod.time, "sleep", stop)
+        runner.invoke(cli, ["watch", "--chat", "1", "--chat", "2"])
+        assert len(writes) == 1 and writes[0].count("\n") == 4
+
+
+class TestBatch:
+    def test_runs_each_line_with_root_options(self, runner):
+        script = "# codes\n\nagent exit-codes\nexit-codes\n"
+        result = runner.invoke(cli, ["--json", "batch"], input=script)
+        assert result.exit_code == 0
+        decoder, out, docs = json.JSONDecoder(), result.output.strip(), []
+        while out:
+            doc, end = decoder.raw_decode(out)
+            docs.append(doc)
+            out = out[end:].strip()
+        assert len(docs) == 2 and all("exit_codes" in d for d in docs)
+
+    def test_stops_at_first_failure(self, runner):
+        result = runner.invoke(cli, ["batch"], input="nope\nagent exit-codes\n")
+        assert result.exit_code == 2
+        assert "CODE" not in result.output
+
+    def test_keep_going_reports_last_failure(self, runner):
+        result = runner.invoke(cli, ["batch", "-k"], input="nope\nagent exit-codes\n")
+        assert result.exit_code == 2
+        assert "CODE" in result.output
+
+    def test_line_cannot_widen_sandbox(self, runner):
+        script = "--enable-commands '*' agent exit-codes\n"
+        result = runner.invoke(cli, ["--enable-commands", "batch", "batch"], input=script)
+        assert result.exit_code == 2
+        assert "not enabled" in result.output
+
+
+class TestLimitValidation:
+    @pytest.mark.parametrize("args", [
+        ["message", "list", "42", "-n", "0"],
+        ["message", "search", "42", "q", "-n", "-5"],
+        ["chat", "list", "-n", "0"],
+        ["chats", "-n", "0"],
+    ])
+    def test_non_positive_limit_rejected_at_parse(self, runner, args):
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 2
+        assert "--limit" in result.output
+
+    def test_chat_list_default_limit(self, runner, monkeypatch):
+        from tlgr.cli import chat as chat_mod
+
+        paths = []
+        monkeypatch.setattr(chat_mod, "ipc_request", lambda method, path: paths.append(path) or {})
+        assert runner.invoke(cli, ["chats"]).exit_code == 0
+        assert "limit=100" in paths[0]
+
+
+class TestShortcutParams:
+    def test_send_passes_every_option_through(self, runner):
+        result = runner.invoke(
+            cli, ["--json", "--dry-run", "send", "@x", "hi", "--reply-to", "5", "--silent"],
+        )
+        assert result.exit_code == 0
+        body = json.loads(result.output)
+        assert body["op"] == "message.send"
+        assert (body["chat"], body["text"], body["reply_to"], body["silent"]) == ("@x", "hi", 5, True)
@@ -0,0 +1,314 @@
+"""Tests for ClientWrapper helpers that don't need a live connection."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from telethon.errors import FloodWaitError, MessageDeleteForbiddenError
+from telethon.tl.types.messages import AffectedMessages
+
+from tlgr.core.client import ClientWrapper
+from tlgr.core.errors import RateLimitError
+
+
+def _wrapper(delete_side_effect) -> ClientWrapper:
+    wrapper = ClientWrapper(Path("unused.session"), 1, "hash")
+    wrapper._client = MagicMock()
+    wrapper._client.delete_messages = AsyncMock(side_effect=delete_side_effect)
+    wrapper._client.get_input_entity = AsyncMock(side_effect=lambda chat: ("peer", chat))
+    return wrapper
+
+
+def _affected(count: int) -> AffectedMessages:
+    return AffectedMessages(pts=1, pts_count=count)
+
+
+class TestDeleteMessages:
+    @pytest.mark.asyncio
+    async def test_sums_affected_counts(self):
+        wrapper = _wrapper([[_affected(100), _affected(20)]])
+        assert await wrapper.delete_messages(1, list(range(130))) == 120
+        wrapper._client.delete_messages.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_forbidden_batch_falls_back_per_id(self):
+        forbidden = MessageDeleteForbiddenError(request=None)
+
+        def delete(chat, ids, revoke):
+            if len(ids) > 1 or ids == [2]:
+                raise forbidden
+            return [_affected(1)]
+
+        wrapper = _wrapper(delete)
+        assert await wrapper.delete_messages(1, [1, 2, 3]) == 2
+
+    @pytest.mark.asyncio
+    async def test_fallback_resolves_chat_once(self):
+        def delete(chat, ids, revoke):
+            if len(ids) > 1:
+                raise MessageDeleteForbiddenError(request=None)
+            assert chat == ("peer", "@chat")
+            return [_affected(1)]
+
+        wrapper = _wrapper(delete)
+        assert await wrapper.delete_messages("@chat", [1, 2, 3]) == 3
+        wrapper._client.get_input_entity.assert_awaited_once_with("@chat")
+
+    @pytest.mark.asyncio
+    async def test_all_forbidden_raises(self):
+        wrapper = _wrapper(MessageDeleteForbiddenError(request=None))
+        with pytest.raises(MessageDeleteForbiddenError):
+            await wrapper.delete_messages(1, [1, 2])
+
+    @pytest.mark.asyncio
+    async def test_fallback_bounds_concurrency(self):
+        import asyncio
+
+        in_flight = peak = 0
+
+        async def delete(chat, ids, revoke):
+            nonlocal in_flight, peak
+            if len(ids) > 1:
+                raise MessageDeleteForbiddenError(request=None)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [_affected(1)]
+
+        wrapper = _wrapper(delete)
+        assert await wrapper.delete_messages(1, list(range(10)), workers=3) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_flood_wait_stops_fallback(self):
+        sent = []
+
+        def delete(chat, ids, revoke):
+            if len(ids) > 1:
+                raise MessageDeleteForbiddenError(request=None)
+            sent.append(ids[0])
+            raise FloodWaitError(request=None, capture=300)
+
+        wrapper = _wrapper(delete)
+        with pytest.raises(FloodWaitError):
+            await wrapper.delete_messages(1, list(range(10)), workers=1)
+        assert sent == [0]
+        with pytest.raises(RateLimitError):
+            await wrapper.delete_messages(1, [42])
+
+    @pytest.mark.asyncio
+    async def test_flood_wait_cancels_in_flight_deletes(self):
+        import asyncio
+
+        done = []
+
+        async def delete(chat, ids, revoke):
+            if len(ids) > 1:
+                raise MessageDeleteForbiddenError(request=None)
+            if ids == [0]:
+                await asyncio.sleep(0)
+                raise FloodWaitError(request=None, capture=300)
+            await asyncio.sleep(0.05)
+            done.append(ids[0])
+            return [_affected(1)]
+
+        wrapper = _wrapper(delete)
+        with pytest.raises(FloodWaitError):
+            await wrapper.delete_messages(1, list(range(4)), workers=4)
+        await asyncio.sleep(0.1)
+        assert done == []
+
+
+class _FakeMessage:
+    def __init__(self, msg_id: int, text: str) -> None:
+        self.id = msg_id
+        self.text = text
+        self.date = "2025-01-01"
+
+
+def _iter_messages_client(messages):
+    calls = []
+
+    def iter_messages(chat, **kwargs):
+        calls.append(kwargs)
+
+        async def gen():
+            for m in messages:
+                yield m
+
+        return gen()
+
+    wrapper = ClientWrapper(Path("unused.session"), 1, "hash")
+    wrapper._client = MagicMock()
+    wrapper._client.iter_messages = iter_messages
+    return wrapper, calls
+
+
+class TestSearchMessages:
+    @pytest.mark.asyncio
+    async def test_server_search_resumes_from_offset(self):
+        wrapper, calls = _iter_messages_client([_FakeMessage(40, "hit")])
+        result = await wrapper.search_messages(1, "hit", limit=5, offset_id=41)
+        assert [m["id"] for m in result] == [40]
+        assert calls == [{"search": "hit", "limit": 5, "offset_id": 41}]
+
+    @pytest.mark.asyncio
+    async def test_local_search_resumes_from_offset(self):
+        wrapper, calls = _iter_messages_client([_FakeMessage(9, "a"), _FakeMessage(8, "hit")])
+        result = await wrapper.search_messages(1, "hit", limit=2, offset_id=10, local=True)
+        assert [m["id"] for m in result] == [8]
+        assert calls[0]["offset_id"] == 10
+
+
+class TestResolveChat:
+    @pytest.mark.asyncio
+    async def test_username_resolved_once(self):
+        from telethon.tl.types import InputPeerUser
+
+        wrapper = ClientWrapper(Path("unused.session"), 1, "hash")
+        wrapper._client = MagicMock()
+        wrapper._client.get_input_entity = AsyncMock(return_value=InputPeerUser(77, 0))
+        assert await wrapper.resolve_chat("@Alice") == 77
+        assert await wrapper.resolve_chat("alice") == 77
+        wrapper._client.get_input_entity.assert_awaited_once_with("@Alice")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self):
+        import asyncio
+        from telethon.tl.types import InputPeerUser
+
+        async def lookup(ref):
+            await asyncio.sleep(0)
+            return InputPeerUser(77, 0)
+
+        wrapper = ClientWrapper(Path("unused.session"), 1, "hash")
+        wrapper._client = MagicMock()
+        wrapper._client.get_input_entity = AsyncMock(side_effect=lookup)
+        ids = await asyncio.gather(*(wrapper.resolve_chat(r) for r in ("@alice", "alice", "@ALICE")))
+        assert ids == [77, 77, 77]
+        wrapper._client.get_input_entity.assert_awaited_once()
+        assert wrapper._resolving == {}
+
+    @pytest.mark.asyncio
+    async def test_forgotten_username_is_asked_again(self):
+        from telethon.tl.types import InputPeerUser, User
+
+        wrapper = ClientWrapper(Path("unused.session"), 1, "hash")
+        wrapper._client = MagicMock()
+        wrapper._client.get_input_entity = AsyncMock(return_value=InputPeerUser(77, 0))
+        wrapper._client.get_entity = AsyncMock(return_value=User(id=88, access_hash=1))
+        assert await wrapper.resolve_chat("@alice") == 77
+        wrapper.forget_chat("@Alice")
+        assert await wrapper.resolve_chat("@alice") == 88
+        assert await wrapper.resolve_chat("@alice") == 88
+        wrapper._client.get_entity.assert_awaited_once_with("@alice")
+        wrapper._client.get_input_entity.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_numeric_ref_skips_lookup(self):
+        wrapper = ClientWrapper(Path("unused.session"), 1, "hash")
+        wrapper._client = MagicMock()
+        wrapper._client.get_input_entity = AsyncMock()
+        assert await wrapper.resolve_chat("-100123") == -100123
+        wrapper._client.get_input_entity.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_is_not_cached(self):
+        from tlgr.core.errors import ChatNotFoundError
+
+        wrapper = ClientWrapper(Path("unused.session"), 1, "hash")
+        wrapper._client = MagicMock()
+        wrapper._client.get_input_entity = AsyncMock(side_effect=ValueError("nope"))
+        for _ in range(2):
+            with pytest.raises(ChatNotFoundError):
+                await wrapper.resolve_chat("@ghost")
+        assert wrapper._client.get_input_entity.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_username_answered_from_session(self, tmp_path):
+        from telethon import TelegramClient
+        from telethon.tl.types import User
+
+        session = tmp_path / "acct.session"
+        first = TelegramClient(str(session), 1, "hash")
+        first.session.process_entities([User(id=77, access_hash=5, username="alice")])
+        first.session.save()
+        first.session.close()
+
+        wrapper = ClientWrapper(session, 1, "hash")
+        wrapper._client = TelegramClient(str(session), 1, "hash")
+        try:
+            assert await wrapper.resolve_chat("@alice") == 77
+        finally:
+            wrapper._client.session.close()
+
+
+class TestThrottle:
+    @pytest.mark.asyncio
+    async def test_username_and_id_share_a_bucket(self):
+        from telethon.tl.types import InputPeerUser
+
+        wrapper = ClientWrapper(Path("unused.session"), 1, "hash")
+        wrapper._client = MagicMock()
+        wrapper._client.get_input_entity = AsyncMock(return_value=InputPeerUser(77, 0))
+        await wrapper.throttle("@alice")
+        await wrapper.throttle(77)
+        assert list(wrapper._chat_limiters) == [77]
+
+    @pytest.mark.asyncio
+    async def test_idle_buckets_are_dropped_past_the_cap(self, monkeypatch):
+        import tlgr.core.client as client_mod
+
+        monkeypatch.setattr(client_mod, "CHAT_LIMITERS_MAX", 2)
+        wrapper = ClientWrapper(Path("unused.session"), 1, "hash")
+        await wrapper.throttle(1)
+        wrapper._chat_limiters[1]._tokens = wrapper._chat_limiters[1].capacity
+        await wrapper.throttle(2)
+        await wrapper.throttle(3)
+        assert list(wrapper._chat_limiters) == [2, 3]
+
+
+class _FakeDialog:
+    def __init__(self, dialog_id: int, title: str) -> None:
+        from telethon.tl.types import Chat
+
+        self.id = dialog_id
+        self.entity = Chat(
+            id=dialog_id, title=title, photo=None, participants_count=1, date=None, version=1,
+        )
+
+
+class TestListChats:
+    def _wrapper(self, dialogs):
+        calls = []
+
+        def iter_dialogs(**kwargs):
+            calls.append(kwargs)
+
+            async def gen():
+                for d in dialogs:
+                    yield d
+
+            return gen()
+
+        wrapper = ClientWrapper(Path("unused.session"), 1, "hash")
+        wrapper._client = MagicMock()
+        wrapper._client.iter_dialogs = iter_dialogs
+        return wrapper, calls
+
+    @pytest.mark.asyncio
+    async def test_unfiltered_limit_is_passed_to_telegram(self):
+        wrapper, calls = self._wrapper([_FakeDialog(1, "a"), _FakeDialog(2, "b")])
+        chats = [c async for c in wrapper.list_chats(limit=1)]
+        assert [c["id"] for c in chats] == [1]
+        assert calls == [{"limit": 1}]
+
+    @pytest.mark.asyncio
+    async def test_search_scans_past_limit(self):
+        wrapper, calls = self._wrapper([_FakeDialog(i, t) for i, t in enumerate(["x", "News", "y", "news 2"])])
+        chats = [c async for c in wrapper.list_chats(limit=2, search="NEWS")]
+        assert [c["name"] for c in chats] == ["News", "news 2"]
+        assert calls == [{"limit": None}]
@@ -0,0 +1,31 @@
+"""Tests for TOML config persistence."""
+
+from __future__ import annotations
+
+import pytest
+
+import tlgr.core.paths as paths_mod
+from tlgr.core.config import _load_toml, _save_toml
+
+
+class TestSaveToml:
+    def test_round_trip_is_private(self, tmp_path):
+        path = tmp_path / "config.toml"
+        _save_toml(path, {"defaults": {"output": "json"}})
+        assert _load_toml(path) == {"defaults": {"output": "json"}}
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert not (tmp_path / "config.toml.tmp").exists()
+
+    def test_failed_write_keeps_previous_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.toml"
+        _save_toml(path, {"defaults": {"output": "json"}})
+
+        def boom(fd):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(paths_mod.os, "fsync", boom)
+        with pytest.raises(OSError):
+            _save_toml(path, {"defaults": {"output": "plain"}})
+        monkeypatch.undo()
+        assert _load_toml(path) == {"defaults": {"output": "json"}}
+        assert not (tmp_path / "config.toml.tmp").exists()
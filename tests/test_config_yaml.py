@@ -127,6 +127,11 @@ jobs:
         configs = load_gateway_configs(tmp_path)
         assert configs == []
 
+    def test_yaml_safe_tags_rejected(self, tmp_path):
+        (tmp_path / "jobs.yaml").write_text("jobs: !!python/object:object {}\n")
+        with pytest.raises(Exception, match="python/object"):
+            load_gateway_configs(tmp_path)
+
     def test_load_empty_file(self, tmp_path):
         (tmp_path / "jobs.yaml").write_text("")
         configs = load_gateway_configs(tmp_path)
@@ -175,3 +180,71 @@ jobs:
         ac = configs[0].actions[0]
         assert ac.processors is not None
         assert len(ac.processors) == 2
+
+
+class TestYamlCache:
+    JOBS = "jobs:\n  - name: a\n    actions:\n      - forward:\n          to: ['@x']\n"
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, monkeypatch):
+        import yaml
+
+        (tmp_path / "jobs.yaml").write_text(self.JOBS)
+        calls = []
+        real_load = yaml.load
+        monkeypatch.setattr(yaml, "load", lambda *a, **kw: calls.append(1) or real_load(*a, **kw))
+        first = load_gateway_configs(tmp_path)
+        second = load_gateway_configs(tmp_path)
+        assert len(calls) == 1
+        assert [c.name for c in second] == [c.name for c in first] == ["a"]
+
+    def test_hit_returns_independent_copy(self, tmp_path):
+        (tmp_path / "jobs.yaml").write_text(self.JOBS)
+        load_gateway_configs(tmp_path)[0].actions[0].config["to"].append("@y")
+        assert load_gateway_configs(tmp_path)[0].actions[0].config["to"] == ["@x"]
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        path = tmp_path / "jobs.yaml"
+        path.write_text(self.JOBS)
+        load_gateway_configs(tmp_path)
+        path.write_text(self.JOBS.replace("name: a", "name: bb"))
+        assert load_gateway_configs(tmp_path)[0].name == "bb"
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        from tlgr.gateway import config as config_mod
+
+        monkeypatch.setattr(config_mod, "_YAML_CACHE_MAX", 2)
+        monkeypatch.setattr(config_mod, "_yaml_cache", type(config_mod._yaml_cache)())
+        for name in "abc":
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "jobs.yaml").write_text(self.JOBS)
+            load_gateway_configs(tmp_path / name)
+        assert len(config_mod._yaml_cache) == 2
+
+
+class TestValidateGatewayConfigs:
+    def test_reports_problems(self, tmp_path):
+        from tlgr.gateway.config import validate_gateway_configs
+
+        (tmp_path / "jobs.yaml").write_text("jobs:\n  - name: a\n    actions:\n      - nope: 1\n  - account: x\n")
+        assert validate_gateway_configs(tmp_path) == [
+            "jobs.yaml: job 'a' has unknown action 'nope'",
+            "jobs.yaml: job missing 'name' field",
+            "jobs.yaml: job '' has no actions",
+        ]
+
+    def test_missing_file_is_valid(self, tmp_path):
+        from tlgr.gateway.config import validate_gateway_configs
+
+        assert validate_gateway_configs(tmp_path) == []
+
+    def test_unchanged_file_is_not_rechecked(self, tmp_path, monkeypatch):
+        from tlgr.gateway import config as config_mod
+
+        path = tmp_path / "jobs.yaml"
+        path.write_text("jobs:\n  - name: a\n")
+        first = config_mod.validate_gateway_configs(tmp_path)
+        monkeypatch.setattr(config_mod, "load_gateway_configs", lambda base: pytest.fail("re-validated"))
+        assert config_mod.validate_gateway_configs(tmp_path) == first
+        monkeypatch.undo()
+        path.write_text("jobs:\n  - name: a\n    actions:\n      - reply: hi\n")
+        assert config_mod.validate_gateway_configs(tmp_path) == []
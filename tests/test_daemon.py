@@ -0,0 +1,348 @@
+"""Tests for DaemonServer client sharing."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from telethon.errors import FloodWaitError
+
+import tlgr.daemon.server as server_mod
+from tlgr.daemon.server import DaemonServer
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    registry = MagicMock()
+    registry.get_account.side_effect = lambda alias: object() if alias == "work" else None
+    monkeypatch.setattr(server_mod, "open_account_manager", lambda base, backend=None: registry)
+
+    d = DaemonServer(tmp_path)
+    d.connects = []
+
+    async def connect(alias):
+        d.connects.append(alias)
+        await asyncio.sleep(0)
+        client = d._clients[alias] = MagicMock(name=alias)
+        return client
+
+    d._connect_account = connect
+    return d
+
+
+class TestAcquireClient:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_connect(self, daemon):
+        clients = await asyncio.gather(*(daemon.acquire_client("work") for _ in range(5)))
+        assert daemon.connects == ["work"]
+        assert all(c is clients[0] for c in clients)
+        assert await daemon.acquire_client("work") is clients[0]
+
+    @pytest.mark.asyncio
+    async def test_unknown_alias_is_not_connected(self, daemon):
+        assert await daemon.acquire_client("nope") is None
+        assert daemon.connects == []
+
+    @pytest.mark.asyncio
+    async def test_default_account_uses_first_client(self, daemon):
+        assert await daemon.acquire_client("") is None
+        work = await daemon.acquire_client("work")
+        assert await daemon.acquire_client("") is work
+
+    @pytest.mark.asyncio
+    async def test_startup_connects_accounts_concurrently(self, daemon):
+        in_flight = peak = 0
+
+        async def connect(alias):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            daemon.connects.append(alias)
+
+        daemon._connect_account = connect
+        await daemon._connect_accounts({"a", "b", "", "c"})
+        assert sorted(daemon.connects) == ["a", "b", "c"]
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_does_not_stop_the_others(self, daemon, caplog):
+        async def connect(alias):
+            await asyncio.sleep(0)
+            if alias == "bad":
+                raise ConnectionError("network down")
+            await asyncio.sleep(0)
+            daemon.connects.append(alias)
+
+        daemon._connect_account = connect
+        await daemon._connect_accounts(["bad", "a", "b"])
+        assert sorted(daemon.connects) == ["a", "b"]
+        assert "Could not connect account 'bad': ConnectionError: network down" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_reload_connects_new_accounts_concurrently(self, daemon, monkeypatch):
+        from types import SimpleNamespace
+
+        from tlgr.gateway.config import GatewayConfig
+
+        in_flight = peak = 0
+
+        async def connect(alias):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            daemon.connects.append(alias)
+            client = daemon._clients[alias] = MagicMock(name=alias)
+            return client
+
+        configs = [
+            GatewayConfig(name="a", account="work"),
+            GatewayConfig(name="b", account="home"),
+            GatewayConfig(name="c"),
+            GatewayConfig(name="d", account="off", enabled=False),
+        ]
+        monkeypatch.setattr(server_mod, "load_gateway_configs", lambda base: configs)
+        monkeypatch.setattr(
+            server_mod, "load_app_config", lambda base: SimpleNamespace(account_backend=None, default_account="work"),
+        )
+        daemon._account_registry().get_account.side_effect = lambda alias: object()
+        daemon._connect_account = connect
+        daemon._job_runner.create_job = MagicMock()
+
+        result = await daemon.reload_jobs()
+        assert sorted(result["added"]) == ["a", "b", "c", "d"]
+        assert sorted(daemon.connects) == ["home", "work"]
+        assert peak == 2
+        assert [c.args[1] for c in daemon._job_runner.create_job.call_args_list] == [
+            daemon._clients["work"], daemon._clients["home"], daemon._clients["work"],
+        ]
+
+
+class TestRunDaemon:
+    def test_runs_without_uvloop(self, monkeypatch):
+        import sys
+
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        ran = []
+
+        class Server:
+            async def run(self):
+                ran.append(type(asyncio.get_running_loop()).__module__)
+
+        server_mod.run_daemon(Server())
+        assert ran and ran[0].startswith("asyncio")
+
+
+class TestPeerRef:
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("-1001234567890", -1001234567890),
+            ("42", 42),
+            (42, 42),
+            ("@alice", "@alice"),
+            ("alice", "alice"),
+            ("+15551234567", "+15551234567"),
+            ("me", "me"),
+            ("²", "²"),
+        ],
+    )
+    def test_numeric_ids_become_ints(self, raw, expected):
+        from tlgr.daemon.ipc import _peer_ref
+
+        assert _peer_ref(raw) == expected
+        assert type(_peer_ref(raw)) is type(expected)
+
+
+@asynccontextmanager
+async def _ipc():
+    from aiohttp import web
+    from aiohttp.test_utils import TestClient, TestServer
+
+    from tlgr.daemon.ipc import IPCServer
+
+    client = MagicMock()
+    daemon = MagicMock()
+
+    async def acquire_client(account=""):
+        if account == "offline":
+            raise ConnectionError("network down")
+        return None if account == "missing" else client
+
+    daemon.acquire_client = acquire_client
+    app = web.Application()
+    IPCServer(daemon, "unused.sock")._register_routes(app)
+    async with TestClient(TestServer(app)) as http:
+        yield http, client
+
+
+class TestIPCHandlers:
+    @pytest.mark.asyncio
+    async def test_missing_client_is_404(self):
+        async with _ipc() as (http, _):
+            resp = await http.get("/message/get", params={"chat": "1", "msg_id": "2", "account": "missing"})
+            assert resp.status == 404
+
+    @pytest.mark.asyncio
+    async def test_connect_failure_is_json_error(self):
+        async with _ipc() as (http, _):
+            resp = await http.get("/message/get", params={"chat": "1", "msg_id": "2", "account": "offline"})
+            assert resp.status == 500
+            assert (await resp.json())["error"] == "network down"
+
+    @pytest.mark.asyncio
+    async def test_query_args_reach_client(self):
+        async with _ipc() as (http, client):
+            client.get_message = AsyncMock(return_value={"id": 2})
+            resp = await http.get("/message/get", params={"chat": "-100", "msg_id": "2"})
+            assert await resp.json() == {"id": 2}
+            client.get_message.assert_awaited_once_with(-100, 2)
+
+    @pytest.mark.asyncio
+    async def test_flood_wait_maps_to_429(self):
+        async with _ipc() as (http, client):
+            client.delete_messages = AsyncMock(side_effect=FloodWaitError(request=None, capture=30))
+            resp = await http.post("/message/delete", json={"chat": "1", "msg_ids": [1]})
+            assert resp.status == 429
+            assert (await resp.json())["wait_seconds"] == 30
+
+    @pytest.mark.asyncio
+    async def test_digit_user_refs_stay_phone_numbers(self):
+        async with _ipc() as (http, client):
+            client.get_user_info = AsyncMock(return_value={"id": 7})
+            client.remove_contact = AsyncMock(return_value={"removed": True})
+            await http.get("/user/get", params={"user": "15551234567"})
+            await http.post("/contact/remove", json={"user": "15551234567"})
+            client.get_user_info.assert_awaited_once_with("15551234567")
+            client.remove_contact.assert_awaited_once_with("15551234567")
+
+    @pytest.mark.asyncio
+    async def test_members_pass_through_as_user_refs(self):
+        async with _ipc() as (http, client):
+            client.create_chat = AsyncMock(return_value={"id": 9})
+            resp = await http.post(
+                "/chat/create", json={"name": "team", "members": ["15551234567", "@bob", "+15551234567"]},
+            )
+            assert resp.status == 200
+            client.create_chat.assert_awaited_once_with(
+                "team", chat_type="group", members=["15551234567", "@bob", "+15551234567"],
+            )
+
+
+class TestWebhookDeadLetter:
+    @pytest.mark.asyncio
+    async def test_exhausted_push_writes_dead_letter_off_loop(self, tmp_path, monkeypatch):
+        import threading
+
+        from tlgr.core.config import WebhookConfig, WebhookRetryConfig
+        from tlgr.daemon.webhook import WebhookPusher
+
+        pusher = WebhookPusher(
+            WebhookConfig(enabled=True, url="http://hook", retry=WebhookRetryConfig(enabled=False)),
+            base=tmp_path,
+        )
+        pusher._session = MagicMock()
+        pusher._session.post.side_effect = OSError("refused")
+
+        threads = []
+        write = pusher._write_dead_letter
+
+        def record(payload):
+            threads.append(threading.get_ident())
+            write(payload)
+
+        monkeypatch.setattr(pusher, "_write_dead_letter", record)
+        await pusher.push("new_message", {"id": 1})
+        assert threads and threads[0] != threading.get_ident()
+        assert [e["data"] for e in pusher.read_dead_letters()] == [{"id": 1}]
+
+
+class TestLifecycle:
+    def test_daemon_argv_shared_with_launchd(self, tmp_path):
+        import sys
+
+        from tlgr.daemon.launchd import _build_plist
+        from tlgr.daemon.lifecycle import daemon_argv
+
+        argv = daemon_argv(tmp_path)
+        assert argv[0] == sys.executable and argv[-2:] == ["--base", str(tmp_path)]
+        assert _build_plist(tmp_path, tmp_path / "logs")["ProgramArguments"] == [*argv, "--foreground"]
+
+    def test_wait_for_socket_returns_once_it_appears(self, tmp_path, monkeypatch):
+        from tlgr.daemon import lifecycle
+
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 2:
+                lifecycle.get_socket_path(tmp_path).touch()
+
+        monkeypatch.setattr(lifecycle.time, "sleep", sleep)
+        assert lifecycle.wait_for_socket(tmp_path)
+        assert sleeps == [0.1, pytest.approx(0.13)]
+
+    def test_wait_for_socket_times_out(self, tmp_path):
+        from tlgr.daemon.lifecycle import wait_for_socket
+
+        assert not wait_for_socket(tmp_path, timeout=0.05)
+
+    def test_read_pid(self, tmp_path):
+        import os
+
+        from tlgr.daemon.lifecycle import read_pid
+        from tlgr.core.paths import get_pid_path
+
+        assert read_pid(tmp_path) is None
+        pid_path = get_pid_path(tmp_path)
+        pid_path.write_text(str(os.getpid()))
+        assert read_pid(tmp_path) == os.getpid()
+        pid_path.write_text("garbage")
+        assert read_pid(tmp_path) is None
+        assert not pid_path.exists()
+
+
+class TestAccountRegistry:
+    @pytest.mark.asyncio
+    async def test_registry_opened_once(self, tmp_path, monkeypatch):
+        opened = []
+        registry = MagicMock()
+        registry.get_account.return_value = None
+        monkeypatch.setattr(
+            server_mod, "open_account_manager", lambda base, backend=None: opened.append(backend) or registry,
+        )
+        d = DaemonServer(tmp_path)
+        for alias in ("a", "b", "a"):
+            assert await d.acquire_client(alias) is None
+        assert opened == [None]
+
+    @pytest.mark.asyncio
+    async def test_connect_uses_shared_registry(self, tmp_path, monkeypatch):
+        opened = []
+        registry = MagicMock()
+        registry.load_credentials.return_value = (None, None)
+        monkeypatch.setattr(
+            server_mod, "open_account_manager", lambda base, backend=None: opened.append(backend) or registry,
+        )
+        d = DaemonServer(tmp_path)
+        for alias in ("a", "b"):
+            assert await d.acquire_client(alias) is None
+        assert opened == [None]
+        assert [c.args for c in registry.load_credentials.call_args_list] == [("a",), ("b",)]
+
+    def test_backend_change_reopens_registry(self, tmp_path, monkeypatch):
+        opened = []
+        monkeypatch.setattr(
+            server_mod, "open_account_manager", lambda base, backend=None: opened.append(backend) or MagicMock(),
+        )
+        d = DaemonServer(tmp_path)
+        first = d._account_registry("json")
+        assert d._account_registry() is first
+        assert d._account_registry("json") is first
+        assert d._account_registry("sqlite") is not first
+        assert opened == ["json", "sqlite"]
@@ -121,6 +121,15 @@ class TestContextFilters:
         ok, _ = f(ev, ["group", "channel"])
         assert ok
 
+    def test_chat_type_supergroup(self):
+        tg = _make_tg_event(is_group=True)
+        f = get_filter("chat_type")
+        assert f(_wrap(tg), "group")[0]
+        tg.chat.megagroup = True
+        assert f(_wrap(tg), "supergroup")[0]
+        tg.chat = None
+        assert f(_wrap(tg), "group")[0]
+
     def test_chat_id_match(self):
         ev = _wrap(_make_tg_event())
         f = get_filter("chat_id")
@@ -133,6 +142,13 @@ class TestContextFilters:
         ok, _ = f(ev, 999)
         assert not ok
 
+    def test_chat_id_list_with_usernames(self):
+        ev = _wrap(_make_tg_event())
+        f = get_filter("chat_id")
+        assert f(ev, ["@news", "-100", "42"])[0]
+        assert not f(ev, ["@news", "-100"])[0]
+        assert f(ev, [{"bad": 1}, 42])[0]
+
     def test_chat_title_regex(self):
         ev = _wrap(_make_tg_event(chat_title="Breaking News Channel"))
         f = get_filter("chat_title")
@@ -185,6 +201,14 @@ class TestContentFilters:
         ok, _ = f(ev, ["hello"])
         assert not ok
 
+    def test_keywords_fold_case_and_keep_original_in_reason(self):
+        ev = _wrap(_make_tg_event(text="Release 42 is out"))
+        f = get_filter("contains")
+        assert f(ev, ["RELEASE", 42])[0]
+        assert f(ev, "release")[0]
+        ok, reason = f(ev, ["Beta"])
+        assert not ok and reason == "missing keyword: Beta"
+
     def test_regex(self):
         ev = _wrap(_make_tg_event(text="order #12345"))
         f = get_filter("regex")
@@ -197,8 +221,25 @@ class TestContentFilters:
         ok, _ = f(ev, r"#\d+")
         assert not ok
 
+    def test_regex_ignores_case_and_reuses_pattern(self):
+        from tlgr.filters import compile_pattern
+
+        ev = _wrap(_make_tg_event(text="BREAKING news"))
+        f = get_filter("regex")
+        ok, _ = f(ev, "breaking")
+        assert ok
+        assert compile_pattern("breaking") is compile_pattern("breaking")
+
 
 class TestMessageFilters:
+    def test_types_accepts_list_or_comma_string(self):
+        ev = _wrap(_make_tg_event(media=None))
+        f = get_filter("types")
+        assert f(ev, ["Photo", "text"])[0]
+        assert f(ev, "photo, text")[0]
+        assert not f(ev, ["photo"])[0]
+        assert not get_filter("exclude_types")(ev, "video,TEXT")[0]
+
     def test_is_reply(self):
         ev = _wrap(_make_tg_event(reply_to=MagicMock()))
         f = get_filter("is_reply")
@@ -319,6 +360,13 @@ class TestComposition:
         })
         assert node.op is Op.NOT
 
+    def test_leaf_binds_filter_at_parse(self):
+        from tlgr.filters import get_filter
+
+        node = parse_filter_config({"chat_type": "private"})
+        assert node.func is get_filter("chat_type")
+        assert parse_filter_config({"no_such_filter": 1}).func is None
+
     def test_evaluate_and(self):
         ev = _wrap(_make_tg_event(is_private=True, text="hello world"))
         node = parse_filter_config({"chat_type": "private", "contains": ["hello"]})
@@ -399,3 +447,37 @@ class TestComposition:
         ok, reason = evaluate(node, ev)
         assert not ok
         assert "unknown filter" in reason
+
+
+class TestDetectMessageType:
+    def _msg(self, media):
+        from unittest.mock import MagicMock
+
+        msg = MagicMock()
+        msg.media = media
+        return msg
+
+    def test_media_classes(self):
+        from telethon.tl.types import MessageMediaDice, MessageMediaGeoLive, MessageMediaPhoto, GeoPointEmpty
+
+        from tlgr.filters.message import MessageType, detect_message_type
+
+        assert detect_message_type(self._msg(None)) is MessageType.TEXT
+        assert detect_message_type(self._msg(MessageMediaPhoto())) is MessageType.PHOTO
+        assert detect_message_type(self._msg(MessageMediaDice(value=3, emoticon="🎲"))) is MessageType.DICE
+        live = MessageMediaGeoLive(geo=GeoPointEmpty(), period=60)
+        assert detect_message_type(self._msg(live)) is MessageType.LIVE_LOCATION
+
+    def test_documents_inspect_attributes(self):
+        from telethon.tl.types import (
+            Document, DocumentAttributeAudio, MessageMediaDocument, MessageMediaUnsupported,
+        )
+
+        from tlgr.filters.message import MessageType, detect_message_type
+
+        doc = Document(
+            id=1, access_hash=1, file_reference=b"", date=None, mime_type="audio/ogg", size=1,
+            dc_id=1, attributes=[DocumentAttributeAudio(duration=1, voice=True)],
+        )
+        assert detect_message_type(self._msg(MessageMediaDocument(document=doc))) is MessageType.VOICE
+        assert detect_message_type(self._msg(MessageMediaUnsupported())) is MessageType.UNSUPPORTED
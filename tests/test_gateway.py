@@ -46,6 +46,7 @@ def _make_tg_event(text="hello", is_private=True, sender_id=100):
 def _make_client():
     client = MagicMock()
     client.resolve_chat = AsyncMock(return_value=999)
+    client.throttle = AsyncMock()
     client.client = MagicMock()
     client.client.forward_messages = AsyncMock()
     client.client.send_message = AsyncMock()
@@ -91,6 +92,21 @@ class TestGatewayPipeline:
         tg_event.reply.assert_not_awaited()
         assert gw._stats["skipped"] == 1
 
+    @pytest.mark.asyncio
+    async def test_skip_reason_logged_at_debug(self, caplog):
+        import logging
+
+        config = GatewayConfig(
+            name="test-why",
+            account="test",
+            filters=parse_filter_config({"chat_type": "private"}),
+            actions=[ActionConfig(name="reply", config="hello!")],
+        )
+        gw = Gateway(config, _make_client())
+        with caplog.at_level(logging.DEBUG, logger="tlgr.gateway"):
+            await gw._handle(_make_tg_event(is_private=False))
+        assert "[test-why] skipped new_message: chat_type" in caplog.text
+
     @pytest.mark.asyncio
     async def test_no_filters_matches_all(self):
         config = GatewayConfig(
@@ -186,3 +202,146 @@ class TestGatewayPipeline:
         await gw._handle(tg_event)
 
         assert gw._stats["errors"] == 1
+
+
+class TestActionErrors:
+    async def _fail_once(self):
+        from tlgr.actions import register_action
+
+        @register_action("test_boom")
+        async def boom(event, config, client, chain=None):
+            raise RuntimeError("kaboom")
+
+        gw = Gateway(GatewayConfig(name="err", actions=[ActionConfig(name="test_boom")]), _make_client())
+        await gw._handle(_make_tg_event())
+        return gw
+
+    @pytest.mark.asyncio
+    async def test_traceback_only_at_debug(self, caplog):
+        import logging
+
+        caplog.set_level(logging.INFO, logger="tlgr.gateway")
+        await self._fail_once()
+        record = caplog.records[-1]
+        assert record.getMessage() == "[err] action 'test_boom' failed: RuntimeError: kaboom"
+        assert not record.exc_info
+
+        caplog.clear()
+        caplog.set_level(logging.DEBUG, logger="tlgr.gateway")
+        await self._fail_once()
+        assert caplog.records[-1].exc_info
+
+
+class TestGatewaySetup:
+    @pytest.mark.asyncio
+    async def test_username_chat_filter_matches_resolved_id(self):
+        config = GatewayConfig(
+            name="by-name",
+            filters=parse_filter_config({"chat_id": "@source"}),
+            actions=[ActionConfig(name="reply", config="hi")],
+        )
+        client = _make_client()
+        client.resolve_chat = AsyncMock(return_value=42)
+        gw = Gateway(config, client)
+        await gw.setup()
+
+        tg_event = _make_tg_event()
+        await gw._handle(tg_event)
+        tg_event.reply.assert_awaited_once_with("hi")
+
+    @pytest.mark.asyncio
+    async def test_refs_resolved_once_with_bounded_concurrency(self):
+        import asyncio
+        from tlgr.gateway import engine
+
+        in_flight = peak = 0
+        seen = []
+
+        async def resolve(ref):
+            nonlocal in_flight, peak
+            seen.append(ref)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return 1
+
+        dests = [f"@d{i}" for i in range(20)]
+        config = GatewayConfig(
+            name="fan-out",
+            filters=parse_filter_config({"any_of": [{"chat_id": ["@src", 5]}, {"chat_id": "@src"}]}),
+            actions=[ActionConfig(name="forward", config={"to": dests + ["@d0"]})],
+        )
+        client = _make_client()
+        client.resolve_chat = AsyncMock(side_effect=resolve)
+        await Gateway(config, client).setup()
+        assert sorted(seen) == sorted(dests + ["@src"])
+        assert peak == engine._RESOLVE_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_ref_is_logged_not_fatal(self, caplog):
+        config = GatewayConfig(
+            name="ghost",
+            filters=parse_filter_config({"chat_id": "@ghost"}),
+            actions=[ActionConfig(name="reply", config="hi")],
+        )
+        client = _make_client()
+        client.resolve_chat = AsyncMock(side_effect=ValueError("nope"))
+        gw = Gateway(config, client)
+        await gw.setup()
+        assert "could not resolve @ghost" in caplog.text
+        assert config.filters.filter_value == "@ghost"
+
+
+class TestJobRunner:
+    @pytest.mark.asyncio
+    async def test_has_running_tracks_started_jobs(self):
+        from tlgr.daemon.jobs import JobRunner
+
+        runner = JobRunner()
+        runner.create_job(GatewayConfig(name="idle", account="test"), _make_client())
+        assert not runner.has_running()
+
+        await runner.start_all()
+        assert runner.has_running()
+        assert runner.list_jobs()[0]["running"] is True
+
+        await runner.stop_all()
+        assert not runner.has_running()
+
+    @pytest.mark.asyncio
+    async def test_stop_all_stops_jobs_concurrently(self):
+        import asyncio
+
+        from tlgr.daemon.jobs import JobRunner
+
+        runner = JobRunner()
+        in_flight = peak = 0
+
+        async def slow_stop():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        for name in ("a", "b", "c"):
+            job = runner.create_job(GatewayConfig(name=name, account="test"), _make_client())
+            job.stop = slow_stop
+        await runner.stop_all()
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop_log_one_line_each(self, caplog):
+        import logging
+
+        from tlgr.daemon.jobs import JobRunner
+
+        caplog.set_level(logging.INFO, logger="tlgr.daemon.jobs")
+        runner = JobRunner()
+        for name in ("a", "b"):
+            runner.create_job(GatewayConfig(name=name, account="test"), _make_client())
+        await runner.start_all()
+        await runner.stop_all()
+        messages = [r.getMessage() for r in caplog.records if r.name == "tlgr.daemon.jobs"]
+        assert messages == ["Started 2 job(s): a, b", "Stopped 2 job(s): a, b"]
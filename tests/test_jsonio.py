@@ -0,0 +1,29 @@
+"""Tests for the orjson/stdlib JSON codec."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from tlgr.core import jsonio
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return jsonio
+
+
+class TestDumps:
+    def test_default_matches_stdlib(self, codec):
+        data = {"date": datetime(2025, 1, 1, tzinfo=timezone.utc), 1: "café", "ids": (1, 2)}
+        blob = codec.dumps(data, default=str)
+        assert json.loads(blob) == json.loads(json.dumps(data, default=str))
+        assert "café".encode() in blob
+
+    def test_roundtrip(self, codec):
+        data = {"messages": [{"id": 1, "text": "hi"}], "next_cursor": None}
+        assert codec.loads(codec.dumps(data)) == data
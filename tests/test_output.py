@@ -115,6 +115,56 @@ class TestOutputJson:
         result = json.loads(captured.out)
         assert result["flood_wait"] == 30
 
+    def test_utf8_stdout_gets_bytes_in_order(self, monkeypatch):
+        import io
+
+        raw = io.BytesIO()
+        out = io.TextIOWrapper(raw, encoding="utf-8")
+        monkeypatch.setattr(sys, "stdout", out)
+        out.write("before\n")
+        output_json({"name": "Zoë"})
+        assert raw.getvalue().decode().splitlines() == ["before", '{"name":"Zoë"}']
+
+    def test_non_utf8_stdout_goes_through_text_layer(self, monkeypatch):
+        import io
+
+        raw = io.BytesIO()
+        out = io.TextIOWrapper(raw, encoding="utf-16")
+        monkeypatch.setattr(sys, "stdout", out)
+        output_json({"name": "Zoë"})
+        assert json.loads(raw.getvalue().decode("utf-16")) == {"name": "Zoë"}
+
+    def test_unknown_types_fall_back_to_str(self, capsys):
+        from datetime import datetime
+
+        when = datetime(2025, 1, 2, 3, 4, 5)
+        output_json({"date": when, "ids": {1: "a"}, "name": "Zoë"})
+        assert json.loads(capsys.readouterr().out) == {
+            "date": str(when), "ids": {"1": "a"}, "name": "Zoë",
+        }
+
+
+class TestOutputHuman:
+    def test_pads_columns_to_widest_cell(self, capsys):
+        output_result(
+            [{"id": 1, "name": "alice"}, {"id": 12345, "name": "{b}"}],
+            fmt="human", columns=["id", "name"],
+        )
+        assert capsys.readouterr().out == "ID      NAME\n1       alice\n12345   {b}\n"
+
+    def test_empty_rows_print_header(self, capsys):
+        output_result([], fmt="human", columns=["id", "name"])
+        assert capsys.readouterr().out == "ID   NAME\n"
+
+
+class TestOutputPlain:
+    def test_escapes_tabs_and_newlines(self, capsys):
+        output_result(
+            [{"id": 1, "text": "a\tb\nc"}, {"id": None, "text": 2}],
+            fmt="plain", columns=["id", "text"],
+        )
+        assert capsys.readouterr().out == "id\ttext\n1\ta b c\n\t2\n"
+
 
 class TestEmit:
     def test_passes_results_only(self, capsys):
@@ -131,6 +131,11 @@ class TestChainFromSpec:
         chain = create_chain_from_spec("")
         assert len(chain) == 0
 
+    def test_escaped_comma_in_config(self):
+        chain = create_chain_from_spec(r"add_prefix:prefix=a\,b, strip_formatting")
+        assert len(chain) == 2
+        assert chain.apply("hello").startswith("a,b")
+
 
 class TestChainFromList:
     def test_string_items(self):
@@ -0,0 +1,71 @@
+"""Tests for the async token bucket."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from tlgr.core.errors import RateLimitError
+from tlgr.core.ratelimit import FloodCircuit, TokenBucket
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_burst_is_immediate(self):
+        bucket = TokenBucket(rate=1, capacity=3)
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_waits_once_empty(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+        await bucket.acquire()
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    def test_slow_down_halves_rate_with_floor(self):
+        bucket = TokenBucket(rate=1, min_rate=0.3)
+        bucket.slow_down()
+        assert bucket.rate == pytest.approx(0.5, abs=0.01)
+        bucket.slow_down()
+        assert bucket.rate == pytest.approx(0.3, abs=0.01)
+
+    def test_rate_recovers(self):
+        bucket = TokenBucket(rate=10, recovery=0.01)
+        bucket.slow_down()
+        time.sleep(0.02)
+        bucket._refill()
+        assert bucket.rate == 10
+
+    @pytest.mark.asyncio
+    async def test_idle_once_refilled(self):
+        bucket = TokenBucket(rate=100, capacity=1)
+        assert bucket.idle()
+        await bucket.acquire()
+        assert not bucket.idle()
+        time.sleep(0.02)
+        assert bucket.idle()
+
+
+class TestFloodCircuit:
+    def test_closed_by_default(self):
+        circuit = FloodCircuit()
+        circuit.check()
+        assert circuit.remaining == 0
+
+    def test_trip_fails_fast_with_wait(self):
+        circuit = FloodCircuit()
+        circuit.trip(30)
+        with pytest.raises(RateLimitError) as exc:
+            circuit.check()
+        assert exc.value.wait_seconds == 30
+
+    def test_shorter_trip_does_not_shorten_wait(self):
+        circuit = FloodCircuit()
+        circuit.trip(30)
+        circuit.trip(1)
+        assert circuit.remaining == 30
@@ -1,6 +1,20 @@
 """Allow running as python -m tlgr."""
 
-from tlgr.cli import cli
+import sys
+
+
+def main() -> None:
+    # ``tlgr --version`` needs neither click nor the command tree.
+    if sys.argv[1:] == ["--version"]:
+        from tlgr import __version__
+
+        print(f"tlgr, version {__version__}")
+        return
+
+    from tlgr.cli import cli
 
-if __name__ == "__main__":
     cli()
+
+
+if __name__ == "__main__":
+    main()
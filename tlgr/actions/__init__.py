@@ -8,14 +8,16 @@ from YAML, a :class:`~tlgr.core.client.ClientWrapper`, and an optional
 
 from __future__ import annotations
 
-from typing import Any, Callable, Awaitable
+from typing import TYPE_CHECKING, Any, Callable, Awaitable
 
-from tlgr.core.client import ClientWrapper
 from tlgr.gateway.event import Event
 from tlgr.processors import ProcessorChain
 
+if TYPE_CHECKING:
+    from tlgr.core.client import ClientWrapper
+
 ActionFunc = Callable[
-    [Event, Any, ClientWrapper, ProcessorChain | None],
+    [Event, Any, "ClientWrapper", ProcessorChain | None],
     Awaitable[None],
 ]
 
@@ -4,15 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
-
-from telethon import errors
+from typing import TYPE_CHECKING, Any
 
 from tlgr.actions import register_action
-from tlgr.core.client import ClientWrapper
 from tlgr.filters.message import is_forwardable
 from tlgr.gateway.event import Event
-from tlgr.processors import ProcessorChain, create_chain_from_list
+from tlgr.processors import ProcessorChain
+
+if TYPE_CHECKING:
+    from tlgr.core.client import ClientWrapper
 
 log = logging.getLogger("tlgr.actions.forward")
 
@@ -28,6 +28,8 @@ async def action_forward(
         log.warning("forward action only supports telegram events")
         return
 
+    from telethon import errors
+
     message = event.raw.message
 
     ok, reason = is_forwardable(message)
@@ -46,13 +48,34 @@ async def action_forward(
         log.warning("invalid forward config: %r", config)
         return
 
-    for i, dest_ref in enumerate(destinations):
+    # Destinations are independent lookups; resolve them in one round-trip.
+    resolved = await asyncio.gather(
+        *(client.resolve_chat(ref) for ref in destinations), return_exceptions=True,
+    )
+    # The processed text is the same for every destination; build it once.
+    transformed: str | None = None
+    if chain:
+        original = message.text or getattr(message, "message", "") or ""
         try:
-            dest_id = await client.resolve_chat(dest_ref)
+            transformed = chain.apply(original) if original else ""
+        except Exception as e:
+            log.error("forward processing failed: %s", e)
+            return
 
-            if chain:
-                original = message.text or getattr(message, "message", "") or ""
-                transformed = chain.apply(original) if original else ""
+    # "@x" and its numeric id can both be listed; send to each chat once.
+    seen: set[int] = set()
+    for dest_ref, dest_id in zip(destinations, resolved):
+        if isinstance(dest_id, Exception):
+            log.error("forward to %s failed: %s", dest_ref, dest_id)
+            continue
+        if dest_id in seen:
+            log.debug("skipping duplicate destination %s (%s)", dest_ref, dest_id)
+            continue
+        seen.add(dest_id)
+        try:
+            await client.throttle(dest_id)
+
+            if transformed is not None:
                 if message.media:
                     await client.client.send_file(dest_id, message.media, caption=transformed)
                 else:
@@ -65,8 +88,16 @@ async def action_forward(
             log.warning("cannot write to %s", dest_ref)
         except errors.ChannelPrivateError:
             log.warning("channel %s is private", dest_ref)
-        except Exception as e:
+            client.forget_chat(dest_ref)
+        except (errors.ChannelInvalidError, errors.PeerIdInvalidError) as e:
+            # Possibly a username that now belongs to another chat.
+            log.warning("forward to %s failed: %s", dest_ref, e)
+            client.forget_chat(dest_ref)
+        except errors.FloodWaitError as e:
+            client.slow_down(e.seconds)
             log.error("forward to %s failed: %s", dest_ref, e)
-
-        if i < len(destinations) - 1:
-            await asyncio.sleep(0.3)
+        except Exception as e:
+            log.error(
+                "forward to %s failed: %s: %s", dest_ref, type(e).__name__, e,
+                exc_info=log.isEnabledFor(logging.DEBUG),
+            )
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from tlgr.actions import register_action
-from tlgr.core.client import ClientWrapper
 from tlgr.gateway.event import Event
 from tlgr.processors import ProcessorChain
 
+if TYPE_CHECKING:
+    from tlgr.core.client import ClientWrapper
+
 log = logging.getLogger("tlgr.actions.reply")
 
 
@@ -29,4 +31,5 @@ async def action_reply(
     if chain:
         reply_text = chain.apply(reply_text)
 
+    await client.throttle(event.raw.chat_id)
     await event.raw.reply(reply_text)
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
+import importlib
 import os
 import sys
 
 import click
 
 from tlgr import __version__
-from tlgr.core.errors import TlgrError, emit_error, exit_code_for
 
 
 def _env_bool(key: str) -> bool:
@@ -19,24 +19,124 @@ def _env_or(key: str, fallback: str) -> str:
     return os.environ.get(key, "") or fallback
 
 
+# Short help of the lazy sub-groups, so ``tlgr --help`` can list them
+# without importing every command module.
+_HELP_CACHE = os.path.join(os.path.expanduser("~"), ".tlgr", "cache", "cli-help.json")
+_PKG_PARENT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _help_cache_key(lazy_commands: dict[str, str]) -> str | None:
+    """Key the help cache on the tlgr/Python versions and the command modules' mtimes."""
+    wanted: dict[str, set[str]] = {}
+    for target in lazy_commands.values():
+        *package, module = target.split(":")[0].split(".")
+        wanted.setdefault(os.path.join(_PKG_PARENT, *package), set()).add(module + ".py")
+    latest = 0
+    try:
+        # One directory scan per package; DirEntry caches its stat result.
+        for directory, names in wanted.items():
+            with os.scandir(directory) as entries:
+                mtimes = [e.stat().st_mtime_ns for e in entries if e.name in names]
+            if len(mtimes) != len(names):
+                return None
+            latest = max(latest, *mtimes)
+    except OSError:
+        return None
+    return f"{__version__}:{sys.version_info[0]}.{sys.version_info[1]}:{latest}"
+
+
 class TlgrGroup(click.Group):
-    """Custom group that handles errors, sandboxing, and output formatting."""
+    """Custom group that handles errors, sandboxing, and output formatting.
+
+    Sub-groups listed in ``lazy_commands`` (name -> ``"module:attr"``) are
+    only imported when they are resolved, so an invocation loads just the
+    command it runs. Listing help still imports all of them.
+    """
+
+    def __init__(self, *args, lazy_commands: dict[str, str] | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*self.commands, *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attr = self.lazy_commands[cmd_name].split(":")
+            self.add_command(getattr(importlib.import_module(module_name), attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        # Same layout as click.Group.format_commands, but sub-groups that are
+        # not loaded yet are listed from the help cache.
+        index = self._help_index(ctx)
+        commands = []
+        for name in self.list_commands(ctx):
+            if name not in self.commands and name in index:
+                cmd: click.Command | None = click.Command(name, **index[name])
+            else:
+                cmd = self.get_command(ctx, name)
+            if cmd is None or cmd.hidden:
+                continue
+            commands.append((name, cmd))
+
+        if commands:
+            limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+            rows = [(name, cmd.get_short_help_str(limit)) for name, cmd in commands]
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _help_index(self, ctx: click.Context) -> dict[str, dict]:
+        if not self.lazy_commands:
+            return {}
+        key = _help_cache_key(self.lazy_commands)
+        if key is None:
+            return {}
+
+        import json
+
+        try:
+            with open(_HELP_CACHE, encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("key") == key:
+                return cached["commands"]
+        except (OSError, ValueError):
+            pass
+
+        index = {}
+        for name in self.lazy_commands:
+            cmd = self.get_command(ctx, name)
+            if cmd is not None:
+                index[name] = {
+                    "help": cmd.help,
+                    "short_help": cmd.short_help,
+                    "hidden": cmd.hidden,
+                    "deprecated": cmd.deprecated,
+                }
+        tmp = f"{_HELP_CACHE}.tmp"
+        try:
+            os.makedirs(os.path.dirname(_HELP_CACHE), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "commands": index}, f)
+            os.replace(tmp, _HELP_CACHE)
+        except OSError:
+            pass
+        return index
 
     def invoke(self, ctx: click.Context) -> None:
         try:
             super().invoke(ctx)
-        except TlgrError as e:
-            use_json = ctx.params.get("json") or ctx.obj and ctx.obj.get("json")
-            emit_error(e, use_json=bool(use_json))
-            sys.exit(exit_code_for(e))
         except (click.ClickException, click.exceptions.Exit, SystemExit):
             raise
         except KeyboardInterrupt:
             sys.exit(130)
         except Exception as e:
+            # Imported here so the root group itself only needs click.
+            from tlgr.core.errors import emit_error, exit_code_for
+
             use_json = ctx.params.get("json") or ctx.obj and ctx.obj.get("json")
             emit_error(e, use_json=bool(use_json))
-            sys.exit(1)
+            sys.exit(exit_code_for(e))
 
     def resolve_command(self, ctx: click.Context, args: list[str]) -> tuple:
         """Override to enforce --enable-commands before dispatching."""
@@ -72,7 +172,42 @@ class TlgrGroup(click.Group):
         return cmd_name, cmd, rest
 
 
-@click.group(cls=TlgrGroup)
+# Sub-groups, imported on first use by TlgrGroup.get_command.
+_SUBCOMMANDS = {
+    "account": "tlgr.cli.account:account_group",
+    "message": "tlgr.cli.message:message_group",
+    "msg": "tlgr.cli.message:message_group",
+    "chat": "tlgr.cli.chat:chat_group",
+    "contact": "tlgr.cli.contact:contact_group",
+    "profile": "tlgr.cli.profile:profile_group",
+    "media": "tlgr.cli.media:media_group",
+    "daemon": "tlgr.cli.daemon_cmd:daemon_group",
+    "job": "tlgr.cli.job:job_group",
+    "config": "tlgr.cli.config_cmd:config_group",
+    "completion": "tlgr.cli.completion:completion_group",
+    "schema": "tlgr.cli.schema:schema_command",
+    "agent": "tlgr.cli.agent:agent_group",
+    "user": "tlgr.cli.user:user_group",
+    "watch": "tlgr.cli.watch:watch_command",
+    "batch": "tlgr.cli.batch:batch_command",
+}
+
+# Top-level action shortcuts, resolved through the same lazy lookup so their
+# options are only built when one of them runs.
+_SHORTCUTS = {
+    "send": "tlgr.cli.shortcuts:shortcut_send",
+    "login": "tlgr.cli.shortcuts:shortcut_login",
+    "logout": "tlgr.cli.shortcuts:shortcut_logout",
+    "status": "tlgr.cli.shortcuts:shortcut_status",
+    "chats": "tlgr.cli.shortcuts:shortcut_chats",
+    "contacts": "tlgr.cli.shortcuts:shortcut_contacts",
+    "dl": "tlgr.cli.shortcuts:shortcut_download",
+    "up": "tlgr.cli.shortcuts:shortcut_upload",
+    "exit-codes": "tlgr.cli.shortcuts:shortcut_exit_codes",
+}
+
+
+@click.group(cls=TlgrGroup, lazy_commands={**_SUBCOMMANDS, **_SHORTCUTS})
 @click.version_option(__version__, prog_name="tlgr")
 @click.option(
     "--json", "use_json", is_flag=True, default=_env_bool("TLGR_JSON"),
@@ -166,148 +301,3 @@ def cli(
         import logging
         logging.basicConfig(level=logging.DEBUG, stream=sys.stderr, format="%(levelname)s: %(message)s")
 
-
-# ---------------------------------------------------------------------------
-# Import and register sub-groups
-# ---------------------------------------------------------------------------
-
-from tlgr.cli.account import account_group  # noqa: E402
-from tlgr.cli.message import message_group  # noqa: E402
-from tlgr.cli.chat import chat_group  # noqa: E402
-from tlgr.cli.contact import contact_group  # noqa: E402
-from tlgr.cli.profile import profile_group  # noqa: E402
-from tlgr.cli.media import media_group  # noqa: E402
-from tlgr.cli.daemon_cmd import daemon_group  # noqa: E402
-from tlgr.cli.job import job_group  # noqa: E402
-from tlgr.cli.config_cmd import config_group  # noqa: E402
-from tlgr.cli.completion import completion_group  # noqa: E402
-from tlgr.cli.schema import schema_command  # noqa: E402
-from tlgr.cli.agent import agent_group  # noqa: E402
-from tlgr.cli.user import user_group  # noqa: E402
-from tlgr.cli.watch import watch_command  # noqa: E402
-
-cli.add_command(account_group, "account")
-cli.add_command(message_group, "message")
-cli.add_command(message_group, "msg")
-cli.add_command(chat_group, "chat")
-cli.add_command(contact_group, "contact")
-cli.add_command(profile_group, "profile")
-cli.add_command(media_group, "media")
-cli.add_command(daemon_group, "daemon")
-cli.add_command(job_group, "job")
-cli.add_command(config_group, "config")
-cli.add_command(completion_group, "completion")
-cli.add_command(schema_command, "schema")
-cli.add_command(agent_group, "agent")
-cli.add_command(user_group, "user")
-cli.add_command(watch_command, "watch")
-
-
-# ---------------------------------------------------------------------------
-# Top-level action shortcuts (desire paths)
-# ---------------------------------------------------------------------------
-
-@cli.command("send")
-@click.argument("chat")
-@click.argument("text", required=False, default="")
-@click.option("--file", "file_path", default=None, help="File to attach.")
-@click.option("--caption", default=None, help="Caption for file.")
-@click.option("--reply-to", type=int, default=None, help="Reply to message ID.")
-@click.option("--silent", is_flag=True, help="Send without notification.")
-@click.pass_context
-def shortcut_send(
-    ctx: click.Context,
-    chat: str,
-    text: str,
-    file_path: str | None,
-    caption: str | None,
-    reply_to: int | None,
-    silent: bool,
-) -> None:
-    """Send a message (shortcut for 'message send')."""
-    ctx.invoke(
-        message_group.commands["send"],
-        chat=chat, text=text, file_path=file_path, caption=caption,
-        reply_to=reply_to, silent=silent, account=ctx.obj.get("account"),
-    )
-
-
-@cli.command("login")
-@click.argument("phone")
-@click.option("--alias", default=None, help="Alias for this account.")
-@click.pass_context
-def shortcut_login(ctx: click.Context, phone: str, alias: str | None) -> None:
-    """Add and authenticate a Telegram account (shortcut for 'account add')."""
-    ctx.invoke(account_group.commands["add"], phone=phone, alias=alias)
-
-
-@cli.command("logout")
-@click.argument("alias")
-@click.pass_context
-def shortcut_logout(ctx: click.Context, alias: str) -> None:
-    """Remove an account (shortcut for 'account remove')."""
-    ctx.invoke(account_group.commands["remove"], alias=alias)
-
-
-@cli.command("status")
-@click.pass_context
-def shortcut_status(ctx: click.Context) -> None:
-    """Show daemon status (shortcut for 'daemon status')."""
-    ctx.invoke(daemon_group.commands["status"])
-
-
-@cli.command("chats")
-@click.option("--type", "chat_type", default=None, help="Filter: user, group, channel, bot.")
-@click.option("--search", "-s", default=None, help="Filter by name.")
-@click.option("--limit", "-n", type=int, default=None)
-@click.pass_context
-def shortcut_chats(ctx: click.Context, chat_type: str | None, search: str | None, limit: int | None) -> None:
-    """List all chats (shortcut for 'chat list')."""
-    ctx.invoke(
-        chat_group.commands["list"],
-        chat_type=chat_type, search=search, limit=limit,
-        account=ctx.obj.get("account"),
-    )
-
-
-@cli.command("contacts")
-@click.pass_context
-def shortcut_contacts(ctx: click.Context) -> None:
-    """List all contacts (shortcut for 'contact list')."""
-    ctx.invoke(contact_group.commands["list"], account=ctx.obj.get("account"))
-
-
-@cli.command("dl")
-@click.argument("chat")
-@click.argument("msg_id", type=int)
-@click.option("--out-dir", default=None, help="Output directory.")
-@click.pass_context
-def shortcut_download(ctx: click.Context, chat: str, msg_id: int, out_dir: str | None) -> None:
-    """Download media (shortcut for 'media download')."""
-    ctx.invoke(
-        media_group.commands["download"],
-        chat=chat, msg_id=msg_id, out_dir=out_dir,
-        account=ctx.obj.get("account"),
-    )
-
-
-@cli.command("up")
-@click.argument("chat")
-@click.argument("path", type=click.Path(exists=True))
-@click.option("--caption", default="", help="Caption for the file.")
-@click.pass_context
-def shortcut_upload(ctx: click.Context, chat: str, path: str, caption: str) -> None:
-    """Upload a file (shortcut for 'media upload')."""
-    ctx.invoke(
-        media_group.commands["upload"],
-        chat=chat, path=path, caption=caption,
-        account=ctx.obj.get("account"),
-    )
-
-
-# Top-level alias for exit-codes
-@cli.command("exit-codes", hidden=True)
-@click.pass_context
-def shortcut_exit_codes(ctx: click.Context) -> None:
-    """Print stable exit codes (shortcut for 'agent exit-codes')."""
-    ctx.invoke(agent_group.commands["exit-codes"])
@@ -2,18 +2,41 @@
 
 from __future__ import annotations
 
-import json
 import sys
+from typing import TYPE_CHECKING
 
 import click
 
-from tlgr.core.accounts import AccountManager
-from tlgr.core.config import CONFIG_DIR
+from tlgr.cli.options import alias_option
+from tlgr.core.errors import TlgrError
+from tlgr.core.paths import CONFIG_DIR
 from tlgr.core.output import emit
 
+if TYPE_CHECKING:
+    from tlgr.core.accounts import AccountManager
+
 
 def _get_mgr() -> AccountManager:
-    return AccountManager(CONFIG_DIR)
+    from tlgr.core.accounts import open_account_manager
+
+    return open_account_manager(CONFIG_DIR)
+
+
+def _prompt(message: str) -> str:
+    """Ask for one line of input.
+
+    A terminal gets ``input()`` with its line editing. Scripted runs read
+    a plain stdin line, and running out of answers is an error rather than
+    an EOFError traceback.
+    """
+    if sys.stdin.isatty():
+        return input(message).strip()
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise TlgrError(f"No answer on stdin for: {message.strip()}")
+    return line.strip()
 
 
 @click.group("account")
@@ -23,21 +46,30 @@ def account_group() -> None:
 
 @account_group.command("add")
 @click.argument("phone")
-@click.option("--alias", default=None, help="Alias for this account.")
+@alias_option
 @click.pass_context
 def account_add(ctx: click.Context, phone: str, alias: str | None) -> None:
     """Authenticate a new Telegram account (interactive — requires human input)."""
     import asyncio
+    from tlgr.core.accounts import _validate_alias
     from tlgr.core.client import ClientWrapper
 
-    mgr = _get_mgr()
     if alias is None:
         alias = phone.replace("+", "").replace(" ", "")[-6:]
-    account = mgr.add_account(alias)
+    # Before any disk access: the alias becomes a directory name.
+    _validate_alias(alias)
+    mgr = _get_mgr()
 
-    api_id_str = input("Telegram API ID (from my.telegram.org): ").strip()
-    api_hash = input("Telegram API Hash: ").strip()
-    api_id = int(api_id_str)
+    # TELEGRAM_API_ID / TELEGRAM_API_HASH (or saved credentials) skip the prompts.
+    api_id, api_hash = mgr.load_credentials(alias)
+    if not (api_id and api_hash) and ctx.obj.get("no_input"):
+        raise TlgrError("API credentials required: set TELEGRAM_API_ID and TELEGRAM_API_HASH")
+    mgr.add_account(alias)
+
+    if not api_id:
+        api_id = int(_prompt("Telegram API ID (from my.telegram.org): "))
+    if not api_hash:
+        api_hash = _prompt("Telegram API Hash: ")
     mgr.save_credentials(api_id, api_hash, alias)
 
     session_path = mgr.get_session_path(alias)
@@ -45,7 +77,7 @@ def account_add(ctx: click.Context, phone: str, alias: str | None) -> None:
 
     async def _login():
         await client.connect()
-        me = await client.login(phone=phone)
+        me = await client.login(phone=phone, code_callback=lambda: _prompt("Verification code: "))
         mgr.update_account(
             alias,
             phone=me.phone,
@@ -70,9 +102,8 @@ def account_list(ctx: click.Context) -> None:
     """List all registered accounts."""
     mgr = _get_mgr()
     active = mgr.get_active()
-    accounts = mgr.list_accounts()
     rows = []
-    for a in accounts:
+    for a in mgr.iter_accounts():
         rows.append({
             "alias": ("* " + a.alias) if a.alias == active else ("  " + a.alias),
             "user_id": a.user_id or "",
@@ -159,12 +190,11 @@ def account_sync(ctx: click.Context, alias: str | None) -> None:
         sys.exit(1)
 
     profile = ipc_request("GET", f"/profile/get?account={alias}")
-    mgr.update_account(
+    updated = mgr.update_account(
         alias,
         phone=profile.get("phone"),
         username=profile.get("username"),
         first_name=profile.get("first_name"),
         user_id=profile.get("id"),
-    )
-    updated = mgr.get_account(alias)
+    ) or acct
     emit(ctx.obj, updated.to_dict(), columns=["alias", "user_id", "username", "first_name", "phone"])
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import sys
+from functools import lru_cache
 
 import click
 
@@ -16,6 +17,22 @@ def agent_group() -> None:
     """Agent-friendly helpers (schema, exit codes)."""
 
 
+@lru_cache(maxsize=1)
+def _exit_code_table() -> str:
+    """Render the human exit-code table; EXIT_CODE_MAP is static, so once."""
+    rows = sorted(
+        ((info["code"], name, info["description"]) for name, info in EXIT_CODE_MAP.items()),
+        key=lambda r: r[0],
+    )
+    seen: set[int] = set()
+    lines = [f"{'CODE':<6} {'NAME':<22} DESCRIPTION"]
+    for code, name, desc in rows:
+        marker = "" if code not in seen else " (alias)"
+        seen.add(code)
+        lines.append(f"{code:<6} {name:<22} {desc}{marker}")
+    return "\n".join(lines)
+
+
 @agent_group.command("exit-codes")
 @click.pass_context
 def agent_exit_codes(ctx: click.Context) -> None:
@@ -28,28 +45,19 @@ def agent_exit_codes(ctx: click.Context) -> None:
         sys.stdout.flush()
         return
 
-    rows = sorted(
-        ((info["code"], name, info["description"]) for name, info in EXIT_CODE_MAP.items()),
-        key=lambda r: r[0],
-    )
-    seen: set[int] = set()
-    click.echo(f"{'CODE':<6} {'NAME':<22} DESCRIPTION")
-    for code, name, desc in rows:
-        marker = "" if code not in seen else " (alias)"
-        seen.add(code)
-        click.echo(f"{code:<6} {name:<22} {desc}{marker}")
+    click.echo(_exit_code_table())
 
 
 @agent_group.command("whoami")
 @click.pass_context
 def agent_whoami(ctx: click.Context) -> None:
     """Return current account info, daemon status, and environment for agents."""
-    from tlgr.core.accounts import AccountManager
-    from tlgr.core.config import CONFIG_DIR
+    from tlgr.core.accounts import open_account_manager
+    from tlgr.core.paths import CONFIG_DIR
     from tlgr.daemon.lifecycle import read_pid
 
     obj = ctx.obj or {}
-    mgr = AccountManager(CONFIG_DIR)
+    mgr = open_account_manager(CONFIG_DIR)
     active_alias = obj.get("account") or mgr.get_active()
     acct = mgr.get_account(active_alias) if active_alias else None
 
@@ -0,0 +1,93 @@
+"""Run several tlgr commands from stdin in one process."""
+
+from __future__ import annotations
+
+import shlex
+import sys
+
+import click
+
+# Root flags/options passed on to every line, as (param name, command-line flag).
+_ROOT_FLAGS = (
+    ("use_json", "--json"),
+    ("use_plain", "--plain"),
+    ("results_only", "--results-only"),
+    ("dry_run", "--dry-run"),
+    ("force", "--force"),
+    ("no_input", "--no-input"),
+    ("verbose", "--verbose"),
+)
+_ROOT_VALUES = (
+    ("account", "--account"),
+    ("select_fields", "--select"),
+    ("flood_wait_max", "--flood-wait-max"),
+)
+
+
+def _root_args(params: dict) -> list[str]:
+    """Rebuild the root options this batch was started with."""
+    args = [flag for name, flag in _ROOT_FLAGS if params.get(name)]
+    for name, opt in _ROOT_VALUES:
+        if params.get(name) not in (None, ""):
+            args += [opt, str(params[name])]
+    return args
+
+
+def _run(root: click.Group, argv: list[str], enable_commands: str) -> int:
+    """Invoke one command line like ``tlgr <argv>`` and return its exit code."""
+    try:
+        with root.make_context("tlgr", argv) as ctx:
+            # A line can't widen the sandbox with its own --enable-commands.
+            if enable_commands:
+                ctx.params["enable_commands"] = enable_commands
+            root.invoke(ctx)
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+        return 1
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        click.echo(e.code, err=True)
+        return 1
+    return 0
+
+
+@click.command("batch")
+@click.option("--keep-going", "-k", is_flag=True, help="Run the remaining lines after a failure.")
+@click.pass_context
+def batch_command(ctx: click.Context, keep_going: bool) -> None:
+    """Run tlgr commands read from stdin, one per line.
+
+    Each line is what would follow ``tlgr`` on the command line; blank
+    lines and ``#`` comments are skipped. Global options given before
+    ``batch`` apply to every line. All lines share one process, so a
+    script pays interpreter start-up once, and the daemon's connection
+    serves every line. Stops at the first failing line unless
+    --keep-going; exits with the last failing line's code.
+    """
+    root = ctx.find_root()
+    prefix = _root_args(root.params)
+    enable_commands = root.params.get("enable_commands") or ""
+
+    status = 0
+    for lineno, line in enumerate(sys.stdin, 1):
+        try:
+            argv = shlex.split(line, comments=True)
+        except ValueError as e:
+            click.echo(f"Error: line {lineno}: {e}", err=True)
+            code = 2
+        else:
+            if not argv:
+                continue
+            code = _run(root.command, prefix + argv, enable_commands)
+        if code:
+            status = code
+            if code == 130 or not keep_going:
+                break
+    if status:
+        sys.exit(status)
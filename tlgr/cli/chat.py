@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import click
 
+from tlgr.cli.options import account_option, chat_filter_options, cursor_option
 from tlgr.core.output import add_pagination, decode_cursor, emit
 from tlgr.ipc_client import ipc_request
 
@@ -14,25 +15,22 @@ def chat_group() -> None:
 
 
 @chat_group.command("list")
-@click.option("--type", "chat_type", default=None, help="Filter: user, group, channel, bot.")
-@click.option("--search", "-s", default=None, help="Filter by name.")
-@click.option("--limit", "-n", type=int, default=None)
-@click.option("--cursor", default=None, help="Pagination cursor from a previous response.")
-@click.option("--account", "-a", default=None)
+@chat_filter_options
+@cursor_option
+@account_option
 @click.pass_context
 def chat_list(
     ctx: click.Context,
     chat_type: str | None,
     search: str | None,
-    limit: int | None,
+    limit: int,
     cursor: str | None,
     account: str | None,
 ) -> None:
     """List all chats/dialogs."""
     acct = account or ctx.obj.get("account", "")
     cur = decode_cursor(cursor)
-    effective_limit = limit or 100
-    params = f"account={acct}&limit={effective_limit}"
+    params = f"account={acct}&limit={limit}"
     if cur.get("offset"):
         params += f"&offset={cur['offset']}"
     if chat_type:
@@ -45,7 +43,7 @@ def chat_list(
         chats = result.get("chats", [])
         offset = cur.get("offset", 0)
         next_state = {"offset": offset + len(chats)}
-        add_pagination(result, chats, effective_limit, next_state)
+        add_pagination(result, chats, limit, next_state)
         emit(ctx.obj, result)
     else:
         emit(
@@ -58,7 +56,7 @@ def chat_list(
 
 @chat_group.command("get")
 @click.argument("chat")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def chat_get(ctx: click.Context, chat: str, account: str | None) -> None:
     """Get chat info (members, permissions, etc.)."""
@@ -71,7 +69,7 @@ def chat_get(ctx: click.Context, chat: str, account: str | None) -> None:
 @click.argument("name")
 @click.option("--type", "chat_type", default="group", type=click.Choice(["group", "channel"]))
 @click.option("--members", multiple=True, help="Users to add.")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def chat_create(
     ctx: click.Context,
@@ -90,7 +88,7 @@ def chat_create(
 
 @chat_group.command("archive")
 @click.argument("chat")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def chat_archive(ctx: click.Context, chat: str, account: str | None) -> None:
     """Archive a chat."""
@@ -105,7 +103,7 @@ def chat_archive(ctx: click.Context, chat: str, account: str | None) -> None:
 @chat_group.command("mute")
 @click.argument("chat")
 @click.argument("duration", type=int, required=False, default=None)
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def chat_mute(ctx: click.Context, chat: str, duration: int | None, account: str | None) -> None:
     """Mute a chat. Duration in seconds (omit for permanent)."""
@@ -116,7 +114,7 @@ def chat_mute(ctx: click.Context, chat: str, duration: int | None, account: str
 
 @chat_group.command("leave")
 @click.argument("chat")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def chat_leave(ctx: click.Context, chat: str, account: str | None) -> None:
     """Leave a chat or group."""
@@ -131,7 +129,7 @@ def chat_leave(ctx: click.Context, chat: str, account: str | None) -> None:
 @chat_group.command("typing")
 @click.argument("chat")
 @click.option("--duration", type=float, default=5, help="Seconds to show typing (default 5).")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def chat_typing(ctx: click.Context, chat: str, duration: float, account: str | None) -> None:
     """Send a typing indicator."""
@@ -29,8 +29,6 @@ def completion_fish() -> None:
 
 
 def _get_completion(shell: str) -> str:
-    import os
-
     env_var = "_TLGR_COMPLETE"
     scripts = {
         "bash": f'eval "$({env_var}=bash_source tlgr)"',
@@ -9,15 +9,6 @@ import click
 
 from tlgr.core.config import CONFIG_DIR, load_app_config, load_webhook_config, _load_toml, _save_toml
 from tlgr.core.output import emit
-from tlgr.gateway.config import load_gateway_configs
-
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    try:
-        import tomllib
-    except ModuleNotFoundError:
-        import tomli as tomllib  # type: ignore[no-redef]
 
 _CONFIG_FILE = CONFIG_DIR / "config.toml"
 
@@ -27,6 +18,7 @@ _KNOWN_KEYS: dict[str, tuple[str, str, str]] = {
     "drop_author": ("defaults", "drop_author", "Strip author on forwarded messages"),
     "delete_after": ("defaults", "delete_after", "Delete source after forwarding"),
     "default_account": ("accounts", "default", "Default account alias"),
+    "account_backend": ("accounts", "backend", "Account registry storage: json | sqlite"),
     "auto_start": ("daemon", "auto_start", "Auto-start daemon on CLI use"),
     "log_level": ("daemon", "log_level", "Daemon log level: debug | info | warning | error"),
     "idle_timeout": ("daemon", "idle_timeout", "Seconds before idle daemon auto-stops (0 = never)"),
@@ -119,16 +111,9 @@ def config_validate(ctx: click.Context) -> None:
         errors.append(f"config.toml: {e}")
 
     try:
-        configs = load_gateway_configs()
-        for cfg in configs:
-            if not cfg.name:
-                errors.append("jobs.yaml: job missing 'name' field")
-            if not cfg.actions:
-                errors.append(f"jobs.yaml: job '{cfg.name}' has no actions")
-            for ac in cfg.actions:
-                from tlgr.actions import get_action
-                if get_action(ac.name) is None:
-                    errors.append(f"jobs.yaml: job '{cfg.name}' has unknown action '{ac.name}'")
+        from tlgr.gateway.config import validate_gateway_configs
+
+        errors.extend(validate_gateway_configs())
     except Exception as e:
         errors.append(f"jobs.yaml: {e}")
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import click
 
+from tlgr.cli.options import account_option, cursor_option
 from tlgr.core.output import add_pagination, decode_cursor, emit
 from tlgr.ipc_client import ipc_request
 
@@ -15,8 +16,8 @@ def contact_group() -> None:
 
 @contact_group.command("list")
 @click.option("--limit", "-n", type=int, default=None, help="Max contacts to return.")
-@click.option("--cursor", default=None, help="Pagination cursor from a previous response.")
-@click.option("--account", "-a", default=None)
+@cursor_option
+@account_option
 @click.pass_context
 def contact_list(ctx: click.Context, limit: int | None, cursor: str | None, account: str | None) -> None:
     """List all contacts."""
@@ -42,7 +43,7 @@ def contact_list(ctx: click.Context, limit: int | None, cursor: str | None, acco
 @contact_group.command("add")
 @click.argument("phone")
 @click.argument("name", required=False, default="")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def contact_add(ctx: click.Context, phone: str, name: str, account: str | None) -> None:
     """Add a contact by phone number."""
@@ -53,7 +54,7 @@ def contact_add(ctx: click.Context, phone: str, name: str, account: str | None)
 
 @contact_group.command("remove")
 @click.argument("user")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def contact_remove(ctx: click.Context, user: str, account: str | None) -> None:
     """Remove a contact."""
@@ -68,8 +69,8 @@ def contact_remove(ctx: click.Context, user: str, account: str | None) -> None:
 @contact_group.command("search")
 @click.argument("query")
 @click.option("--limit", "-n", type=int, default=None, help="Max results.")
-@click.option("--cursor", default=None, help="Pagination cursor from a previous response.")
-@click.option("--account", "-a", default=None)
+@cursor_option
+@account_option
 @click.pass_context
 def contact_search(ctx: click.Context, query: str, limit: int | None, cursor: str | None, account: str | None) -> None:
     """Search contacts."""
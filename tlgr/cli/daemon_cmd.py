@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 import os
-import platform
-import subprocess
 import sys
 import time
+from pathlib import Path
+from typing import Iterator
 
 import click
 
-from tlgr.core.config import CONFIG_DIR, get_socket_path, get_pid_path, get_logs_dir
+from tlgr.core.paths import CONFIG_DIR, get_pid_path, get_logs_dir
 from tlgr.core.output import emit
-from tlgr.daemon.lifecycle import read_pid, stop_daemon
 
 
 @click.group("daemon")
@@ -25,35 +24,28 @@ def daemon_group() -> None:
 @click.pass_context
 def daemon_start(ctx: click.Context, foreground: bool) -> None:
     """Start the daemon (forks to background by default)."""
+    from tlgr.daemon.lifecycle import read_pid
+
     existing = read_pid()
     if existing:
         click.echo(f"Daemon already running (pid={existing})", err=True)
         sys.exit(1)
 
     if foreground:
-        from tlgr.daemon.server import DaemonServer
+        from tlgr.daemon.server import DaemonServer, run_daemon
         from tlgr.daemon.lifecycle import setup_logging
         from tlgr.core.config import load_app_config
-        import asyncio
 
         cfg = load_app_config()
         setup_logging(CONFIG_DIR, cfg.daemon.log_level)
-        server = DaemonServer(CONFIG_DIR)
-        asyncio.run(server.run())
+        run_daemon(DaemonServer(CONFIG_DIR))
     else:
-        proc = subprocess.Popen(
-            [sys.executable, "-m", "tlgr.daemon.server", "--base", str(CONFIG_DIR)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True,
-        )
-        sock = get_socket_path()
-        for _ in range(40):
-            time.sleep(0.25)
-            if sock.exists():
-                pid = read_pid()
-                emit(ctx.obj, {"started": True, "pid": pid or proc.pid})
-                return
+        from tlgr.daemon.lifecycle import spawn_daemon, wait_for_socket
+
+        proc = spawn_daemon(CONFIG_DIR)
+        if wait_for_socket():
+            emit(ctx.obj, {"started": True, "pid": read_pid() or proc.pid})
+            return
         click.echo("Daemon did not start within 10 seconds", err=True)
         sys.exit(1)
 
@@ -62,6 +54,8 @@ def daemon_start(ctx: click.Context, foreground: bool) -> None:
 @click.pass_context
 def daemon_stop(ctx: click.Context) -> None:
     """Stop the daemon."""
+    from tlgr.daemon.lifecycle import stop_daemon
+
     if stop_daemon():
         for _ in range(20):
             time.sleep(0.25)
@@ -77,6 +71,8 @@ def daemon_stop(ctx: click.Context) -> None:
 @click.pass_context
 def daemon_restart(ctx: click.Context) -> None:
     """Restart the daemon."""
+    from tlgr.daemon.lifecycle import read_pid, spawn_daemon, stop_daemon, wait_for_socket
+
     if read_pid():
         stop_daemon()
         for _ in range(20):
@@ -84,19 +80,10 @@ def daemon_restart(ctx: click.Context) -> None:
             if not get_pid_path().exists():
                 break
 
-    proc = subprocess.Popen(
-        [sys.executable, "-m", "tlgr.daemon.server", "--base", str(CONFIG_DIR)],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        start_new_session=True,
-    )
-    sock = get_socket_path()
-    for _ in range(40):
-        time.sleep(0.25)
-        if sock.exists():
-            pid = read_pid()
-            emit(ctx.obj, {"restarted": True, "pid": pid or proc.pid})
-            return
+    proc = spawn_daemon(CONFIG_DIR)
+    if wait_for_socket():
+        emit(ctx.obj, {"restarted": True, "pid": read_pid() or proc.pid})
+        return
     click.echo("Daemon did not start within 10 seconds", err=True)
     sys.exit(1)
 
@@ -109,7 +96,7 @@ def daemon_install(ctx: click.Context, force: bool) -> None:
 
     macOS: creates a LaunchAgent plist.
     """
-    if platform.system() != "Darwin":
+    if sys.platform != "darwin":
         click.echo("Service installation is only supported on macOS for now.", err=True)
         sys.exit(1)
 
@@ -127,7 +114,7 @@ def daemon_install(ctx: click.Context, force: bool) -> None:
 @click.pass_context
 def daemon_uninstall(ctx: click.Context) -> None:
     """Remove the system service (stop auto-start on login)."""
-    if platform.system() != "Darwin":
+    if sys.platform != "darwin":
         click.echo("Service installation is only supported on macOS for now.", err=True)
         sys.exit(1)
 
@@ -144,6 +131,8 @@ def daemon_uninstall(ctx: click.Context) -> None:
 @click.pass_context
 def daemon_status(ctx: click.Context) -> None:
     """Show daemon status."""
+    from tlgr.daemon.lifecycle import read_pid
+
     pid = read_pid()
     if pid:
         try:
@@ -156,17 +145,77 @@ def daemon_status(ctx: click.Context) -> None:
         emit(ctx.obj, {"running": False}, columns=["running"])
 
 
+def _last_lines(path: Path, count: int, block: int = 8192) -> tuple[list[bytes], int]:
+    """Return the last *count* lines of *path* and the offset of its end.
+
+    Reads backwards in blocks so a large log isn't scanned from the start.
+    Newlines are counted per block and the blocks joined once, so long
+    lines don't make each step re-scan and re-copy everything read so far.
+    """
+    blocks: list[bytes] = []
+    newlines = 0
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        while pos > 0 and newlines <= count:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            blocks.append(chunk)
+            newlines += chunk.count(b"\n")
+    lines = b"".join(reversed(blocks)).splitlines(keepends=True)
+    return (lines[-count:] if count > 0 else []), end
+
+
+def _follow(path: Path, offset: int, interval: float = 0.25) -> Iterator[bytes]:
+    """Yield data appended to *path* after *offset*, reopening on rotation.
+
+    The open file's inode is read once per open, so an idle poll costs a
+    single ``stat`` of *path*.
+    """
+    f = open(path, "rb")
+    f.seek(offset)
+    ino = os.fstat(f.fileno()).st_ino
+    try:
+        while True:
+            chunk = f.read()
+            if chunk:
+                yield chunk
+                continue
+            time.sleep(interval)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if st.st_ino != ino or st.st_size < f.tell():
+                f.close()
+                f = open(path, "rb")
+                ino = os.fstat(f.fileno()).st_ino
+    finally:
+        f.close()
+
+
 @daemon_group.command("logs")
 @click.option("--follow", "-f", is_flag=True, help="Follow log output.")
 @click.option("--lines", "-n", type=int, default=50, help="Number of lines to show.")
 def daemon_logs(follow: bool, lines: int) -> None:
     """View daemon logs."""
     log_file = get_logs_dir() / "daemon.log"
-    if not log_file.exists():
+    try:
+        tail, end = _last_lines(log_file, lines)
+    except FileNotFoundError:
         click.echo("No log file found", err=True)
         sys.exit(1)
 
-    if follow:
-        os.execlp("tail", "tail", "-f", "-n", str(lines), str(log_file))
-    else:
-        os.execlp("tail", "tail", "-n", str(lines), str(log_file))
+    out = sys.stdout.buffer
+    out.write(b"".join(tail))
+    out.flush()
+    if not follow:
+        return
+    try:
+        for chunk in _follow(log_file, end):
+            out.write(chunk)
+            out.flush()
+    except KeyboardInterrupt:
+        pass
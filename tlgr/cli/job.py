@@ -3,11 +3,10 @@
 from __future__ import annotations
 
 import os
-import sys
 
 import click
 
-from tlgr.core.config import CONFIG_DIR
+from tlgr.core.paths import CONFIG_DIR
 from tlgr.core.output import emit
 from tlgr.ipc_client import ipc_request
 
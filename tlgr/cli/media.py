@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import click
 
+from tlgr.cli.options import account_option
 from tlgr.core.output import emit
 from tlgr.ipc_client import ipc_request
 
@@ -17,7 +18,7 @@ def media_group() -> None:
 @click.argument("chat")
 @click.argument("msg_id", type=int)
 @click.option("--out-dir", default=None, help="Output directory (default ~/.tlgr/downloads/).")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def media_download(
     ctx: click.Context,
@@ -39,7 +40,7 @@ def media_download(
 @click.argument("chat")
 @click.argument("path", type=click.Path(exists=True))
 @click.option("--caption", default="", help="Caption for the file.")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def media_upload(
     ctx: click.Context,
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import sys
-
 import click
 
+from tlgr.cli.options import account_option, cursor_option, send_options
 from tlgr.core.output import add_pagination, decode_cursor, emit
 from tlgr.ipc_client import ipc_request
 
@@ -18,11 +17,8 @@ def message_group() -> None:
 @message_group.command("send")
 @click.argument("chat")
 @click.argument("text", required=False, default="")
-@click.option("--file", "file_path", default=None, help="File to attach.")
-@click.option("--caption", default=None, help="Caption for file.")
-@click.option("--reply-to", type=int, default=None, help="Reply to message ID.")
-@click.option("--silent", is_flag=True, help="Send without notification.")
-@click.option("--account", "-a", default=None)
+@send_options
+@account_option
 @click.pass_context
 def message_send(
     ctx: click.Context,
@@ -57,14 +53,14 @@ def message_send(
 
 @message_group.command("list")
 @click.argument("chat")
-@click.option("--limit", "-n", type=int, default=20)
+@click.option("--limit", "-n", type=click.IntRange(min=1), default=20)
 @click.option("--offset-id", type=int, default=0)
-@click.option("--cursor", default=None, help="Pagination cursor from a previous response.")
+@cursor_option
 @click.option("--sender", is_flag=True, help="Include sender info.")
 @click.option("--media", is_flag=True, help="Include media metadata.")
 @click.option("--reactions", is_flag=True, help="Include reactions.")
 @click.option("--entities", is_flag=True, help="Include entities.")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def message_list(
     ctx: click.Context,
@@ -106,7 +102,7 @@ def message_list(
 @message_group.command("get")
 @click.argument("chat")
 @click.argument("msg_id", type=int)
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def message_get(ctx: click.Context, chat: str, msg_id: int, account: str | None) -> None:
     """Get a single message with full metadata."""
@@ -118,7 +114,7 @@ def message_get(ctx: click.Context, chat: str, msg_id: int, account: str | None)
 @message_group.command("delete")
 @click.argument("chat")
 @click.argument("msg_ids", nargs=-1, type=int, required=True)
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def message_delete(ctx: click.Context, chat: str, msg_ids: tuple[int, ...], account: str | None) -> None:
     """Delete messages from a chat."""
@@ -137,9 +133,9 @@ def message_delete(ctx: click.Context, chat: str, msg_ids: tuple[int, ...], acco
 @click.argument("query")
 @click.option("--local", is_flag=True, help="Client-side regex search.")
 @click.option("--regex", default=None, help="Regex pattern (with --local).")
-@click.option("--limit", "-n", type=int, default=20)
-@click.option("--cursor", default=None, help="Pagination cursor from a previous response.")
-@click.option("--account", "-a", default=None)
+@click.option("--limit", "-n", type=click.IntRange(min=1), default=20)
+@cursor_option
+@account_option
 @click.pass_context
 def message_search(
     ctx: click.Context,
@@ -176,7 +172,7 @@ def message_search(
 @message_group.command("pin")
 @click.argument("chat")
 @click.argument("msg_id", type=int)
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def message_pin(ctx: click.Context, chat: str, msg_id: int, account: str | None) -> None:
     """Pin a message in a chat."""
@@ -188,7 +184,7 @@ def message_pin(ctx: click.Context, chat: str, msg_id: int, account: str | None)
 @message_group.command("read")
 @click.argument("chat")
 @click.option("--up-to", type=int, default=None, help="Read up to this message ID.")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def message_read(ctx: click.Context, chat: str, up_to: int | None, account: str | None) -> None:
     """Mark messages as read."""
@@ -204,7 +200,7 @@ def message_read(ctx: click.Context, chat: str, up_to: int | None, account: str
 @click.argument("chat")
 @click.argument("msg_id", type=int)
 @click.argument("emoji")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def message_react(ctx: click.Context, chat: str, msg_id: int, emoji: str, account: str | None) -> None:
     """React to a message with an emoji."""
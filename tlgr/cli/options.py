@@ -0,0 +1,35 @@
+"""Options shared by several command groups."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import click
+
+account_option = click.option("--account", "-a", default=None)
+cursor_option = click.option("--cursor", default=None, help="Pagination cursor from a previous response.")
+alias_option = click.option("--alias", default=None, help="Alias for this account.")
+
+
+def _stack(*options: Callable) -> Callable:
+    """Combine option decorators, listed in the order they appear in ``--help``."""
+    def decorator(f: Callable) -> Callable:
+        for option in reversed(options):
+            f = option(f)
+        return f
+    return decorator
+
+
+# Shared by the sub-group commands and their top-level shortcuts, so the two
+# can't drift apart.
+send_options = _stack(
+    click.option("--file", "file_path", default=None, help="File to attach."),
+    click.option("--caption", default=None, help="Caption for file."),
+    click.option("--reply-to", type=int, default=None, help="Reply to message ID."),
+    click.option("--silent", is_flag=True, help="Send without notification."),
+)
+chat_filter_options = _stack(
+    click.option("--type", "chat_type", default=None, help="Filter: user, group, channel, bot."),
+    click.option("--search", "-s", default=None, help="Filter by name."),
+    click.option("--limit", "-n", type=click.IntRange(min=1), default=100),
+)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import click
 
+from tlgr.cli.options import account_option
 from tlgr.core.output import emit
 from tlgr.ipc_client import ipc_request
 
@@ -14,7 +15,7 @@ def profile_group() -> None:
 
 
 @profile_group.command("get")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def profile_get(ctx: click.Context, account: str | None) -> None:
     """Show your current profile."""
@@ -28,7 +29,7 @@ def profile_get(ctx: click.Context, account: str | None) -> None:
 @click.option("--last-name", default=None)
 @click.option("--bio", default=None)
 @click.option("--photo", default=None, type=click.Path(exists=True), help="Path to profile photo.")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def profile_update(
     ctx: click.Context,
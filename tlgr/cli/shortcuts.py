@@ -0,0 +1,110 @@
+"""Top-level action shortcuts (desire paths) for common sub-group commands."""
+
+from __future__ import annotations
+
+import click
+
+from tlgr.cli.options import alias_option, chat_filter_options, send_options
+
+
+@click.command("send")
+@click.argument("chat")
+@click.argument("text", required=False, default="")
+@send_options
+@click.pass_context
+def shortcut_send(
+    ctx: click.Context,
+    chat: str,
+    text: str,
+    file_path: str | None,
+    caption: str | None,
+    reply_to: int | None,
+    silent: bool,
+) -> None:
+    """Send a message (shortcut for 'message send')."""
+    from tlgr.cli.message import message_group
+
+    ctx.invoke(message_group.commands["send"], **ctx.params, account=ctx.obj.get("account"))
+
+
+@click.command("login")
+@click.argument("phone")
+@alias_option
+@click.pass_context
+def shortcut_login(ctx: click.Context, phone: str, alias: str | None) -> None:
+    """Add and authenticate a Telegram account (shortcut for 'account add')."""
+    from tlgr.cli.account import account_group
+
+    ctx.invoke(account_group.commands["add"], phone=phone, alias=alias)
+
+
+@click.command("logout")
+@click.argument("alias")
+@click.pass_context
+def shortcut_logout(ctx: click.Context, alias: str) -> None:
+    """Remove an account (shortcut for 'account remove')."""
+    from tlgr.cli.account import account_group
+
+    ctx.invoke(account_group.commands["remove"], alias=alias)
+
+
+@click.command("status")
+@click.pass_context
+def shortcut_status(ctx: click.Context) -> None:
+    """Show daemon status (shortcut for 'daemon status')."""
+    from tlgr.cli.daemon_cmd import daemon_group
+
+    ctx.invoke(daemon_group.commands["status"])
+
+
+@click.command("chats")
+@chat_filter_options
+@click.pass_context
+def shortcut_chats(ctx: click.Context, chat_type: str | None, search: str | None, limit: int) -> None:
+    """List all chats (shortcut for 'chat list')."""
+    from tlgr.cli.chat import chat_group
+
+    ctx.invoke(chat_group.commands["list"], **ctx.params, account=ctx.obj.get("account"))
+
+
+@click.command("contacts")
+@click.pass_context
+def shortcut_contacts(ctx: click.Context) -> None:
+    """List all contacts (shortcut for 'contact list')."""
+    from tlgr.cli.contact import contact_group
+
+    ctx.invoke(contact_group.commands["list"], account=ctx.obj.get("account"))
+
+
+@click.command("dl")
+@click.argument("chat")
+@click.argument("msg_id", type=int)
+@click.option("--out-dir", default=None, help="Output directory.")
+@click.pass_context
+def shortcut_download(ctx: click.Context, chat: str, msg_id: int, out_dir: str | None) -> None:
+    """Download media (shortcut for 'media download')."""
+    from tlgr.cli.media import media_group
+
+    ctx.invoke(media_group.commands["download"], **ctx.params, account=ctx.obj.get("account"))
+
+
+@click.command("up")
+@click.argument("chat")
+@click.argument("path", type=click.Path(exists=True))
+@click.option("--caption", default="", help="Caption for the file.")
+@click.pass_context
+def shortcut_upload(ctx: click.Context, chat: str, path: str, caption: str) -> None:
+    """Upload a file (shortcut for 'media upload')."""
+    from tlgr.cli.media import media_group
+
+    ctx.invoke(media_group.commands["upload"], **ctx.params, account=ctx.obj.get("account"))
+
+
+# Top-level alias for exit-codes
+@click.command("exit-codes", hidden=True)
+@click.pass_context
+def shortcut_exit_codes(ctx: click.Context) -> None:
+    """Print stable exit codes (shortcut for 'agent exit-codes')."""
+    from tlgr.cli.agent import agent_group
+
+    ctx.invoke(agent_group.commands["exit-codes"])
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import click
 
+from tlgr.cli.options import account_option
 from tlgr.core.output import emit
 from tlgr.ipc_client import ipc_request
 
@@ -15,7 +16,7 @@ def user_group() -> None:
 
 @user_group.command("get")
 @click.argument("user")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def user_get(ctx: click.Context, user: str, account: str | None) -> None:
     """Get detailed info about a user."""
@@ -8,13 +8,14 @@ import time
 
 import click
 
+from tlgr.cli.options import account_option
 from tlgr.ipc_client import ipc_request
 
 
 @click.command("watch")
 @click.option("--chat", "chats", multiple=True, help="Chat(s) to watch (default: all).")
 @click.option("--events", default="new_message", help="Comma-separated event types.")
-@click.option("--account", "-a", default=None)
+@account_option
 @click.pass_context
 def watch_command(ctx: click.Context, chats: tuple[str, ...], events: str, account: str | None) -> None:
     """Stream events as newline-delimited JSON. Ctrl+C to stop.
@@ -39,6 +40,8 @@ def watch_command(ctx: click.Context, chats: tuple[str, ...], events: str, accou
                 except Exception:
                     target_chats = []
 
+            # Events from every chat polled this round go out in one write.
+            out: list[str] = []
             for chat_ref in target_chats:
                 if "new_message" not in event_types:
                     continue
@@ -49,21 +52,23 @@ def watch_command(ctx: click.Context, chats: tuple[str, ...], events: str, accou
                         params += f"&min_id={offset_id}"
                     result = ipc_request("GET", f"/message/list?{params}")
                     msgs = result.get("messages", [])
-                    for msg in reversed(msgs):
-                        msg_id = msg.get("id", 0)
-                        if msg_id <= last_ids.get(chat_ref, 0):
-                            continue
-                        event = {
-                            "event_type": "new_message",
-                            "chat_id": chat_ref,
-                            "data": msg,
-                        }
-                        json.dump(event, sys.stdout, default=str, ensure_ascii=False)
-                        sys.stdout.write("\n")
-                        sys.stdout.flush()
-                        last_ids[chat_ref] = max(last_ids.get(chat_ref, 0), msg_id)
+                    last_seen = last_ids.get(chat_ref, 0)
+                    fresh = [m for m in reversed(msgs) if m.get("id", 0) > last_seen]
+                    if not fresh:
+                        continue
+                    out.extend(
+                        json.dumps(
+                            {"event_type": "new_message", "chat_id": chat_ref, "data": msg},
+                            default=str, ensure_ascii=False,
+                        ) + "\n"
+                        for msg in fresh
+                    )
+                    last_ids[chat_ref] = max(last_seen, *(m.get("id", 0) for m in fresh))
                 except Exception:
                     pass
+            if out:
+                sys.stdout.write("".join(out))
+                sys.stdout.flush()
 
             time.sleep(poll_interval)
     except KeyboardInterrupt:
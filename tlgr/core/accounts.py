@@ -2,22 +2,36 @@
 
 from __future__ import annotations
 
-import json
 import os
+import re
 import shutil
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterator
 
-from tlgr.core.config import get_accounts_dir, CONFIG_DIR
+from tlgr.core import jsonio
+from tlgr.core.paths import atomic_write, get_accounts_dir, CONFIG_DIR
 from tlgr.core.errors import TlgrError
 
+if TYPE_CHECKING:
+    import sqlite3
+
 
 ACCOUNTS_FILE = "accounts.json"
+ACCOUNTS_DB = "accounts.db"
+
+# Letters, digits, dashes and underscores, with at least one letter or digit.
+_ALIAS_MATCH = re.compile(r"\A[A-Za-z0-9_-]*[A-Za-z0-9][A-Za-z0-9_-]*\Z").match
+
+
+def _validate_alias(alias: str) -> None:
+    if not alias or not _ALIAS_MATCH(alias):
+        raise TlgrError(f"Invalid alias '{alias}'. Use letters, numbers, dashes, underscores.")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AccountInfo:
     alias: str
     phone: str | None = None
@@ -27,11 +41,29 @@ class AccountInfo:
     created_at: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "alias": self.alias,
+            "phone": self.phone,
+            "username": self.username,
+            "first_name": self.first_name,
+            "user_id": self.user_id,
+            "created_at": self.created_at,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AccountInfo:
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        return cls(
+            alias=data["alias"],
+            phone=data.get("phone"),
+            username=data.get("username"),
+            first_name=data.get("first_name"),
+            user_id=data.get("user_id"),
+            created_at=data.get("created_at"),
+        )
+
+    def copy_with(self, **overrides: Any) -> AccountInfo:
+        """Return a copy with *overrides* applied (instances are immutable)."""
+        return replace(self, **overrides)
 
     def display_name(self) -> str:
         if self.username:
@@ -39,45 +71,113 @@ class AccountInfo:
         if self.first_name:
             return self.first_name
         if self.phone:
-            return f"{self.phone[:4]}...{self.phone[-2:]}"
+            return self.masked_phone()
         return self.alias
 
+    def masked_phone(self) -> str:
+        """``+123...89`` style phone; short numbers are fully hidden."""
+        phone = self.phone or ""
+        if len(phone) <= 6:
+            return "***"
+        return phone[:4] + "..." + phone[-2:]
+
 
 class AccountManager:
     def __init__(self, base_dir: Path | None = None):
         self.base_dir = base_dir or CONFIG_DIR
         self.accounts_file = self.base_dir / ACCOUNTS_FILE
-        self.accounts_dir = get_accounts_dir(self.base_dir)
+        # Created lazily: read-only commands should not touch the filesystem.
+        self.accounts_dir = self.base_dir / "accounts"
+        self._dirs_ready = False
+        self._dir_cache: dict[str, Path] = {}
         self._data: dict[str, Any] | None = None
+        self._mtime_ns: int | None = None
+        self._account_cache: dict[str, AccountInfo] = {}
+        self._dirty = False
+        self._in_batch = 0
+        self._batch_now: str | None = None
 
     def _load(self) -> dict[str, Any]:
-        if self._data is not None:
-            return self._data
-        if not self.accounts_file.exists():
-            self._data = {"active": None, "accounts": {}}
+        # Unsaved batch changes must not be clobbered by a re-read.
+        if self._dirty and self._data is not None:
             return self._data
+        # Re-parse only when the file changed on disk since we last saw it.
         try:
-            with open(self.accounts_file) as f:
-                self._data = json.load(f)
-                return self._data
-        except (json.JSONDecodeError, IOError):
-            self._data = {"active": None, "accounts": {}}
+            mtime_ns: int | None = os.stat(self.accounts_file).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if self._data is not None and mtime_ns == self._mtime_ns:
             return self._data
+        self._mtime_ns = mtime_ns
+        self._account_cache.clear()
+        data: Any = None
+        if mtime_ns is not None:
+            try:
+                with open(self.accounts_file, "rb") as f:
+                    data = jsonio.loads(f.read())
+            except (ValueError, IOError):
+                pass
+        if not isinstance(data, dict):
+            data = {}
+        # Every method below relies on both keys being present.
+        data.setdefault("active", None)
+        if not isinstance(data.get("accounts"), dict):
+            data["accounts"] = {}
+        self._data = data
+        return data
+
+    def _ensure_dirs(self) -> None:
+        if not self._dirs_ready:
+            get_accounts_dir(self.base_dir)
+            self._dirs_ready = True
+
+    def _account_dir(self, alias: str) -> Path:
+        d = self._dir_cache.get(alias)
+        if d is None:
+            d = self._dir_cache[alias] = self.accounts_dir / alias
+        return d
 
-    def _save(self) -> None:
-        if self._data is None:
+    def _save(self, pretty: bool = False) -> None:
+        self._dirty = True
+        if self._in_batch:
             return
-        self.base_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.accounts_file, "w") as f:
-            json.dump(self._data, f, indent=2)
-        self.accounts_file.chmod(0o600)
+        self._flush(pretty=pretty)
+
+    def _flush(self, pretty: bool = False) -> None:
+        if self._data is None or not self._dirty:
+            return
+        self._ensure_dirs()
+        atomic_write(self.accounts_file, jsonio.dumps(self._data, pretty=pretty))
+        self._mtime_ns = os.stat(self.accounts_file).st_mtime_ns
+        self._dirty = False
+
+    @contextmanager
+    def batch(self) -> Iterator[AccountManager]:
+        """Defer registry writes until the outermost ``batch()`` block exits."""
+        self._in_batch += 1
+        try:
+            yield self
+        finally:
+            self._in_batch -= 1
+            if not self._in_batch:
+                self._batch_now = None
+                self._flush()
+
+    def _created_at(self) -> str:
+        # Accounts created within one batch share a single timestamp.
+        if self._batch_now is None:
+            now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+            if not self._in_batch:
+                return now
+            self._batch_now = now
+        return self._batch_now
 
     def get_active(self) -> str | None:
         data = self._load()
-        active = data.get("active")
-        if active and active in data.get("accounts", {}):
+        accounts = data["accounts"]
+        active = data["active"]
+        if active and active in accounts:
             return active
-        accounts = data.get("accounts", {})
         if accounts:
             first = next(iter(accounts))
             self.set_active(first)
@@ -86,34 +186,43 @@ class AccountManager:
 
     def set_active(self, alias: str) -> bool:
         data = self._load()
-        if alias not in data.get("accounts", {}):
+        if alias not in data["accounts"]:
             return False
-        data["active"] = alias
-        self._save()
+        if data["active"] != alias:
+            data["active"] = alias
+            self._save()
         return True
 
+    def _cached_account(self, alias: str, raw: dict[str, Any]) -> AccountInfo:
+        account = self._account_cache.get(alias)
+        if account is None:
+            account = self._account_cache[alias] = AccountInfo.from_dict(raw)
+        return account
+
+    def iter_accounts(self) -> Iterator[AccountInfo]:
+        """Yield accounts in registry order, building each one on demand."""
+        for alias, raw in list(self._load()["accounts"].items()):
+            yield self._cached_account(alias, raw)
+
     def list_accounts(self) -> list[AccountInfo]:
-        data = self._load()
-        return [AccountInfo.from_dict(v) for v in data.get("accounts", {}).values()]
+        return list(self.iter_accounts())
 
     def get_account(self, alias: str) -> AccountInfo | None:
         data = self._load()
-        info = data.get("accounts", {}).get(alias)
-        return AccountInfo.from_dict(info) if info else None
+        info = data["accounts"].get(alias)
+        return self._cached_account(alias, info) if info else None
 
     def add_account(self, alias: str) -> AccountInfo:
-        if not alias or not alias.replace("_", "").replace("-", "").isalnum():
-            raise TlgrError(f"Invalid alias '{alias}'. Use letters, numbers, dashes, underscores.")
+        _validate_alias(alias)
         data = self._load()
-        if alias in data.get("accounts", {}):
+        accounts = data["accounts"]
+        if alias in accounts:
             raise TlgrError(f"Account '{alias}' already exists")
-        account_dir = self.accounts_dir / alias
+        account_dir = self._account_dir(alias)
         account_dir.mkdir(parents=True, exist_ok=True)
-        account = AccountInfo(alias=alias, created_at=datetime.now().isoformat())
-        if "accounts" not in data:
-            data["accounts"] = {}
-        data["accounts"][alias] = account.to_dict()
-        if not data.get("active"):
+        account = AccountInfo(alias=alias, created_at=self._created_at())
+        accounts[alias] = account.to_dict()
+        if not data["active"]:
             data["active"] = alias
         self._save()
         return account
@@ -127,68 +236,88 @@ class AccountManager:
         first_name: str | None = None,
         user_id: int | None = None,
     ) -> AccountInfo | None:
-        data = self._load()
-        if alias not in data.get("accounts", {}):
+        ad = self._load()["accounts"].get(alias)
+        if ad is None:
             return None
-        ad = data["accounts"][alias]
-        if phone is not None:
-            ad["phone"] = phone
-        if username is not None:
-            ad["username"] = username
-        if first_name is not None:
-            ad["first_name"] = first_name
-        if user_id is not None:
-            ad["user_id"] = user_id
+        current = self._cached_account(alias, ad)
+        changes = {
+            k: v
+            for k, v in (
+                ("phone", phone),
+                ("username", username),
+                ("first_name", first_name),
+                ("user_id", user_id),
+            )
+            if v is not None
+        }
+        updated = current.copy_with(**changes)
+        if updated == current:
+            return current
+        ad.update(updated.to_dict())
+        self._account_cache[alias] = updated
         self._save()
-        return AccountInfo.from_dict(ad)
+        return updated
 
     def remove_account(self, alias: str, delete_data: bool = True) -> bool:
         data = self._load()
-        if alias not in data.get("accounts", {}):
+        accounts = data["accounts"]
+        if accounts.pop(alias, None) is None:
             return False
-        del data["accounts"][alias]
-        if data.get("active") == alias:
-            remaining = list(data["accounts"])
-            data["active"] = remaining[0] if remaining else None
+        self._account_cache.pop(alias, None)
+        if data["active"] == alias:
+            data["active"] = next(iter(accounts), None)
         self._save()
-        if delete_data:
-            account_dir = self.accounts_dir / alias
-            if account_dir.exists():
-                shutil.rmtree(account_dir)
+        self._remove_account_dir(alias, delete_data)
         return True
 
     def rename_account(self, old_alias: str, new_alias: str) -> bool:
-        if not new_alias or not new_alias.replace("_", "").replace("-", "").isalnum():
-            raise TlgrError(f"Invalid alias '{new_alias}'.")
+        _validate_alias(new_alias)
         data = self._load()
-        if old_alias not in data.get("accounts", {}):
+        accounts = data["accounts"]
+        if old_alias not in accounts:
             return False
-        if new_alias in data.get("accounts", {}):
+        if new_alias in accounts:
             raise TlgrError(f"Account '{new_alias}' already exists")
-        ad = data["accounts"].pop(old_alias)
+        ad = accounts.pop(old_alias)
+        self._account_cache.pop(old_alias, None)
         ad["alias"] = new_alias
-        data["accounts"][new_alias] = ad
-        if data.get("active") == old_alias:
+        accounts[new_alias] = ad
+        if data["active"] == old_alias:
             data["active"] = new_alias
         self._save()
-        old_dir = self.accounts_dir / old_alias
-        new_dir = self.accounts_dir / new_alias
-        if old_dir.exists():
-            old_dir.rename(new_dir)
+        self._move_account_dir(old_alias, new_alias)
         return True
 
+    def _remove_account_dir(self, alias: str, delete_data: bool) -> None:
+        account_dir = self._dir_cache.pop(alias, None) or self.accounts_dir / alias
+        if delete_data:
+            try:
+                shutil.rmtree(account_dir)
+            except FileNotFoundError:
+                pass
+
+    def _move_account_dir(self, old_alias: str, new_alias: str) -> None:
+        # Both dirs live under accounts_dir, so a plain rename never crosses devices.
+        try:
+            os.rename(
+                self._dir_cache.pop(old_alias, None) or self.accounts_dir / old_alias,
+                self._account_dir(new_alias),
+            )
+        except FileNotFoundError:
+            pass
+
     def get_account_dir(self, alias: str | None = None) -> Path:
         if alias is None:
             alias = self.get_active()
         if alias is None:
             raise TlgrError("No account specified and no active account")
-        d = self.accounts_dir / alias
+        d = self._account_dir(alias)
         d.mkdir(parents=True, exist_ok=True)
         return d
 
     def has_accounts(self) -> bool:
         data = self._load()
-        return bool(data.get("accounts"))
+        return bool(data["accounts"])
 
     def get_session_path(self, alias: str | None = None) -> Path:
         return self.get_account_dir(alias) / "session"
@@ -197,18 +326,26 @@ class AccountManager:
         return self.get_account_dir(alias) / "config.json"
 
     def load_credentials(self, alias: str | None = None) -> tuple[int | None, str | None]:
-        cred_path = self.get_credentials_path(alias)
+        """Return ``(api_id, api_hash)``; TELEGRAM_API_ID / TELEGRAM_API_HASH win.
+
+        Only reads: unlike :meth:`get_credentials_path` it creates no directory.
+        """
+        if alias is None:
+            alias = self.get_active()
+        if alias is None:
+            raise TlgrError("No account specified and no active account")
+        cred_path = self._account_dir(alias) / "config.json"
         api_id: int | None = None
         api_hash: str | None = None
 
-        if cred_path.exists():
-            try:
-                with open(cred_path) as f:
-                    data = json.load(f)
-                api_id = data.get("api_id")
-                api_hash = data.get("api_hash")
-            except (json.JSONDecodeError, IOError):
-                pass
+        # A missing file is just another IOError; no separate exists() probe.
+        try:
+            with open(cred_path, "rb") as f:
+                data = jsonio.loads(f.read())
+            api_id = data.get("api_id")
+            api_hash = data.get("api_hash")
+        except (ValueError, AttributeError, IOError):
+            pass
 
         env_id = os.environ.get("TELEGRAM_API_ID")
         env_hash = os.environ.get("TELEGRAM_API_HASH")
@@ -225,6 +362,214 @@ class AccountManager:
     def save_credentials(self, api_id: int, api_hash: str, alias: str | None = None) -> None:
         cred_path = self.get_credentials_path(alias)
         cred_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(cred_path, "w") as f:
-            json.dump({"api_id": api_id, "api_hash": api_hash}, f, indent=2)
-        cred_path.chmod(0o600)
+        atomic_write(cred_path, jsonio.dumps({"api_id": api_id, "api_hash": api_hash}, pretty=True))
+
+
+# ---------------------------------------------------------------------------
+# SQLite backend
+# ---------------------------------------------------------------------------
+
+_ACCOUNT_FIELDS = ("alias", "phone", "username", "first_name", "user_id", "created_at")
+_SELECT_ACCOUNT = f"SELECT {', '.join(_ACCOUNT_FIELDS)} FROM accounts"
+
+
+class SQLiteAccountStore(AccountManager):
+    """Account registry stored in ``accounts.db`` instead of ``accounts.json``.
+
+    Every mutation touches a single row, so large registries are not
+    rewritten on each update. On first use the JSON registry (if any) is
+    imported. Session and credential files are shared with
+    :class:`AccountManager`.
+    """
+
+    def __init__(self, base_dir: Path | None = None):
+        super().__init__(base_dir)
+        self.db_file = self.base_dir / ACCOUNTS_DB
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            import sqlite3
+
+            self._ensure_dirs()
+            fresh = not self.db_file.exists()
+            conn = sqlite3.connect(self.db_file, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS accounts ("
+                "alias TEXT PRIMARY KEY, phone TEXT, username TEXT, first_name TEXT, "
+                "user_id INTEGER, created_at TEXT, active INTEGER NOT NULL DEFAULT 0)"
+            )
+            self.db_file.chmod(0o600)
+            self._conn = conn
+            if fresh:
+                self._import_json()
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _import_json(self) -> None:
+        data = super()._load()
+        rows = [
+            tuple(AccountInfo.from_dict({**raw, "alias": alias}).to_dict().values())
+            + (int(alias == data["active"]),)
+            for alias, raw in data["accounts"].items()
+        ]
+        if rows:
+            with self._txn():
+                self.conn.executemany(
+                    f"INSERT OR IGNORE INTO accounts ({', '.join(_ACCOUNT_FIELDS)}, active) "
+                    f"VALUES ({', '.join('?' * (len(_ACCOUNT_FIELDS) + 1))})",
+                    rows,
+                )
+
+    @contextmanager
+    def _txn(self) -> Iterator[None]:
+        if self._in_batch:
+            yield
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    @contextmanager
+    def batch(self) -> Iterator[AccountManager]:
+        """Run the enclosed mutations in one transaction (rolled back on error)."""
+        with self._txn():
+            self._in_batch += 1
+            try:
+                yield self
+            finally:
+                self._in_batch -= 1
+                if not self._in_batch:
+                    self._batch_now = None
+
+    def get_active(self) -> str | None:
+        row = self.conn.execute(
+            "SELECT alias, active FROM accounts ORDER BY active DESC, rowid LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        if not row[1]:
+            self.set_active(row[0])
+        return row[0]
+
+    def set_active(self, alias: str) -> bool:
+        with self._txn():
+            row = self.conn.execute(
+                "SELECT active FROM accounts WHERE alias = ?", (alias,)
+            ).fetchone()
+            if row is None:
+                return False
+            if not row[0]:
+                self.conn.execute("UPDATE accounts SET active = (alias = ?)", (alias,))
+        return True
+
+    def iter_accounts(self) -> Iterator[AccountInfo]:
+        for row in self.conn.execute(f"{_SELECT_ACCOUNT} ORDER BY rowid").fetchall():
+            yield AccountInfo(*row)
+
+    def get_account(self, alias: str) -> AccountInfo | None:
+        row = self.conn.execute(f"{_SELECT_ACCOUNT} WHERE alias = ?", (alias,)).fetchone()
+        return AccountInfo(*row) if row else None
+
+    def has_accounts(self) -> bool:
+        return self.conn.execute("SELECT 1 FROM accounts LIMIT 1").fetchone() is not None
+
+    def add_account(self, alias: str) -> AccountInfo:
+        import sqlite3
+
+        _validate_alias(alias)
+        account = AccountInfo(alias=alias, created_at=self._created_at())
+        with self._txn():
+            try:
+                self.conn.execute(
+                    f"INSERT INTO accounts ({', '.join(_ACCOUNT_FIELDS)}, active) "
+                    "VALUES (?, ?, ?, ?, ?, ?, "
+                    "NOT EXISTS (SELECT 1 FROM accounts WHERE active))",
+                    tuple(account.to_dict().values()),
+                )
+            except sqlite3.IntegrityError:
+                raise TlgrError(f"Account '{alias}' already exists") from None
+        self._account_dir(alias).mkdir(parents=True, exist_ok=True)
+        return account
+
+    def update_account(
+        self,
+        alias: str,
+        *,
+        phone: str | None = None,
+        username: str | None = None,
+        first_name: str | None = None,
+        user_id: int | None = None,
+    ) -> AccountInfo | None:
+        changes = {
+            k: v
+            for k, v in (
+                ("phone", phone),
+                ("username", username),
+                ("first_name", first_name),
+                ("user_id", user_id),
+            )
+            if v is not None
+        }
+        if changes:
+            # The IS NOT guard turns an unchanged update into a no-op.
+            self.conn.execute(
+                f"UPDATE accounts SET {', '.join(f'{k} = ?' for k in changes)} "
+                f"WHERE alias = ? AND ({' OR '.join(f'{k} IS NOT ?' for k in changes)})",
+                (*changes.values(), alias, *changes.values()),
+            )
+        return self.get_account(alias)
+
+    def remove_account(self, alias: str, delete_data: bool = True) -> bool:
+        with self._txn():
+            row = self.conn.execute(
+                "SELECT active FROM accounts WHERE alias = ?", (alias,)
+            ).fetchone()
+            if row is None:
+                return False
+            self.conn.execute("DELETE FROM accounts WHERE alias = ?", (alias,))
+            if row[0]:
+                self.conn.execute(
+                    "UPDATE accounts SET active = 1 "
+                    "WHERE rowid = (SELECT min(rowid) FROM accounts)"
+                )
+        self._remove_account_dir(alias, delete_data)
+        return True
+
+    def rename_account(self, old_alias: str, new_alias: str) -> bool:
+        import sqlite3
+
+        _validate_alias(new_alias)
+        try:
+            cur = self.conn.execute(
+                "UPDATE accounts SET alias = ? WHERE alias = ?", (new_alias, old_alias)
+            )
+        except sqlite3.IntegrityError:
+            raise TlgrError(f"Account '{new_alias}' already exists") from None
+        if not cur.rowcount:
+            return False
+        self._move_account_dir(old_alias, new_alias)
+        return True
+
+
+def open_account_manager(base: Path | None = None, backend: str | None = None) -> AccountManager:
+    """Return the account registry selected by ``[accounts] backend`` in config.toml."""
+    base = base or CONFIG_DIR
+    if backend is None:
+        from tlgr.core.config import load_app_config
+
+        backend = load_app_config(base).account_backend
+    if backend == "sqlite":
+        return SQLiteAccountStore(base)
+    return AccountManager(base)
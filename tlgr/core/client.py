@@ -3,24 +3,73 @@
 from __future__ import annotations
 
 import asyncio
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, AsyncIterator
 
 from telethon import TelegramClient, utils
-from telethon.errors import SessionPasswordNeededError, FloodWaitError
-from telethon.tl.types import User, Chat, Channel
+from telethon.errors import FloodWaitError, MessageDeleteForbiddenError, MultiError, SessionPasswordNeededError
+from telethon.tl.functions.account import UpdateNotifySettingsRequest, UpdateProfileRequest
+from telethon.tl.functions.channels import CreateChannelRequest, LeaveChannelRequest
+from telethon.tl.functions.contacts import (
+    DeleteContactsRequest,
+    GetContactsRequest,
+    ImportContactsRequest,
+    SearchRequest,
+)
+from telethon.tl.functions.folders import EditPeerFoldersRequest
+from telethon.tl.functions.messages import DeleteChatUserRequest, SendReactionRequest, SetTypingRequest
+from telethon.tl.functions.users import GetFullUserRequest
+from telethon.tl.types import (
+    Channel,
+    Chat,
+    InputFolderPeer,
+    InputNotifyPeer,
+    InputPeerNotifySettings,
+    InputPhoneContact,
+    ReactionEmoji,
+    SendMessageCancelAction,
+    SendMessageTypingAction,
+    User,
+)
 
+from tlgr.core.config import get_downloads_dir
 from tlgr.core.errors import (
     AuthenticationError,
     SessionError,
-    ConfigurationError,
     ChatNotFoundError,
-    RateLimitError,
     TlgrError,
 )
+from tlgr.core.ratelimit import FloodCircuit, TokenBucket
 
 DEFAULT_FLOOD_WAIT_MAX = 120
 
+# Outgoing sends per second: across all chats, and per chat (burst of 3).
+SEND_RATE = 10.0
+CHAT_SEND_RATE = 1.0
+# Past this many per-chat buckets, idle ones are dropped before adding another.
+CHAT_LIMITERS_MAX = 256
+
+
+@lru_cache(maxsize=256)
+def _parse_chat_ref(chat_ref: str) -> int | str:
+    """Return the numeric peer id in *chat_ref*, or the ``@username`` to look up."""
+    try:
+        return int(chat_ref)
+    except ValueError:
+        pass
+    return chat_ref if chat_ref.startswith("@") else f"@{chat_ref}"
+
+
+def _sender_info(msg: Any) -> dict[str, Any]:
+    sender = msg.sender
+    return {
+        "id": msg.sender_id,
+        "name": getattr(sender, "first_name", None) or getattr(sender, "title", ""),
+        "username": getattr(sender, "username", None),
+    }
+
 
 def create_client(
     session_path: Path,
@@ -49,6 +98,12 @@ class ClientWrapper:
         self.flood_wait_max = flood_wait_max
         self._client: TelegramClient | None = None
         self._me: User | None = None
+        self._send_limiter = TokenBucket(SEND_RATE)
+        self._chat_limiters: dict[int | str, TokenBucket] = {}
+        self._flood_circuit = FloodCircuit()
+        self._resolved: dict[str, int] = {}
+        self._resolving: dict[str, asyncio.Future[int]] = {}
+        self._stale: set[str] = set()
 
     @property
     def client(self) -> TelegramClient:
@@ -62,6 +117,40 @@ class ClientWrapper:
             raise SessionError("Not logged in.")
         return self._me
 
+    async def throttle(self, chat_id: int | str) -> None:
+        """Wait for a send slot, both overall and for *chat_id*.
+
+        Raises :class:`RateLimitError` while a flood wait is in effect.
+        """
+        self._flood_circuit.check()
+        await self._send_limiter.acquire()
+        key = await self._limiter_key(chat_id)
+        bucket = self._chat_limiters.get(key)
+        if bucket is None:
+            if len(self._chat_limiters) >= CHAT_LIMITERS_MAX:
+                self._chat_limiters = {k: b for k, b in self._chat_limiters.items() if not b.idle()}
+            bucket = self._chat_limiters[key] = TokenBucket(CHAT_SEND_RATE, capacity=3)
+        await bucket.acquire()
+
+    async def _limiter_key(self, chat_id: int | str) -> int | str:
+        """Key per-chat buckets by peer id, so ``@name`` and its id share one."""
+        if isinstance(chat_id, int):
+            return chat_id
+        try:
+            return await self.resolve_chat(str(chat_id))
+        except ChatNotFoundError:
+            # The send will report the bad reference; pace it under its own name.
+            return chat_id
+
+    def slow_down(self, wait_seconds: int = 0) -> None:
+        """Back off the overall send rate after Telegram asked us to wait.
+
+        With *wait_seconds*, requests fail fast until that wait is over.
+        """
+        self._send_limiter.slow_down()
+        if wait_seconds:
+            self._flood_circuit.trip(wait_seconds)
+
     async def connect(self) -> bool:
         """Connect. Returns True if already authorised."""
         self._client = create_client(self.session_path, self.api_id, self.api_hash, self.flood_wait_max)
@@ -110,18 +199,56 @@ class ClientWrapper:
             await self._client.disconnect()
 
     async def resolve_chat(self, chat_ref: str) -> int:
-        """Resolve @username or numeric id to peer id."""
-        try:
-            return int(chat_ref)
-        except ValueError:
-            pass
-        if not chat_ref.startswith("@"):
-            chat_ref = f"@{chat_ref}"
+        """Resolve @username or numeric id to peer id.
+
+        Usernames are looked up once per client; forward destinations are
+        resolved again for every relayed message. ``get_input_entity``
+        answers from the session's entity table when it can, so a username
+        seen in an earlier run costs no ``ResolveUsernameRequest``. Callers
+        asking for the same username while its lookup is in flight (jobs
+        sharing a destination, a burst of relayed messages) wait on that
+        one lookup rather than each starting their own.
+        """
+        ref = _parse_chat_ref(chat_ref)
+        if isinstance(ref, int):
+            return ref
+        key = ref.lower()
+        peer_id = self._resolved.get(key)
+        if peer_id is not None:
+            return peer_id
+        lookup = self._resolving.get(key)
+        if lookup is None:
+            lookup = self._resolving[key] = asyncio.ensure_future(self._lookup_chat(ref, key))
+            lookup.add_done_callback(lambda f: self._resolving.pop(key, None))
+        # One waiter being cancelled must not cancel the lookup for the others.
+        return await asyncio.shield(lookup)
+
+    async def _lookup_chat(self, ref: str, key: str) -> int:
         try:
-            entity = await self.client.get_entity(chat_ref)
-            return utils.get_peer_id(entity)
+            if key in self._stale:
+                # get_entity always asks Telegram, and refreshes the session's row.
+                entity = await self.client.get_entity(ref)
+                self._stale.discard(key)
+            else:
+                entity = await self.client.get_input_entity(ref)
+            peer_id = self._resolved[key] = utils.get_peer_id(entity)
         except Exception as e:
-            raise ChatNotFoundError(f"Cannot resolve '{chat_ref}': {e}")
+            raise ChatNotFoundError(f"Cannot resolve '{ref}': {e}")
+        return peer_id
+
+    def forget_chat(self, chat_ref: str) -> None:
+        """Distrust the cached id for a username; the next resolve asks Telegram.
+
+        Resolved usernames persist across restarts in the session's entity
+        table, so one that has since moved to another chat would otherwise
+        keep resolving to the old id.
+        """
+        ref = _parse_chat_ref(chat_ref)
+        if isinstance(ref, int):
+            return
+        key = ref.lower()
+        self._resolved.pop(key, None)
+        self._stale.add(key)
 
     async def list_chats(
         self,
@@ -129,17 +256,21 @@ class ClientWrapper:
         chat_type: str | None = None,
         search: str | None = None,
     ) -> AsyncIterator[dict[str, Any]]:
+        # _entity_to_dict emits lowercase types, so only the inputs need folding.
+        chat_type = chat_type.lower() if chat_type else None
+        search = search.lower() if search else None
         count = 0
-        async for dialog in self.client.iter_dialogs():
+        # Without a post-filter every dialog counts, so let Telegram size the
+        # page; otherwise scan until enough matches turn up.
+        fetch_limit = None if chat_type or search else limit
+        async for dialog in self.client.iter_dialogs(limit=fetch_limit):
             entity = dialog.entity
             info = self._entity_to_dict(entity, dialog)
 
-            if chat_type:
-                if info["type"].lower() != chat_type.lower():
-                    continue
-            if search:
-                if search.lower() not in info["name"].lower():
-                    continue
+            if chat_type and info["type"] != chat_type:
+                continue
+            if search and search not in info["name"].lower():
+                continue
 
             yield info
             count += 1
@@ -195,21 +326,16 @@ class ClientWrapper:
         file: str | None = None,
         caption: str | None = None,
     ) -> dict[str, Any]:
-        if file:
-            msg = await self.client.send_file(
-                chat_id,
-                file,
-                caption=caption or text,
-                reply_to=reply_to,
-                silent=silent,
-            )
-        else:
-            msg = await self.client.send_message(
-                chat_id,
-                text,
-                reply_to=reply_to,
-                silent=silent,
-            )
+        await self.throttle(chat_id)
+        opts = {"reply_to": reply_to, "silent": silent}
+        try:
+            if file:
+                msg = await self.client.send_file(chat_id, file, caption=caption or text, **opts)
+            else:
+                msg = await self.client.send_message(chat_id, text, **opts)
+        except FloodWaitError as e:
+            self.slow_down(e.seconds)
+            raise
         return {"id": msg.id, "chat_id": chat_id, "date": str(msg.date)}
 
     async def get_messages(
@@ -231,18 +357,15 @@ class ClientWrapper:
                 "text": msg.text or "",
             }
             if include_sender and msg.sender:
-                d["sender"] = {
-                    "id": msg.sender_id,
-                    "name": getattr(msg.sender, "first_name", None) or getattr(msg.sender, "title", ""),
-                    "username": getattr(msg.sender, "username", None),
-                }
+                d["sender"] = _sender_info(msg)
             if include_media and msg.media:
                 d["media"] = {
                     "type": type(msg.media).__name__,
                     "has_file": hasattr(msg.media, "document") or hasattr(msg.media, "photo"),
                 }
-            if include_reactions and hasattr(msg, "reactions") and msg.reactions:
-                d["reactions"] = str(msg.reactions)
+            reactions = getattr(msg, "reactions", None) if include_reactions else None
+            if reactions:
+                d["reactions"] = str(reactions)
             if include_entities and msg.entities:
                 d["entities"] = [
                     {"type": type(e).__name__, "offset": e.offset, "length": e.length}
@@ -262,11 +385,7 @@ class ClientWrapper:
             "text": msg.text or "",
         }
         if msg.sender:
-            d["sender"] = {
-                "id": msg.sender_id,
-                "name": getattr(msg.sender, "first_name", None) or getattr(msg.sender, "title", ""),
-                "username": getattr(msg.sender, "username", None),
-            }
+            d["sender"] = _sender_info(msg)
         if msg.media:
             d["media"] = {
                 "type": type(msg.media).__name__,
@@ -276,17 +395,58 @@ class ClientWrapper:
                 {"type": type(e).__name__, "offset": e.offset, "length": e.length}
                 for e in msg.entities
             ]
-        if hasattr(msg, "reactions") and msg.reactions:
-            d["reactions"] = str(msg.reactions)
+        reactions = getattr(msg, "reactions", None)
+        if reactions:
+            d["reactions"] = str(reactions)
         if msg.reply_to:
             d["reply_to_msg_id"] = msg.reply_to.reply_to_msg_id
         if msg.forward:
             d["forward"] = True
         return d
 
-    async def delete_messages(self, chat_id: int | str, msg_ids: list[int]) -> int:
-        result = await self.client.delete_messages(chat_id, msg_ids, revoke=True)
-        return getattr(result, "pts_count", len(msg_ids))
+    async def delete_messages(self, chat_id: int | str, msg_ids: list[int], workers: int = 4) -> int:
+        """Delete *msg_ids* and return how many messages were actually removed.
+
+        Telethon sends the ids as DeleteMessages requests of 100 each. If one
+        id in the batch may not be deleted the whole call fails, so fall back
+        to deleting one by one (up to *workers* requests in flight) and skip
+        the forbidden ids. The chat is resolved once for all of those calls.
+        A flood wait trips the circuit and cancels the per-id deletes still
+        pending, so none lands after the error has been raised.
+        """
+        self._flood_circuit.check()
+        try:
+            results = await self.client.delete_messages(chat_id, msg_ids, revoke=True)
+        except FloodWaitError as e:
+            self._flood_circuit.trip(e.seconds)
+            raise
+        except (MessageDeleteForbiddenError, MultiError) as e:
+            errors = e.exceptions if isinstance(e, MultiError) else [e]
+            if len(msg_ids) == 1 or not any(isinstance(x, MessageDeleteForbiddenError) for x in errors):
+                raise
+            peer = await self.client.get_input_entity(chat_id)
+            sem = asyncio.Semaphore(workers)
+
+            async def _delete_one(msg_id: int) -> int:
+                async with sem:
+                    try:
+                        return await self.delete_messages(peer, [msg_id])
+                    except MessageDeleteForbiddenError:
+                        return 0
+
+            tasks = [asyncio.ensure_future(_delete_one(m)) for m in msg_ids]
+            try:
+                deleted = sum(await asyncio.gather(*tasks))
+            except BaseException:
+                # Stop the sibling deletes so none runs after we report failure.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            if not deleted:
+                raise
+            return deleted
+        return sum(getattr(r, "pts_count", 0) for r in results)
 
     async def search_messages(
         self,
@@ -294,15 +454,14 @@ class ClientWrapper:
         query: str,
         *,
         limit: int = 20,
+        offset_id: int = 0,
         local: bool = False,
         regex: str | None = None,
     ) -> list[dict[str, Any]]:
-        import re as re_mod
-
         result: list[dict[str, Any]] = []
         if local:
-            compiled = re_mod.compile(regex or query, re_mod.IGNORECASE) if (regex or query) else None
-            async for msg in self.client.iter_messages(chat_id, limit=limit * 10):
+            compiled = re.compile(regex or query, re.IGNORECASE) if (regex or query) else None
+            async for msg in self.client.iter_messages(chat_id, limit=limit * 10, offset_id=offset_id):
                 text = msg.text or ""
                 if compiled and not compiled.search(text):
                     continue
@@ -310,7 +469,9 @@ class ClientWrapper:
                 if len(result) >= limit:
                     break
         else:
-            async for msg in self.client.iter_messages(chat_id, search=query, limit=limit):
+            async for msg in self.client.iter_messages(
+                chat_id, search=query, limit=limit, offset_id=offset_id,
+            ):
                 result.append({"id": msg.id, "date": str(msg.date), "text": msg.text or ""})
         return result
 
@@ -319,9 +480,6 @@ class ClientWrapper:
         return {"pinned": True, "msg_id": msg_id}
 
     async def react_to_message(self, chat_id: int | str, msg_id: int, emoji: str) -> dict[str, Any]:
-        from telethon.tl.functions.messages import SendReactionRequest
-        from telethon.tl.types import ReactionEmoji
-
         await self.client(SendReactionRequest(
             peer=chat_id,
             msg_id=msg_id,
@@ -337,7 +495,6 @@ class ClientWrapper:
         members: list[str] | None = None,
     ) -> dict[str, Any]:
         if chat_type == "channel":
-            from telethon.tl.functions.channels import CreateChannelRequest
             result = await self.client(CreateChannelRequest(
                 title=name,
                 about="",
@@ -351,9 +508,6 @@ class ClientWrapper:
             return {"id": result.id if hasattr(result, "id") else 0, "name": name, "type": "group"}
 
     async def archive_chat(self, chat_id: int | str) -> dict[str, Any]:
-        from telethon.tl.functions.folders import EditPeerFoldersRequest
-        from telethon.tl.types import InputFolderPeer
-
         entity = await self.client.get_input_entity(chat_id)
         await self.client(EditPeerFoldersRequest([
             InputFolderPeer(peer=entity, folder_id=1)
@@ -361,9 +515,6 @@ class ClientWrapper:
         return {"archived": True, "chat_id": chat_id}
 
     async def mute_chat(self, chat_id: int | str, duration: int | None = None) -> dict[str, Any]:
-        from telethon.tl.functions.account import UpdateNotifySettingsRequest
-        from telethon.tl.types import InputPeerNotifySettings, InputNotifyPeer
-
         entity = await self.client.get_input_entity(chat_id)
         mute_until = 2**31 - 1 if duration is None else int(asyncio.get_event_loop().time()) + duration
         await self.client(UpdateNotifySettingsRequest(
@@ -375,15 +526,12 @@ class ClientWrapper:
     async def leave_chat(self, chat_id: int | str) -> dict[str, Any]:
         entity = await self.client.get_entity(chat_id)
         if isinstance(entity, Channel):
-            from telethon.tl.functions.channels import LeaveChannelRequest
             await self.client(LeaveChannelRequest(entity))
         elif isinstance(entity, Chat):
-            from telethon.tl.functions.messages import DeleteChatUserRequest
             await self.client(DeleteChatUserRequest(entity.id, self.me.id))
         return {"left": True, "chat_id": chat_id}
 
     async def list_contacts(self) -> list[dict[str, Any]]:
-        from telethon.tl.functions.contacts import GetContactsRequest
         result = await self.client(GetContactsRequest(hash=0))
         contacts: list[dict[str, Any]] = []
         for u in result.users:
@@ -396,9 +544,6 @@ class ClientWrapper:
         return contacts
 
     async def add_contact(self, phone: str, name: str = "") -> dict[str, Any]:
-        from telethon.tl.functions.contacts import ImportContactsRequest
-        from telethon.tl.types import InputPhoneContact
-
         parts = name.split(maxsplit=1)
         first = parts[0] if parts else ""
         last = parts[1] if len(parts) > 1 else ""
@@ -411,13 +556,11 @@ class ClientWrapper:
         return {"added": False, "error": "Could not import contact"}
 
     async def remove_contact(self, user_ref: str) -> dict[str, Any]:
-        from telethon.tl.functions.contacts import DeleteContactsRequest
         entity = await self.client.get_entity(user_ref)
         await self.client(DeleteContactsRequest(id=[entity]))
         return {"removed": True}
 
     async def search_contacts(self, query: str) -> list[dict[str, Any]]:
-        from telethon.tl.functions.contacts import SearchRequest
         result = await self.client(SearchRequest(q=query, limit=50))
         return [
             {
@@ -447,8 +590,6 @@ class ClientWrapper:
         bio: str | None = None,
         photo: str | None = None,
     ) -> dict[str, Any]:
-        from telethon.tl.functions.account import UpdateProfileRequest
-
         kwargs: dict[str, Any] = {}
         if first_name is not None:
             kwargs["first_name"] = first_name
@@ -469,8 +610,6 @@ class ClientWrapper:
         *,
         out_dir: str | None = None,
     ) -> dict[str, Any]:
-        from tlgr.core.config import get_downloads_dir
-
         msgs = await self.client.get_messages(chat_id, ids=[msg_id])
         if not msgs or msgs[0] is None:
             raise ChatNotFoundError(f"Message {msg_id} not found")
@@ -502,21 +641,15 @@ class ClientWrapper:
 
     async def send_typing(self, chat_id: int | str, duration: float = 5.0) -> dict[str, Any]:
         """Send typing indicator for *duration* seconds."""
-        from telethon.tl.functions.messages import SetTypingRequest
-        from telethon.tl.types import SendMessageTypingAction
-
         entity = await self.client.get_input_entity(chat_id)
         await self.client(SetTypingRequest(peer=entity, action=SendMessageTypingAction()))
         if duration > 0:
             await asyncio.sleep(min(duration, 30))
-            from telethon.tl.types import SendMessageCancelAction
             await self.client(SetTypingRequest(peer=entity, action=SendMessageCancelAction()))
         return {"typing": True, "chat_id": chat_id, "duration": duration}
 
     async def get_user_info(self, user_ref: str) -> dict[str, Any]:
         """Get detailed info about a user."""
-        from telethon.tl.functions.users import GetFullUserRequest
-
         entity = await self.client.get_entity(user_ref)
         if not isinstance(entity, User):
             return self._entity_to_dict(entity)
@@ -8,33 +8,23 @@ Handles three config files:
 
 from __future__ import annotations
 
-import os
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    try:
-        import tomllib
-    except ModuleNotFoundError:
-        import tomli as tomllib  # type: ignore[no-redef]
-
-try:
-    import tomli_w
-except ImportError:
-    tomli_w = None  # type: ignore[assignment]
-
 from tlgr.core.errors import ConfigurationError
-
-CONFIG_DIR = Path.home() / ".tlgr"
-
-
-def _ensure_dir(path: Path) -> Path:
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+from tlgr.core.paths import (  # noqa: F401  (re-exported)
+    CONFIG_DIR,
+    _ensure_dir,
+    atomic_write,
+    get_accounts_dir,
+    get_config_dir,
+    get_downloads_dir,
+    get_logs_dir,
+    get_pid_path,
+    get_socket_path,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -140,6 +130,7 @@ class AppConfig:
     defaults: Defaults = field(default_factory=Defaults)
     daemon: DaemonConfig = field(default_factory=DaemonConfig)
     default_account: str = ""
+    account_backend: str = "json"
 
 
 # ---------------------------------------------------------------------------
@@ -149,17 +140,27 @@ class AppConfig:
 def _load_toml(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
+    # Commands that only need paths (daemon logs, job list, ...) skip the parser.
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        try:
+            import tomllib
+        except ModuleNotFoundError:
+            import tomli as tomllib  # type: ignore[no-redef]
+
     with open(path, "rb") as f:
         return tomllib.load(f)
 
 
 def _save_toml(path: Path, data: dict[str, Any]) -> None:
-    if tomli_w is None:
+    # Only writes need tomli_w; keep it off the read-only command path.
+    try:
+        import tomli_w
+    except ImportError:
         raise ConfigurationError("tomli_w is required to write TOML files")
     _ensure_dir(path.parent)
-    with open(path, "wb") as f:
-        tomli_w.dump(data, f)
-    path.chmod(0o600)
+    atomic_write(path, tomli_w.dumps(data).encode())
 
 
 def _parse_filter(raw: dict[str, Any] | None) -> JobFilterConfig | None:
@@ -213,7 +214,9 @@ def load_app_config(base: Path | None = None) -> AppConfig:
         flood_wait_max=daemon_raw.get("flood_wait_max", 120),
     )
 
-    cfg.default_account = raw.get("accounts", {}).get("default", "")
+    accounts_raw = raw.get("accounts", {})
+    cfg.default_account = accounts_raw.get("default", "")
+    cfg.account_backend = accounts_raw.get("backend", "json")
     return cfg
 
 
@@ -291,26 +294,3 @@ def load_webhook_config(base: Path | None = None) -> WebhookConfig:
         ),
     )
 
-
-def get_config_dir() -> Path:
-    return _ensure_dir(CONFIG_DIR)
-
-
-def get_accounts_dir(base: Path | None = None) -> Path:
-    return _ensure_dir((base or CONFIG_DIR) / "accounts")
-
-
-def get_logs_dir(base: Path | None = None) -> Path:
-    return _ensure_dir((base or CONFIG_DIR) / "logs")
-
-
-def get_downloads_dir(base: Path | None = None) -> Path:
-    return _ensure_dir((base or CONFIG_DIR) / "downloads")
-
-
-def get_socket_path(base: Path | None = None) -> Path:
-    return (base or CONFIG_DIR) / "daemon.sock"
-
-
-def get_pid_path(base: Path | None = None) -> Path:
-    return (base or CONFIG_DIR) / "daemon.pid"
@@ -0,0 +1,38 @@
+"""JSON encode/decode that uses orjson when installed (``pip install tlgr[speedups]``)."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(blob: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
+def dumps(
+    data: Any,
+    *,
+    pretty: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Serialize *data* to UTF-8 JSON bytes.
+
+    With *default*, unknown types (and datetimes, to match the stdlib path)
+    are passed through it, and non-string dict keys are stringified.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, default=default, option=option or None)
+    if pretty:
+        return json.dumps(data, indent=2, default=default, ensure_ascii=False).encode()
+    return json.dumps(data, separators=(",", ":"), default=default, ensure_ascii=False).encode()
@@ -7,10 +7,31 @@ import json
 import sys
 from typing import Any, Sequence
 
+from tlgr.core import jsonio
+
+
+def _write_utf8(data: bytes) -> None:
+    """Write already-encoded *data* to stdout in one call.
+
+    When stdout is UTF-8 the bytes go straight to its binary buffer rather
+    than being decoded here only for the text layer to encode them again.
+    """
+    out = sys.stdout
+    buf = getattr(out, "buffer", None)
+    if buf is None or (getattr(out, "encoding", None) or "").lower() not in ("utf-8", "utf8"):
+        out.write(data.decode())
+        out.flush()
+        return
+    out.flush()  # keep ordering with anything already written as text
+    buf.write(data)
+    buf.flush()
+
 
 def _tsv_escape(value: Any) -> str:
-    s = str(value) if value is not None else ""
-    return s.replace("\t", " ").replace("\n", " ")
+    if value is None:
+        return ""
+    # Two replace() calls beat str.translate here: neither copies a clean cell.
+    return str(value).replace("\t", " ").replace("\n", " ")
 
 
 # ---------------------------------------------------------------------------
@@ -113,16 +134,17 @@ def output_json(
             data = {"result": data, "flood_wait": flood_wait}
 
     data = apply_json_transforms(data, results_only=results_only, select=select)
-    json.dump(data, sys.stdout, default=str, ensure_ascii=False)
-    sys.stdout.write("\n")
-    sys.stdout.flush()
+    # jsonio uses orjson when installed; large chat/message lists serialize
+    # several times faster, and the line still goes out in one write.
+    _write_utf8(jsonio.dumps(data, default=str) + b"\n")
 
 
 def output_plain(rows: Sequence[dict[str, Any]], columns: Sequence[str]) -> None:
     """Write TSV to stdout (no colors, stable for piping)."""
-    print("\t".join(columns))
-    for row in rows:
-        print("\t".join(_tsv_escape(row.get(c)) for c in columns))
+    lines = ["\t".join(columns)]
+    lines.extend("\t".join(_tsv_escape(row.get(c)) for c in columns) for row in rows)
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
     sys.stdout.flush()
 
 
@@ -136,17 +158,16 @@ def output_human(
     display_headers = headers or columns
     cells = [[str(row.get(c, "")) for c in columns] for row in rows]
 
-    widths = [len(h) for h in display_headers]
-    for cell_row in cells:
-        for i, v in enumerate(cell_row):
-            widths[i] = max(widths[i], len(v))
-
-    gap = "   "
-    header_line = gap.join(h.upper().ljust(w) for h, w in zip(display_headers, widths))
-    print(header_line.rstrip())
-    for cell_row in cells:
-        line = gap.join(v.ljust(w) for v, w in zip(cell_row, widths))
-        print(line.rstrip())
+    by_column = list(zip(*cells)) if cells else [()] * len(display_headers)
+    widths = [max(len(h), max(map(len, col), default=0)) for h, col in zip(display_headers, by_column)]
+
+    # Build the padded row template once and format every row through it.
+    row_fmt = "   ".join(f"{{:<{w}}}" for w in widths).format
+    lines = [row_fmt(*(h.upper() for h in display_headers)).rstrip()]
+    lines.extend(row_fmt(*cell_row).rstrip() for cell_row in cells)
+    lines.append("")
+    # One write for the whole table instead of a print() per row.
+    sys.stdout.write("\n".join(lines))
     sys.stdout.flush()
 
 
@@ -0,0 +1,56 @@
+"""Locations under the tlgr config directory.
+
+Kept apart from :mod:`tlgr.core.config` so commands that only need a path
+(daemon status, job list, IPC requests) don't build the config dataclasses.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+CONFIG_DIR = Path.home() / ".tlgr"
+
+
+def _ensure_dir(path: Path) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def atomic_write(path: Path, blob: bytes) -> None:
+    """Write *blob* to a 0600 temp file, fsync it, then rename over *path*."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def get_config_dir() -> Path:
+    return _ensure_dir(CONFIG_DIR)
+
+
+def get_accounts_dir(base: Path | None = None) -> Path:
+    return _ensure_dir((base or CONFIG_DIR) / "accounts")
+
+
+def get_logs_dir(base: Path | None = None) -> Path:
+    return _ensure_dir((base or CONFIG_DIR) / "logs")
+
+
+def get_downloads_dir(base: Path | None = None) -> Path:
+    return _ensure_dir((base or CONFIG_DIR) / "downloads")
+
+
+def get_socket_path(base: Path | None = None) -> Path:
+    return (base or CONFIG_DIR) / "daemon.sock"
+
+
+def get_pid_path(base: Path | None = None) -> Path:
+    return (base or CONFIG_DIR) / "daemon.pid"
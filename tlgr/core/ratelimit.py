@@ -0,0 +1,90 @@
+"""Async token bucket and flood circuit used to pace outgoing Telegram requests."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+
+from tlgr.core.errors import RateLimitError
+
+
+class TokenBucket:
+    """Hands out tokens at *rate* per second, bursting up to *capacity*.
+
+    :meth:`slow_down` halves the rate (e.g. after a flood wait); it then
+    climbs back to the configured rate linearly over *recovery* seconds.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        *,
+        min_rate: float = 0.1,
+        recovery: float = 60.0,
+    ) -> None:
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.min_rate = min_rate
+        self.recovery = recovery
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * elapsed / self.recovery)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until *tokens* are available and take them."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+    def idle(self) -> bool:
+        """True once the bucket is back to a full burst at the configured rate.
+
+        An idle bucket behaves exactly like a new one, so it can be dropped.
+        """
+        self._refill()
+        return self._tokens >= self.capacity and self.rate >= self.base_rate
+
+    def slow_down(self) -> None:
+        """Halve the current rate (not below ``min_rate``)."""
+        self._refill()
+        self.rate = max(self.min_rate, self.rate / 2)
+
+
+class FloodCircuit:
+    """Fails fast while Telegram has told us to wait.
+
+    Telethon already sleeps through flood waits up to ``flood_sleep_threshold``;
+    a ``FloodWaitError`` only reaches us when the wait is longer than that.
+    :meth:`trip` records it so further requests raise :class:`RateLimitError`
+    right away instead of each being sent only to be told to wait again.
+    """
+
+    def __init__(self) -> None:
+        self._until = 0.0
+
+    def trip(self, seconds: float) -> None:
+        self._until = max(self._until, time.monotonic() + seconds)
+
+    @property
+    def remaining(self) -> int:
+        return max(0, math.ceil(self._until - time.monotonic()))
+
+    def check(self) -> None:
+        """Raise :class:`RateLimitError` if the circuit is still open."""
+        wait = self.remaining
+        if wait:
+            raise RateLimitError(f"Flood wait in effect for another {wait}s", wait_seconds=wait)
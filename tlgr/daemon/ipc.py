@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 import logging
-from typing import Any, TYPE_CHECKING
+import re
+from typing import Any, Awaitable, Callable, Mapping, TYPE_CHECKING
 
 from aiohttp import web
 from telethon.errors import FloodWaitError
 
+from tlgr.core import jsonio
+from tlgr.core.errors import RateLimitError
+
 if TYPE_CHECKING:
+    from tlgr.core.client import ClientWrapper
     from tlgr.daemon.server import DaemonServer
 
 log = logging.getLogger("tlgr.daemon.ipc")
@@ -18,19 +23,35 @@ log = logging.getLogger("tlgr.daemon.ipc")
 
 def _json_response(data: Any, status: int = 200) -> web.Response:
     return web.Response(
-        body=json.dumps(data, default=str, ensure_ascii=False),
+        body=jsonio.dumps(data, default=str),
         content_type="application/json",
         status=status,
     )
 
 
+_NUMERIC_ID = re.compile(r"-?[0-9]+").fullmatch
+
+
+def _peer_ref(value: Any) -> int | str:
+    """Turn a numeric chat id from a query string or CLI argument into an int.
+
+    Telethon only treats ints as peer ids and looks a digit string up as a
+    phone number. Use this for chat arguments only: user and contact
+    references keep bare digits, so a phone number without ``+`` still
+    finds the contact.
+    """
+    if isinstance(value, str) and _NUMERIC_ID(value):
+        return int(value)
+    return value
+
+
 def _error_response(msg: str, status: int = 400, code: str = "IPC_ERROR") -> web.Response:
     return _json_response({"error": msg, "code": code}, status=status)
 
 
 async def _get_body(request: web.Request) -> dict[str, Any]:
     try:
-        return await request.json()
+        return jsonio.loads(await request.read())
     except Exception:
         return {}
 
@@ -42,9 +63,39 @@ def _handle_exception(e: Exception) -> web.Response:
             {"error": str(e), "code": "RATE_LIMITED", "wait_seconds": e.seconds},
             status=429,
         )
+    if isinstance(e, RateLimitError):
+        return _json_response(
+            {"error": str(e), "code": "RATE_LIMITED", "wait_seconds": e.wait_seconds},
+            status=429,
+        )
+    log.warning("IPC request failed: %s: %s", type(e).__name__, e, exc_info=log.isEnabledFor(logging.DEBUG))
     return _error_response(str(e), 500)
 
 
+def _with_client(
+    handler: Callable[[IPCServer, Any, ClientWrapper], Awaitable[Any]],
+) -> Callable[[IPCServer, web.Request], Awaitable[web.Response]]:
+    """Turn ``handler(self, args, client) -> payload`` into an aiohttp handler.
+
+    *args* is the query string for GET requests and the JSON body otherwise.
+    The account's client lookup, the 404 when it is missing, and the mapping
+    of exceptions to error responses live here, once for every route.
+    """
+    @functools.wraps(handler)
+    async def wrapper(self: IPCServer, request: web.Request) -> web.Response:
+        args = request.query if request.method == "GET" else await _get_body(request)
+        try:
+            # Acquiring may connect and authorise the account on first use.
+            client = await self.daemon.acquire_client(args.get("account", ""))
+            if not client:
+                return _error_response("No client for account", 404)
+            return _json_response(await handler(self, args, client))
+        except Exception as e:
+            return _handle_exception(e)
+
+    return wrapper
+
+
 class IPCServer:
     def __init__(self, daemon: DaemonServer, socket_path: str):
         self.daemon = daemon
@@ -129,347 +180,162 @@ class IPCServer:
 
     # -- Messages --
 
-    async def _message_send(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.send_message(
-                body["chat"],
-                body.get("text", ""),
-                reply_to=body.get("reply_to"),
-                silent=body.get("silent", False),
-                file=body.get("file"),
-                caption=body.get("caption"),
-            )
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
-
-    async def _message_list(self, request: web.Request) -> web.Response:
-        q = request.query
-        account = q.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            msgs = await client.get_messages(
-                q["chat"],
-                limit=int(q.get("limit", 20)),
-                offset_id=int(q.get("offset_id", 0)),
-                include_sender=q.get("sender") == "1",
-                include_media=q.get("media") == "1",
-                include_reactions=q.get("reactions") == "1",
-                include_entities=q.get("entities") == "1",
-            )
-            return _json_response({"messages": msgs})
-        except Exception as e:
-            return _handle_exception(e)
-
-    async def _message_get(self, request: web.Request) -> web.Response:
-        q = request.query
-        account = q.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            msg = await client.get_message(q["chat"], int(q["msg_id"]))
-            return _json_response(msg)
-        except Exception as e:
-            return _handle_exception(e)
-
-    async def _message_delete(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            deleted = await client.delete_messages(body["chat"], body["msg_ids"])
-            return _json_response({"deleted": deleted})
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _message_send(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.send_message(
+            _peer_ref(body["chat"]),
+            body.get("text", ""),
+            reply_to=body.get("reply_to"),
+            silent=body.get("silent", False),
+            file=body.get("file"),
+            caption=body.get("caption"),
+        )
 
-    async def _message_search(self, request: web.Request) -> web.Response:
-        q = request.query
-        account = q.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            msgs = await client.search_messages(
-                q["chat"],
-                q.get("query", ""),
-                limit=int(q.get("limit", 20)),
-                local=q.get("local") == "1",
-                regex=q.get("regex"),
-            )
-            return _json_response({"messages": msgs})
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _message_list(self, q: Mapping[str, Any], client: ClientWrapper) -> Any:
+        msgs = await client.get_messages(
+            _peer_ref(q["chat"]),
+            limit=int(q.get("limit", 20)),
+            offset_id=int(q.get("offset_id", 0)),
+            include_sender=q.get("sender") == "1",
+            include_media=q.get("media") == "1",
+            include_reactions=q.get("reactions") == "1",
+            include_entities=q.get("entities") == "1",
+        )
+        return {"messages": msgs}
+
+    @_with_client
+    async def _message_get(self, q: Mapping[str, Any], client: ClientWrapper) -> Any:
+        return await client.get_message(_peer_ref(q["chat"]), int(q["msg_id"]))
+
+    @_with_client
+    async def _message_delete(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        deleted = await client.delete_messages(_peer_ref(body["chat"]), body["msg_ids"])
+        return {"deleted": deleted}
+
+    @_with_client
+    async def _message_search(self, q: Mapping[str, Any], client: ClientWrapper) -> Any:
+        msgs = await client.search_messages(
+            _peer_ref(q["chat"]),
+            q.get("query", ""),
+            limit=int(q.get("limit", 20)),
+            offset_id=int(q.get("offset_id", 0)),
+            local=q.get("local") == "1",
+            regex=q.get("regex"),
+        )
+        return {"messages": msgs}
 
-    async def _message_pin(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.pin_message(body["chat"], body["msg_id"])
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _message_pin(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.pin_message(_peer_ref(body["chat"]), body["msg_id"])
 
-    async def _message_react(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.react_to_message(body["chat"], body["msg_id"], body["emoji"])
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _message_react(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.react_to_message(_peer_ref(body["chat"]), body["msg_id"], body["emoji"])
 
-    async def _message_read(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.mark_read(body["chat"], up_to=body.get("up_to"))
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _message_read(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.mark_read(_peer_ref(body["chat"]), up_to=body.get("up_to"))
 
     # -- Chats --
 
-    async def _chat_list(self, request: web.Request) -> web.Response:
-        q = request.query
-        account = q.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            chats: list[dict[str, Any]] = []
-            async for c in client.list_chats(
+    @_with_client
+    async def _chat_list(self, q: Mapping[str, Any], client: ClientWrapper) -> Any:
+        chats = [
+            c async for c in client.list_chats(
                 limit=int(q.get("limit", 100)) if q.get("limit") else None,
                 chat_type=q.get("type"),
                 search=q.get("search"),
-            ):
-                chats.append(c)
-            return _json_response({"chats": chats})
-        except Exception as e:
-            return _handle_exception(e)
-
-    async def _chat_get(self, request: web.Request) -> web.Response:
-        q = request.query
-        account = q.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            info = await client.get_chat_info(q["chat"])
-            return _json_response(info)
-        except Exception as e:
-            return _handle_exception(e)
-
-    async def _chat_create(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.create_chat(
-                body["name"],
-                chat_type=body.get("type", "group"),
-                members=body.get("members"),
             )
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
+        ]
+        return {"chats": chats}
+
+    @_with_client
+    async def _chat_get(self, q: Mapping[str, Any], client: ClientWrapper) -> Any:
+        return await client.get_chat_info(_peer_ref(q["chat"]))
+
+    @_with_client
+    async def _chat_create(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.create_chat(
+            body["name"],
+            chat_type=body.get("type", "group"),
+            members=body.get("members"),
+        )
 
-    async def _chat_archive(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.archive_chat(body["chat"])
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _chat_archive(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.archive_chat(_peer_ref(body["chat"]))
 
-    async def _chat_mute(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.mute_chat(body["chat"], body.get("duration"))
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _chat_mute(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.mute_chat(_peer_ref(body["chat"]), body.get("duration"))
 
-    async def _chat_leave(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.leave_chat(body["chat"])
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _chat_leave(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.leave_chat(_peer_ref(body["chat"]))
 
-    async def _chat_typing(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.send_typing(body["chat"], duration=body.get("duration", 5))
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _chat_typing(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.send_typing(_peer_ref(body["chat"]), duration=body.get("duration", 5))
 
     # -- Contacts --
 
-    async def _contact_list(self, request: web.Request) -> web.Response:
-        q = request.query
-        account = q.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            contacts = await client.list_contacts()
-            return _json_response({"contacts": contacts})
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _contact_list(self, q: Mapping[str, Any], client: ClientWrapper) -> Any:
+        contacts = await client.list_contacts()
+        return {"contacts": contacts}
 
-    async def _contact_add(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.add_contact(body["phone"], body.get("name", ""))
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _contact_add(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.add_contact(body["phone"], body.get("name", ""))
 
-    async def _contact_remove(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.remove_contact(body["user"])
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _contact_remove(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.remove_contact(body["user"])
 
-    async def _contact_search(self, request: web.Request) -> web.Response:
-        q = request.query
-        account = q.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            contacts = await client.search_contacts(q.get("query", ""))
-            return _json_response({"contacts": contacts})
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _contact_search(self, q: Mapping[str, Any], client: ClientWrapper) -> Any:
+        contacts = await client.search_contacts(q.get("query", ""))
+        return {"contacts": contacts}
 
     # -- Users --
 
-    async def _user_get(self, request: web.Request) -> web.Response:
-        q = request.query
-        account = q.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            info = await client.get_user_info(q["user"])
-            return _json_response(info)
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _user_get(self, q: Mapping[str, Any], client: ClientWrapper) -> Any:
+        return await client.get_user_info(q["user"])
 
     # -- Profile --
 
-    async def _profile_get(self, request: web.Request) -> web.Response:
-        q = request.query
-        account = q.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            profile = await client.get_profile()
-            return _json_response(profile)
-        except Exception as e:
-            return _handle_exception(e)
-
-    async def _profile_update(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.update_profile(
-                first_name=body.get("first_name"),
-                last_name=body.get("last_name"),
-                bio=body.get("bio"),
-                photo=body.get("photo"),
-            )
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _profile_get(self, q: Mapping[str, Any], client: ClientWrapper) -> Any:
+        return await client.get_profile()
+
+    @_with_client
+    async def _profile_update(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.update_profile(
+            first_name=body.get("first_name"),
+            last_name=body.get("last_name"),
+            bio=body.get("bio"),
+            photo=body.get("photo"),
+        )
 
     # -- Media --
 
-    async def _media_download(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.download_media(
-                body["chat"],
-                body["msg_id"],
-                out_dir=body.get("out_dir"),
-            )
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _media_download(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.download_media(
+            _peer_ref(body["chat"]),
+            body["msg_id"],
+            out_dir=body.get("out_dir"),
+        )
 
-    async def _media_upload(self, request: web.Request) -> web.Response:
-        body = await _get_body(request)
-        account = body.get("account", "")
-        client = self.daemon.get_client(account)
-        if not client:
-            return _error_response("No client for account", 404)
-        try:
-            result = await client.upload_file(
-                body["chat"],
-                body["path"],
-                caption=body.get("caption", ""),
-            )
-            return _json_response(result)
-        except Exception as e:
-            return _handle_exception(e)
+    @_with_client
+    async def _media_upload(self, body: dict[str, Any], client: ClientWrapper) -> Any:
+        return await client.upload_file(
+            _peer_ref(body["chat"]),
+            body["path"],
+            caption=body.get("caption", ""),
+        )
 
     # -- Jobs --
 
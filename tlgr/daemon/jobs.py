@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -29,19 +30,34 @@ class JobRunner:
         return job
 
     async def start_all(self) -> None:
+        started = []
         for name, job in self._jobs.items():
             if job.enabled:
                 job.start()
-                log.info("Started job: %s", name)
+                started.append(name)
+        # One record for the whole set rather than one per job.
+        if started:
+            log.info("Started %d job(s): %s", len(started), ", ".join(started))
 
     async def stop_all(self) -> None:
-        for name, job in self._jobs.items():
-            await job.stop()
-            log.info("Stopped job: %s", name)
+        # Jobs stop independently; cancel them together rather than in turn.
+        jobs = list(self._jobs.items())
+        results = await asyncio.gather(*(job.stop() for _, job in jobs), return_exceptions=True)
+        stopped = []
+        for (name, _), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                log.error("Stopping job %s failed: %s", name, result)
+            else:
+                stopped.append(name)
+        if stopped:
+            log.info("Stopped %d job(s): %s", len(stopped), ", ".join(stopped))
 
     def list_jobs(self) -> list[dict[str, Any]]:
         return [j.status() for j in self._jobs.values()]
 
+    def has_running(self) -> bool:
+        return any(j.running for j in self._jobs.values())
+
     async def remove_job(self, name: str) -> bool:
         job = self._jobs.pop(name, None)
         if job is None:
@@ -9,30 +9,19 @@ from __future__ import annotations
 import os
 import plistlib
 import subprocess
-import sys
 from pathlib import Path
 
 SERVICE_LABEL = "dev.tlgr.daemon"
 PLIST_PATH = Path.home() / "Library" / "LaunchAgents" / f"{SERVICE_LABEL}.plist"
 
 
-def _python_executable() -> str:
-    """Return the absolute path to the current Python interpreter."""
-    return sys.executable
-
-
 def _build_plist(base: Path, log_dir: Path) -> dict:
+    from tlgr.daemon.lifecycle import daemon_argv
+
     log_dir.mkdir(parents=True, exist_ok=True)
     return {
         "Label": SERVICE_LABEL,
-        "ProgramArguments": [
-            _python_executable(),
-            "-m",
-            "tlgr.daemon.server",
-            "--base",
-            str(base),
-            "--foreground",
-        ],
+        "ProgramArguments": [*daemon_argv(base), "--foreground"],
         "RunAtLoad": True,
         "KeepAlive": {"SuccessfulExit": False},
         "ThrottleInterval": 30,
@@ -7,9 +7,14 @@ import logging
 import os
 import signal
 import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from tlgr.core.config import get_pid_path, get_logs_dir, get_socket_path
+from tlgr.core.paths import get_pid_path, get_logs_dir, get_socket_path
+
+if TYPE_CHECKING:
+    import subprocess
 
 log = logging.getLogger("tlgr.daemon")
 
@@ -27,16 +32,24 @@ def _cleanup(base: Path | None = None) -> None:
 
 
 def read_pid(base: Path | None = None) -> int | None:
+    """Return the daemon's PID if it is running, else None.
+
+    A stale or unreadable PID file is removed.
+    """
     pid_path = get_pid_path(base)
-    if not pid_path.exists():
-        return None
     try:
         pid = int(pid_path.read_text().strip())
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        pid_path.unlink(missing_ok=True)
+        return None
+    try:
         os.kill(pid, 0)
-        return pid
-    except (ValueError, ProcessLookupError, PermissionError):
+    except (ProcessLookupError, PermissionError):
         pid_path.unlink(missing_ok=True)
         return None
+    return pid
 
 
 def daemonize(base: Path | None = None) -> None:
@@ -84,3 +97,38 @@ def stop_daemon(base: Path | None = None) -> bool:
     except ProcessLookupError:
         get_pid_path(base).unlink(missing_ok=True)
         return False
+
+
+def daemon_argv(base: Path) -> list[str]:
+    """Command line that runs the daemon for *base* under this interpreter."""
+    return [sys.executable, "-m", "tlgr.daemon.server", "--base", str(base)]
+
+
+def spawn_daemon(base: Path) -> subprocess.Popen:
+    """Start the daemon for *base* in a new session, detached from our stdio."""
+    import subprocess
+
+    return subprocess.Popen(
+        daemon_argv(base),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def wait_for_socket(base: Path | None = None, timeout: float = 10.0) -> bool:
+    """Wait until the daemon's IPC socket exists; False after *timeout* seconds.
+
+    Polls every 0.1s at first and backs off to 0.5s, so a daemon that comes
+    up quickly is noticed quickly without spinning on a slow one.
+    """
+    sock = get_socket_path(base)
+    deadline = time.monotonic() + timeout
+    wait = 0.1
+    while True:
+        time.sleep(wait)
+        if sock.exists():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        wait = min(wait * 1.3, 0.5)
@@ -13,9 +13,9 @@ import signal
 import sys
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
-from tlgr.core.accounts import AccountManager
+from tlgr.core.accounts import AccountManager, open_account_manager
 from tlgr.core.client import ClientWrapper
 from tlgr.core.config import (
     CONFIG_DIR,
@@ -36,6 +36,7 @@ class DaemonServer:
     def __init__(self, base: Path | None = None):
         self.base = base or CONFIG_DIR
         self._clients: dict[str, ClientWrapper] = {}
+        self._connect_locks: dict[str, asyncio.Lock] = {}
         self._job_runner = JobRunner()
         self._webhook: WebhookPusher | None = None
         self._ipc: IPCServer | None = None
@@ -43,9 +44,23 @@ class DaemonServer:
         self._start_time = time.time()
         self._last_ipc_time = time.time()
         self._idle_timeout: int = 1800  # 30 minutes default
+        self._flood_wait_max: int = 120
+        self._accounts: AccountManager | None = None
+        self._accounts_backend: str | None = None
 
     # -- Client management --
 
+    def _account_registry(self, backend: str | None = None) -> AccountManager:
+        """The account registry, opened once and reused by later lookups.
+
+        Passing a *backend* other than the one it was opened with (a config
+        reload switched ``[accounts] backend``) reopens it.
+        """
+        if self._accounts is None or (backend is not None and backend != self._accounts_backend):
+            self._accounts = open_account_manager(self.base, backend)
+            self._accounts_backend = backend
+        return self._accounts
+
     def get_client(self, account: str = "") -> ClientWrapper | None:
         if not account:
             if self._clients:
@@ -53,15 +68,29 @@ class DaemonServer:
             return None
         return self._clients.get(account)
 
+    async def acquire_client(self, account: str = "") -> ClientWrapper | None:
+        """Return the shared client for *account*, connecting it on first use.
+
+        Concurrent callers for the same alias wait on one connection attempt
+        instead of each doing its own handshake.
+        """
+        client = self.get_client(account)
+        if client is not None or not account:
+            return client
+        async with self._connect_locks.setdefault(account, asyncio.Lock()):
+            client = self._clients.get(account)
+            if client is None and self._account_registry().get_account(account) is not None:
+                client = await self._connect_account(account)
+        return client
+
     async def _connect_account(self, alias: str) -> ClientWrapper | None:
-        acct_mgr = AccountManager(self.base)
+        acct_mgr = self._account_registry()
         api_id, api_hash = acct_mgr.load_credentials(alias)
         if not api_id or not api_hash:
             log.warning("No credentials for account '%s'", alias)
             return None
         session_path = acct_mgr.get_session_path(alias)
-        flood_max = getattr(self, '_flood_wait_max', 120)
-        client = ClientWrapper(session_path, api_id, api_hash, flood_wait_max=flood_max)
+        client = ClientWrapper(session_path, api_id, api_hash, flood_wait_max=self._flood_wait_max)
         authorized = await client.connect()
         if not authorized:
             log.warning("Account '%s' not authorized — run 'tlgr account add' first", alias)
@@ -71,6 +100,19 @@ class DaemonServer:
         log.info("Connected account '%s' (%s)", alias, client.me.first_name)
         return client
 
+    async def _connect_accounts(self, aliases: Iterable[str]) -> None:
+        """Connect *aliases* concurrently; each handshake is an independent round-trip.
+
+        One account failing to connect is logged and does not stop the others.
+        """
+        aliases = [alias for alias in aliases if alias]
+        results = await asyncio.gather(
+            *(self._connect_account(alias) for alias in aliases), return_exceptions=True,
+        )
+        for alias, result in zip(aliases, results):
+            if isinstance(result, Exception):
+                log.warning("Could not connect account '%s': %s: %s", alias, type(result).__name__, result)
+
     # -- Webhook event handlers --
 
     async def _setup_event_handlers(self) -> None:
@@ -145,9 +187,12 @@ class DaemonServer:
 
     async def reload_jobs(self) -> dict[str, Any]:
         """Hot-reload jobs from jobs.yaml without restarting the daemon."""
-        new_configs = load_gateway_configs(self.base)
-        app_config = load_app_config(self.base)
-        acct_mgr = AccountManager(self.base)
+        # Parsing the config files is blocking disk work; keep it off the loop.
+        new_configs, app_config = await asyncio.gather(
+            asyncio.to_thread(load_gateway_configs, self.base),
+            asyncio.to_thread(load_app_config, self.base),
+        )
+        acct_mgr = self._account_registry(app_config.account_backend)
         default_account = app_config.default_account or acct_mgr.get_active() or ""
 
         old_names = set(self._job_runner._jobs.keys())
@@ -157,6 +202,12 @@ class DaemonServer:
         added = new_names - old_names
         updated = old_names & new_names
 
+        # Connect the accounts the new jobs need together, before any job is
+        # stopped, rather than one handshake per job in turn.
+        wanted = dict.fromkeys(jc.account or default_account for jc in new_configs if jc.enabled)
+        aliases = [a for a in wanted if a]
+        clients = dict(zip(aliases, await asyncio.gather(*(self.acquire_client(a) for a in aliases))))
+
         for name in removed:
             await self._job_runner.remove_job(name)
 
@@ -167,11 +218,7 @@ class DaemonServer:
                 if not jc.enabled:
                     continue
                 acct = jc.account or default_account
-                client = self._clients.get(acct)
-                if not client:
-                    acct_needed = acct
-                    if acct_needed:
-                        client = await self._connect_account(acct_needed)
+                client = clients.get(acct)
                 if not client:
                     log.warning("Job '%s' references unknown account '%s'", jc.name, acct)
                     continue
@@ -209,9 +256,8 @@ class DaemonServer:
             return
         while not self._shutdown_event.is_set():
             await asyncio.sleep(60)
-            active_jobs = [j for j in self._job_runner.list_jobs() if j.get("running")]
             idle_seconds = time.time() - self._last_ipc_time
-            if not active_jobs and idle_seconds >= self._idle_timeout:
+            if not self._job_runner.has_running() and idle_seconds >= self._idle_timeout:
                 log.info("Daemon idle for %ds with no active jobs — shutting down", int(idle_seconds))
                 self.request_shutdown()
                 return
@@ -231,7 +277,9 @@ class DaemonServer:
 
         # Determine which accounts to connect
         accounts_needed: set[str] = set()
-        acct_mgr = AccountManager(self.base)
+        acct_mgr = self._account_registry(app_config.account_backend)
+        # get_active() falls back to the first registered account, so this
+        # one lookup also covers "connect whatever account exists".
         default_account = app_config.default_account or acct_mgr.get_active() or ""
 
         for jc in job_configs:
@@ -241,15 +289,7 @@ class DaemonServer:
         if not accounts_needed and default_account:
             accounts_needed.add(default_account)
 
-        if not accounts_needed and acct_mgr.has_accounts():
-            active = acct_mgr.get_active()
-            if active:
-                accounts_needed.add(active)
-
-        # Connect accounts
-        for alias in accounts_needed:
-            if alias:
-                await self._connect_account(alias)
+        await self._connect_accounts(accounts_needed)
 
         if not self._clients:
             log.warning("No accounts connected — daemon will serve IPC only")
@@ -262,12 +302,15 @@ class DaemonServer:
         if webhook_config.filters.chats and self._clients:
             resolved: set[int] = set()
             client = next(iter(self._clients.values()))
-            for chat_ref in webhook_config.filters.chats:
-                try:
-                    cid = await client.resolve_chat(chat_ref)
-                    resolved.add(cid)
-                except Exception:
+            chat_refs = webhook_config.filters.chats
+            results = await asyncio.gather(
+                *(client.resolve_chat(ref) for ref in chat_refs), return_exceptions=True,
+            )
+            for chat_ref, cid in zip(chat_refs, results):
+                if isinstance(cid, Exception):
                     log.warning("Could not resolve webhook chat filter: %s", chat_ref)
+                else:
+                    resolved.add(cid)
             self._webhook.set_resolved_chats(resolved)
 
         # Setup event handlers for webhook
@@ -318,8 +361,9 @@ class DaemonServer:
         await self._webhook.stop()
         if self._ipc:
             await self._ipc.stop()
-        for client in self._clients.values():
-            await client.disconnect()
+        await asyncio.gather(
+            *(client.disconnect() for client in self._clients.values()), return_exceptions=True,
+        )
         log.info("Daemon stopped")
 
 
@@ -352,6 +396,21 @@ def _serialize_event(event) -> dict[str, Any]:
     return data
 
 
+def run_daemon(server: DaemonServer) -> None:
+    """Run *server* until shutdown, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(server.run())
+        return
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(server.run())
+    else:
+        uvloop.install()
+        asyncio.run(server.run())
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="tlgr daemon")
     parser.add_argument("--base", type=str, default=str(CONFIG_DIR))
@@ -373,7 +432,7 @@ def main() -> None:
         daemonize(base)
 
     server = DaemonServer(base)
-    asyncio.run(server.run())
+    run_daemon(server)
 
 
 if __name__ == "__main__":
@@ -110,7 +110,8 @@ class WebhookPusher:
                 await asyncio.sleep(wait)
 
         log.error("Webhook push exhausted retries for event %s — writing to dead letter", event_type)
-        self._write_dead_letter(payload)
+        # File I/O would stall every other handler on the loop; do it off-thread.
+        await asyncio.to_thread(self._write_dead_letter, payload)
 
     def _write_dead_letter(self, payload: dict[str, Any]) -> None:
         """Append a failed event to the dead-letter file."""
@@ -9,6 +9,8 @@ Modules in this package auto-register their filters on import.
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Any, Callable
 
 from tlgr.gateway.event import Event
@@ -34,6 +36,12 @@ def list_filters() -> list[str]:
     return list(_REGISTRY.keys())
 
 
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a case-insensitive filter pattern once per distinct string."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
 # Import built-in filter modules so they self-register.
 from tlgr.filters import context, content, message, temporal, user  # noqa: E402, F401
 from tlgr.filters.compose import evaluate, parse_filter_config  # noqa: E402, F401
@@ -14,6 +14,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from tlgr.filters import FilterFunc, get_filter
 from tlgr.gateway.event import Event
 
 
@@ -30,6 +31,8 @@ class FilterNode:
     children: list[FilterNode] = field(default_factory=list)
     filter_name: str = ""
     filter_value: Any = None
+    # Bound when the leaf is parsed so evaluation skips the registry lookup.
+    func: FilterFunc | None = field(default=None, compare=False)
 
     def __repr__(self) -> str:
         if self.op is Op.LEAF:
@@ -58,7 +61,9 @@ def parse_filter_config(raw: dict[str, Any] | None) -> FilterNode | None:
                 inner = FilterNode(op=Op.OR, children=or_children)
                 and_children.append(FilterNode(op=Op.NOT, children=[inner]))
         else:
-            and_children.append(FilterNode(op=Op.LEAF, filter_name=key, filter_value=value))
+            and_children.append(
+                FilterNode(op=Op.LEAF, filter_name=key, filter_value=value, func=get_filter(key))
+            )
 
     if not and_children:
         return None
@@ -89,8 +94,7 @@ def evaluate(node: FilterNode | None, event: Event) -> tuple[bool, str]:
         return True, "no filters"
 
     if node.op is Op.LEAF:
-        from tlgr.filters import get_filter
-        func = get_filter(node.filter_name)
+        func = node.func or get_filter(node.filter_name)
         if func is None:
             return False, f"unknown filter: {node.filter_name}"
         return func(event, node.filter_value)
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
+from functools import lru_cache
 from typing import Any
 
-from tlgr.filters import register_filter
+from tlgr.filters import compile_pattern, register_filter
 from tlgr.gateway.event import Event
 
 
@@ -19,13 +19,26 @@ def _text(event: Event) -> str:
     return ""
 
 
+@lru_cache(maxsize=256)
+def _fold_keywords(keywords: tuple[Any, ...]) -> tuple[tuple[Any, str], ...]:
+    """Pair each keyword with its lowercased form, once per distinct value."""
+    return tuple((kw, str(kw).lower()) for kw in keywords)
+
+
+def _keywords(value: Any) -> tuple[tuple[Any, str], ...]:
+    keywords = tuple(value) if isinstance(value, list) else (value,)
+    try:
+        return _fold_keywords(keywords)
+    except TypeError:  # unhashable entries in a hand-written config
+        return _fold_keywords.__wrapped__(keywords)
+
+
 @register_filter("contains")
 def filter_contains(event: Event, value: Any) -> tuple[bool, str]:
     """All keywords must appear (AND).  Value: list[str]."""
     text = _text(event)
-    keywords = value if isinstance(value, list) else [value]
-    for kw in keywords:
-        if str(kw).lower() not in text:
+    for kw, folded in _keywords(value):
+        if folded not in text:
             return False, f"missing keyword: {kw}"
     return True, "all keywords found"
 
@@ -34,8 +47,7 @@ def filter_contains(event: Event, value: Any) -> tuple[bool, str]:
 def filter_contains_any(event: Event, value: Any) -> tuple[bool, str]:
     """At least one keyword must appear (OR).  Value: list[str]."""
     text = _text(event)
-    keywords = value if isinstance(value, list) else [value]
-    if any(str(kw).lower() in text for kw in keywords):
+    if any(folded in text for _, folded in _keywords(value)):
         return True, "keyword matched"
     return False, "none of keywords found"
 
@@ -44,9 +56,8 @@ def filter_contains_any(event: Event, value: Any) -> tuple[bool, str]:
 def filter_excludes(event: Event, value: Any) -> tuple[bool, str]:
     """No listed keyword may appear.  Value: list[str]."""
     text = _text(event)
-    keywords = value if isinstance(value, list) else [value]
-    for kw in keywords:
-        if str(kw).lower() in text:
+    for kw, folded in _keywords(value):
+        if folded in text:
             return False, f"excluded keyword: {kw}"
     return True, "no excluded keywords"
 
@@ -61,7 +72,7 @@ def filter_regex(event: Event, value: Any) -> tuple[bool, str]:
         text = str(event.raw.get("text", ""))
     else:
         text = ""
-    if re.search(str(value), text, re.IGNORECASE):
+    if compile_pattern(str(value)).search(text):
         return True, "regex matched"
     return False, "regex not matched"
 
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
+from functools import lru_cache
 from typing import Any
 
-from tlgr.filters import register_filter
+from tlgr.filters import compile_pattern, register_filter
 from tlgr.gateway.event import Event
 
 
@@ -35,15 +35,29 @@ def filter_chat_type(event: Event, value: Any) -> tuple[bool, str]:
         actual = "unknown"
 
     # Telethon doesn't expose supergroup directly on the event; check the chat entity.
-    if actual == "group" and hasattr(tg, "chat") and hasattr(tg.chat, "megagroup"):
-        if tg.chat.megagroup:
-            actual = "supergroup"
+    if actual == "group" and getattr(getattr(tg, "chat", None), "megagroup", False):
+        actual = "supergroup"
 
     if actual in expected:
         return True, f"chat_type={actual}"
     return False, f"chat_type {actual} not in {expected}"
 
 
+@lru_cache(maxsize=256)
+def _numeric_ids(refs: tuple[Any, ...]) -> frozenset[int]:
+    """Parse the numeric refs of a ``chat_id`` value once per distinct value.
+
+    ``@username`` refs are skipped; the gateway pre-resolves those into ids.
+    """
+    ids = set()
+    for ref in refs:
+        try:
+            ids.add(int(ref))
+        except (ValueError, TypeError):
+            pass
+    return frozenset(ids)
+
+
 @register_filter("chat_id")
 def filter_chat_id(event: Event, value: Any) -> tuple[bool, str]:
     """Match by chat ID or @username.  Value may be a single ref or a list."""
@@ -54,16 +68,12 @@ def filter_chat_id(event: Event, value: Any) -> tuple[bool, str]:
     refs = value if isinstance(value, list) else [value]
     chat_id = tg.chat_id
 
-    for ref in refs:
-        try:
-            if int(ref) == chat_id:
-                return True, f"chat_id matched {ref}"
-        except (ValueError, TypeError):
-            pass
-        # @username matching requires entity resolution at setup time;
-        # the gateway pre-resolves these into the filter value.
-        if isinstance(ref, str) and ref.startswith("@"):
-            continue
+    try:
+        ids = _numeric_ids(tuple(refs))
+    except TypeError:  # unhashable entries in a hand-written config
+        ids = _numeric_ids.__wrapped__(refs)
+    if chat_id in ids:
+        return True, f"chat_id matched {chat_id}"
 
     return False, f"chat_id {chat_id} not in {refs}"
 
@@ -75,7 +85,7 @@ def filter_chat_title(event: Event, value: Any) -> tuple[bool, str]:
     if tg is None:
         return False, "chat_title requires telegram source"
     title = getattr(tg.chat, "title", "") or ""
-    if re.search(str(value), title, re.IGNORECASE):
+    if compile_pattern(str(value)).search(title):
         return True, f"chat_title matched"
     return False, f"chat_title '{title}' does not match '{value}'"
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from tlgr.filters import register_filter
@@ -30,10 +31,14 @@ class MessageType(Enum):
     UNSUPPORTED = "unsupported"
 
 
-def detect_message_type(message) -> MessageType:
+@lru_cache(maxsize=1)
+def _media_types() -> dict[type, MessageType]:
+    """Media classes whose message type needs no further inspection.
+
+    Built on first use so importing this module doesn't pull in Telethon.
+    """
     from telethon.tl.types import (
         MessageMediaPhoto,
-        MessageMediaDocument,
         MessageMediaPoll,
         MessageMediaGeo,
         MessageMediaGeoLive,
@@ -42,33 +47,39 @@ def detect_message_type(message) -> MessageType:
         MessageMediaGame,
         MessageMediaInvoice,
         MessageMediaDice,
+    )
+
+    return {
+        MessageMediaPhoto: MessageType.PHOTO,
+        MessageMediaPoll: MessageType.POLL,
+        MessageMediaGeoLive: MessageType.LIVE_LOCATION,
+        MessageMediaGeo: MessageType.LOCATION,
+        MessageMediaContact: MessageType.CONTACT,
+        MessageMediaGame: MessageType.GAME,
+        MessageMediaInvoice: MessageType.INVOICE,
+        MessageMediaDice: MessageType.DICE,
+        MessageMediaWebPage: MessageType.WEBPAGE,
+    }
+
+
+def detect_message_type(message) -> MessageType:
+    if not message.media:
+        return MessageType.TEXT
+    media = message.media
+    # Telethon's TL classes are leaves, so one dict lookup replaces the
+    # isinstance chain for every non-document media type.
+    known = _media_types().get(type(media))
+    if known is not None:
+        return known
+
+    from telethon.tl.types import (
+        MessageMediaDocument,
         DocumentAttributeSticker,
         DocumentAttributeVideo,
         DocumentAttributeAudio,
         DocumentAttributeAnimated,
     )
 
-    if not message.media:
-        return MessageType.TEXT
-    media = message.media
-    if isinstance(media, MessageMediaPhoto):
-        return MessageType.PHOTO
-    if isinstance(media, MessageMediaPoll):
-        return MessageType.POLL
-    if isinstance(media, MessageMediaGeoLive):
-        return MessageType.LIVE_LOCATION
-    if isinstance(media, MessageMediaGeo):
-        return MessageType.LOCATION
-    if isinstance(media, MessageMediaContact):
-        return MessageType.CONTACT
-    if isinstance(media, MessageMediaGame):
-        return MessageType.GAME
-    if isinstance(media, MessageMediaInvoice):
-        return MessageType.INVOICE
-    if isinstance(media, MessageMediaDice):
-        return MessageType.DICE
-    if isinstance(media, MessageMediaWebPage):
-        return MessageType.WEBPAGE
     if isinstance(media, MessageMediaDocument):
         doc = media.document
         if doc is None:
@@ -107,16 +118,34 @@ def is_forwardable(message) -> tuple[bool, str]:
     return True, ""
 
 
+@lru_cache(maxsize=256)
+def _fold_types(value: tuple[Any, ...]) -> frozenset[str]:
+    """Normalise a types value (list or ``"photo,video"``) into a set, once per value."""
+    names = set()
+    for item in value:
+        names.update(part.strip().lower() for part in str(item).split(","))
+    names.discard("")
+    return frozenset(names)
+
+
+def _type_set(value: Any) -> frozenset[str]:
+    items = tuple(value) if isinstance(value, list) else (value,)
+    try:
+        return _fold_types(items)
+    except TypeError:  # unhashable entries in a hand-written config
+        return _fold_types.__wrapped__(items)
+
+
 @register_filter("types")
 def filter_types(event: Event, value: Any) -> tuple[bool, str]:
     """Message type must be in *value*.  Value: list[str]."""
     if event.source != "telegram":
         return False, "types requires telegram source"
     mt = detect_message_type(event.raw.message)
-    allowed = value if isinstance(value, list) else [value]
+    allowed = _type_set(value)
     if mt.value in allowed:
         return True, f"type={mt.value}"
-    return False, f"type {mt.value} not in {allowed}"
+    return False, f"type {mt.value} not in {sorted(allowed)}"
 
 
 @register_filter("exclude_types")
@@ -125,8 +154,7 @@ def filter_exclude_types(event: Event, value: Any) -> tuple[bool, str]:
     if event.source != "telegram":
         return False, "exclude_types requires telegram source"
     mt = detect_message_type(event.raw.message)
-    excluded = value if isinstance(value, list) else [value]
-    if mt.value in excluded:
+    if mt.value in _type_set(value):
         return False, f"type {mt.value} excluded"
     return True, f"type {mt.value} allowed"
 
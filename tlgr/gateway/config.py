@@ -6,6 +6,9 @@ Parses ``~/.tlgr/jobs.yaml`` into :class:`GatewayConfig` objects that the
 
 from __future__ import annotations
 
+import copy
+import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -101,22 +104,50 @@ def _parse_job(raw: dict[str, Any]) -> GatewayConfig:
     return cfg
 
 
+# Parsed YAML keyed by absolute path, as (st_mtime_ns, st_size, data).
+_yaml_cache: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+
+def _load_yaml(path: Path) -> Any:
+    """Parse *path*, reusing the last result while its mtime and size are unchanged.
+
+    Returns a deep copy on every call: the raw dicts end up in
+    ``ActionConfig.config``, so a caller mutating one must not change what
+    the next load sees. Raises :class:`FileNotFoundError` if *path* is missing.
+    """
+    key = os.path.abspath(path)
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        cached = _yaml_cache.get(key)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _yaml_cache.move_to_end(key)
+            return copy.deepcopy(cached[2])
+
+        try:
+            import yaml
+        except ModuleNotFoundError as e:
+            raise ConfigurationError(
+                "PyYAML is required for jobs.yaml support. Install with: pip install pyyaml"
+            ) from e
+
+        # libyaml's loader parses several times faster when PyYAML was built with it.
+        data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+    _yaml_cache[key] = (st.st_mtime_ns, st.st_size, data)
+    _yaml_cache.move_to_end(key)
+    if len(_yaml_cache) > _YAML_CACHE_MAX:
+        _yaml_cache.popitem(last=False)
+    return copy.deepcopy(data)
+
+
 def load_gateway_configs(base: Path | None = None) -> list[GatewayConfig]:
     """Load all gateway jobs from ``jobs.yaml``."""
     base = base or CONFIG_DIR
-    jobs_path = base / "jobs.yaml"
-    if not jobs_path.exists():
-        return []
-
     try:
-        import yaml
-    except ModuleNotFoundError as e:
-        raise ConfigurationError(
-            "PyYAML is required for jobs.yaml support. Install with: pip install pyyaml"
-        ) from e
-
-    with open(jobs_path, "r") as f:
-        data = yaml.safe_load(f)
+        data = _load_yaml(base / "jobs.yaml")
+    except FileNotFoundError:
+        return []
 
     if not data or "jobs" not in data:
         return []
@@ -124,6 +155,47 @@ def load_gateway_configs(base: Path | None = None) -> list[GatewayConfig]:
     return [_parse_job(j) for j in data["jobs"] if isinstance(j, dict)]
 
 
+# Problems found in jobs.yaml, keyed by (absolute path, st_mtime_ns, st_size).
+_validation_cache: OrderedDict[tuple[str, int, int], list[str]] = OrderedDict()
+_VALIDATION_CACHE_MAX = 32
+
+
+def validate_gateway_configs(base: Path | None = None) -> list[str]:
+    """Return the problems in ``jobs.yaml``; empty when it is valid or absent.
+
+    The result is remembered for the file's mtime and size, so checking an
+    unchanged file again skips the walk over its jobs and actions.
+    """
+    from tlgr.actions import get_action
+
+    base = base or CONFIG_DIR
+    path = base / "jobs.yaml"
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return []
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    cached = _validation_cache.get(key)
+    if cached is not None:
+        _validation_cache.move_to_end(key)
+        return list(cached)
+
+    errors: list[str] = []
+    for cfg in load_gateway_configs(base):
+        if not cfg.name:
+            errors.append("jobs.yaml: job missing 'name' field")
+        if not cfg.actions:
+            errors.append(f"jobs.yaml: job '{cfg.name}' has no actions")
+        for ac in cfg.actions:
+            if get_action(ac.name) is None:
+                errors.append(f"jobs.yaml: job '{cfg.name}' has unknown action '{ac.name}'")
+
+    _validation_cache[key] = errors
+    if len(_validation_cache) > _VALIDATION_CACHE_MAX:
+        _validation_cache.popitem(last=False)
+    return list(errors)
+
+
 def save_gateway_configs(configs: list[GatewayConfig], base: Path | None = None) -> None:
     """Serialize gateway configs back to ``jobs.yaml`` (minimal round-trip)."""
     base = base or CONFIG_DIR
@@ -151,3 +223,5 @@ def save_gateway_configs(configs: list[GatewayConfig], base: Path | None = None)
     with open(jobs_path, "w") as f:
         yaml.dump({"jobs": jobs_list}, f, default_flow_style=False, sort_keys=False)
     jobs_path.chmod(0o600)
+    # A rewrite within the filesystem's mtime granularity could keep the same stamp.
+    _yaml_cache.pop(os.path.abspath(jobs_path), None)
@@ -8,17 +8,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import Any, Iterator
 
 from telethon import events
 
 from tlgr.actions import get_action
 from tlgr.core.client import ClientWrapper
-from tlgr.filters.compose import evaluate
+from tlgr.filters.compose import FilterNode, Op, evaluate
 from tlgr.gateway.config import GatewayConfig, ActionConfig
 from tlgr.gateway.event import Event
 from tlgr.jobs.base import BaseJob
-from tlgr.processors import ProcessorChain
 
 log = logging.getLogger("tlgr.gateway")
 
@@ -36,6 +35,31 @@ class _GatewayJobConfig:
         self.account = gw.account
 
 
+# Chat refs resolved at once during setup; keeps a large config under Telegram's flood limits.
+_RESOLVE_CONCURRENCY = 8
+
+
+def _chat_id_leaves(node: FilterNode | None) -> Iterator[FilterNode]:
+    if node is None:
+        return
+    if node.op is Op.LEAF:
+        if node.filter_name == "chat_id":
+            yield node
+        return
+    for child in node.children:
+        yield from _chat_id_leaves(child)
+
+
+def _as_list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+def _forward_refs(ac: ActionConfig) -> list[Any]:
+    if ac.name != "forward":
+        return []
+    return _as_list(ac.config.get("to", []) if isinstance(ac.config, dict) else ac.config)
+
+
 _EVENT_TYPE_MAP = {
     "new_message": (events.NewMessage, {}),
     "message_edited": (events.MessageEdited, {}),
@@ -62,6 +86,7 @@ class Gateway(BaseJob):
         self._stats: dict[str, int] = {"matched": 0, "skipped": 0, "errors": 0}
 
     async def setup(self) -> None:
+        await self._resolve_chats()
         log.info(
             "[%s] events=%s filters=%s actions=%s",
             self.name,
@@ -70,6 +95,51 @@ class Gateway(BaseJob):
             [a.name for a in self._gw.actions],
         )
 
+    async def _resolve_chats(self) -> None:
+        """Resolve every chat ref the job names, concurrently.
+
+        ``chat_id`` filters only compare numeric ids, so each ``@username``
+        leaf gets its resolved id appended. Forward destinations are resolved
+        too, so the first relayed message finds them in the client's cache.
+        """
+        leaves = [
+            leaf
+            for node in (self._gw.filters, *(ac.filters for ac in self._gw.actions))
+            for leaf in _chat_id_leaves(node)
+        ]
+        refs = {
+            ref
+            for values in (
+                *(_as_list(leaf.filter_value) for leaf in leaves),
+                *(_forward_refs(ac) for ac in self._gw.actions),
+            )
+            for ref in values
+            if isinstance(ref, str)
+        }
+        if not refs:
+            return
+
+        sem = asyncio.Semaphore(_RESOLVE_CONCURRENCY)
+
+        async def bounded(ref: str) -> int:
+            async with sem:
+                return await self.client.resolve_chat(ref)
+
+        ordered = list(refs)
+        results = await asyncio.gather(*(bounded(r) for r in ordered), return_exceptions=True)
+        resolved: dict[str, int] = {}
+        for ref, result in zip(ordered, results):
+            if isinstance(result, Exception):
+                log.warning("[%s] could not resolve %s: %s", self.name, ref, result)
+            else:
+                resolved[ref] = result
+
+        for leaf in leaves:
+            values = _as_list(leaf.filter_value)
+            extra = [resolved[v] for v in values if isinstance(v, str) and v in resolved]
+            if extra:
+                leaf.filter_value = [*values, *extra]
+
     async def run(self) -> None:
         for event_type_name in self._gw.events:
             mapping = _EVENT_TYPE_MAP.get(event_type_name)
@@ -116,6 +186,7 @@ class Gateway(BaseJob):
         ok, reason = evaluate(self._gw.filters, envelope)
         if not ok:
             self._stats["skipped"] += 1
+            log.debug("[%s] skipped %s: %s", self.name, event_type, reason)
             return
 
         self._stats["matched"] += 1
@@ -127,6 +198,7 @@ class Gateway(BaseJob):
         if ac.filters:
             ok, reason = evaluate(ac.filters, envelope)
             if not ok:
+                log.debug("[%s] action %s skipped: %s", self.name, ac.name, reason)
                 return
 
         func = get_action(ac.name)
@@ -140,5 +212,10 @@ class Gateway(BaseJob):
         try:
             await func(envelope, ac.config, self.client, chain)
         except Exception as e:
-            log.warning("[%s] action '%s' failed: %s", self.name, ac.name, e)
+            # A flood can fail every event in a row; the stack is only worth
+            # formatting when someone is debugging.
+            log.warning(
+                "[%s] action '%s' failed: %s: %s", self.name, ac.name, type(e).__name__, e,
+                exc_info=log.isEnabledFor(logging.DEBUG),
+            )
             self._stats["errors"] += 1
@@ -2,50 +2,29 @@
 
 from __future__ import annotations
 
-import json
-import os
-import signal
-import subprocess
-import sys
-import time
 from pathlib import Path
 from typing import Any
 
-from tlgr.core.config import get_socket_path, get_pid_path, CONFIG_DIR, load_app_config
+from tlgr.core import jsonio
+from tlgr.core.paths import get_socket_path, get_pid_path, CONFIG_DIR
 from tlgr.core.errors import DaemonNotRunningError, DaemonError, IPCError, RateLimitError
+from tlgr.daemon.lifecycle import read_pid
 
 
 def _daemon_is_running(base: Path | None = None) -> int | None:
     """Return daemon PID if running, else None."""
-    pid_path = get_pid_path(base)
-    if not pid_path.exists():
-        return None
-    try:
-        pid = int(pid_path.read_text().strip())
-        os.kill(pid, 0)
-        return pid
-    except (ValueError, ProcessLookupError, PermissionError):
-        pid_path.unlink(missing_ok=True)
-        return None
+    return read_pid(base)
 
 
 def _auto_start_daemon(base: Path | None = None) -> None:
     """Fork and start the daemon in background with retry."""
+    from tlgr.daemon.lifecycle import spawn_daemon, wait_for_socket
+
     max_retries = 2
     for attempt in range(max_retries + 1):
-        proc = subprocess.Popen(
-            [sys.executable, "-m", "tlgr.daemon.server", "--base", str(base or CONFIG_DIR)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True,
-        )
-        sock_path = get_socket_path(base)
-        wait = 0.1
-        for _ in range(50):
-            time.sleep(wait)
-            if sock_path.exists():
-                return
-            wait = min(wait * 1.3, 0.5)
+        spawn_daemon(base or CONFIG_DIR)
+        if wait_for_socket(base, timeout=20.0):
+            return
         if attempt < max_retries:
             pid_path = get_pid_path(base)
             pid_path.unlink(missing_ok=True)
@@ -60,6 +39,8 @@ def _ensure_daemon(base: Path | None = None) -> None:
     """Ensure daemon is running; auto-start if configured."""
     if _daemon_is_running(base):
         return
+    from tlgr.core.config import load_app_config
+
     cfg = load_app_config(base)
     if cfg.daemon.auto_start:
         _auto_start_daemon(base)
@@ -96,7 +77,7 @@ def ipc_request(
 
     body_bytes = b""
     if body is not None:
-        body_bytes = json.dumps(body, default=str).encode()
+        body_bytes = jsonio.dumps(body, default=str)
 
     request_line = f"{method} {path} HTTP/1.1\r\n"
     headers = f"Host: localhost\r\nContent-Type: application/json\r\nContent-Length: {len(body_bytes)}\r\nConnection: close\r\n\r\n"
@@ -131,8 +112,8 @@ def ipc_request(
         body_part = _decode_chunked(body_part)
 
     try:
-        result = json.loads(body_part)
-    except json.JSONDecodeError:
+        result = jsonio.loads(body_part)
+    except ValueError:
         if status_code >= 400:
             raise IPCError(f"Daemon error ({status_code}): {body_part[:200]}")
         result = {"raw": body_part}
@@ -73,10 +73,14 @@ class BaseJob(ABC):
             except asyncio.CancelledError:
                 pass
 
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
     def status(self) -> dict[str, Any]:
         return {
             "name": self.name,
             "type": self.job_type,
             "enabled": self.enabled,
-            "running": self._task is not None and not self._task.done(),
+            "running": self.running,
         }
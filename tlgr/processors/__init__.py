@@ -61,27 +61,32 @@ class ProcessorChain:
         return len(self.processors)
 
 
+def _add_named(chain: ProcessorChain, item: str) -> None:
+    """Add ``"name"`` or ``"name:key=val:key=val"`` to *chain*."""
+    name, _, rest = item.partition(":")
+    config: dict[str, Any] = {}
+    if rest:
+        for segment in rest.split(":"):
+            key, sep, value = segment.partition("=")
+            if sep:
+                config[key] = value
+    chain.add(name, config)
+
+
 def create_chain_from_spec(spec: str) -> ProcessorChain:
     """Create from spec string like ``'replace_mentions,strip_formatting'``."""
     chain = ProcessorChain()
     if not spec:
         return chain
-    parts = re.split(r"(?<!\\),", spec)
+    # Only a spec with a backslash can contain an escaped comma.
+    if "\\" in spec:
+        parts = [p.replace("\\,", ",") for p in re.split(r"(?<!\\),", spec)]
+    else:
+        parts = spec.split(",")
     for part in parts:
-        part = part.strip().replace("\\,", ",")
-        if not part:
-            continue
-        if ":" in part:
-            segments = part.split(":")
-            name = segments[0]
-            config: dict[str, Any] = {}
-            for segment in segments[1:]:
-                if "=" in segment:
-                    key, value = segment.split("=", 1)
-                    config[key] = value
-            chain.add(name, config)
-        else:
-            chain.add(part)
+        part = part.strip()
+        if part:
+            _add_named(chain, part)
     return chain
 
 
@@ -96,17 +101,7 @@ def create_chain_from_list(items: list[str | dict]) -> ProcessorChain:
     chain = ProcessorChain()
     for item in items:
         if isinstance(item, str):
-            if ":" in item:
-                segments = item.split(":")
-                name = segments[0]
-                config: dict[str, Any] = {}
-                for segment in segments[1:]:
-                    if "=" in segment:
-                        k, v = segment.split("=", 1)
-                        config[k] = v
-                chain.add(name, config)
-            else:
-                chain.add(item)
+            _add_named(chain, item)
         elif isinstance(item, dict):
             chain.add_inline(
                 item.get("pattern", ""),